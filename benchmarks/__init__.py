@@ -0,0 +1,5 @@
+"""
+Headless performance benchmarks for FocusForge hot paths.
+
+Run with ``python -m benchmarks``; see benchmarks/harness.py.
+"""
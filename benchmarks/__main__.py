@@ -0,0 +1,90 @@
+# benchmarks/__main__.py
+
+"""Run the benchmark suite: ``python -m benchmarks [--filter NAME] [--save-baseline]``."""
+
+import argparse
+import importlib
+import os
+import sys
+
+from . import harness
+
+MODULES = [
+    "bench_trackers",
+    "bench_database",
+    "bench_reports",
+    "bench_skills",
+    "bench_board",
+    "bench_engine",
+]
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+DEFAULT_OUTPUT = os.path.join(HERE, "results", "latest.json")
+DEFAULT_BASELINE = os.path.join(HERE, "results", "baseline.json")
+
+
+def load_modules():
+    """Import benchmark modules, skipping those whose dependencies are missing."""
+    skipped = {}
+    for name in MODULES:
+        try:
+            importlib.import_module(f"{__package__}.{name}")
+        except ImportError as e:
+            skipped[name] = str(e)
+    return skipped
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="FocusForge headless benchmarks")
+    parser.add_argument("--filter", "-k", default="", help="only run benchmarks whose name contains this")
+    parser.add_argument("--rounds", type=int, help="override the number of timed rounds")
+    parser.add_argument("--output", default=DEFAULT_OUTPUT, help="where to write results JSON")
+    parser.add_argument("--baseline", default=DEFAULT_BASELINE, help="baseline results JSON to compare with")
+    parser.add_argument("--tolerance", type=float, default=0.25,
+                        help="allowed slowdown of the median before flagging a regression (0.25 = 25%%)")
+    parser.add_argument("--save-baseline", action="store_true", help="also store these results as the new baseline")
+    args = parser.parse_args(argv)
+
+    skipped = load_modules()
+    for name, reason in skipped.items():
+        print(f"⏭️  Skipping {name}: {reason}")
+
+    results = {}
+    for bench in harness.BENCHMARKS:
+        for case, param in bench.cases():
+            if args.filter not in case:
+                continue
+            try:
+                stats = bench.run(param, rounds=args.rounds)
+            except Exception as e:
+                print(f"❌ {case:<50} failed: {e}")
+                results[case] = {"error": str(e)}
+                continue
+            results[case] = stats
+            print(f"⏱️  {case:<50} {harness.format_duration(stats['median'])}  "
+                  f"({stats['ops_per_sec']:,.0f} ops/s)")
+
+    harness.save_results(args.output, results)
+    print(f"✅ Results written to {args.output}")
+
+    baseline = harness.load_results(args.baseline)
+    exit_code = 0
+    if baseline:
+        regressions = harness.compare(results, baseline, args.tolerance)
+        for case, ratio in regressions:
+            print(f"⚠️  Regression: {case} is {ratio:.2f}x slower than baseline")
+        if regressions:
+            exit_code = 1
+        else:
+            print("✅ No regressions against baseline")
+    else:
+        print(f"ℹ️  No baseline at {args.baseline}; run with --save-baseline to create one")
+
+    if args.save_baseline:
+        harness.save_results(args.baseline, results)
+        print(f"✅ Baseline updated at {args.baseline}")
+    return exit_code
+
+
+if __name__ == "__main__":
+    sys.exit(main())
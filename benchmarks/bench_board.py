@@ -0,0 +1,66 @@
+# benchmarks/bench_board.py
+
+import contextlib
+import sys
+
+from .harness import benchmark, workspace
+from PyQt5.QtWidgets import QApplication
+from core.utils.database import Database
+from core.utils.synthetic_data import SyntheticWorkload
+from gui.components.kantu_board import KantuBoard
+
+
+def board_state(cards, seed=7):
+    return SyntheticWorkload(seed=seed).board_state(cards)
+
+
+@contextlib.contextmanager
+def full_board():
+    """Keep every seeded Done card on the board, so [N] measures N cards, not the archive cap."""
+    keep = KantuBoard.DONE_ARCHIVE_KEEP
+    KantuBoard.DONE_ARCHIVE_KEEP = sys.maxsize
+    try:
+        yield
+    finally:
+        KantuBoard.DONE_ARCHIVE_KEEP = keep
+
+
+@benchmark("kantu_board.save_tasks", params=[1_000, 10_000], rounds=3)
+def save_tasks(cards):
+    app = QApplication.instance() or QApplication(sys.argv)
+    with workspace(), full_board():
+        db = Database("bench.db")
+        db.save_board_state(board_state(cards))
+        board = KantuBoard(db=db)
+        yield board.save_tasks
+        board.close()
+        db.close()
+
+
+@benchmark("kantu_board.open", params=[1_000, 10_000], rounds=3)
+def open_board(cards):
+    app = QApplication.instance() or QApplication(sys.argv)
+    with workspace(), full_board():
+        db = Database("bench.db")
+        db.save_board_state(board_state(cards))
+        boards = []
+        yield lambda: boards.append(KantuBoard(db=db))
+        for board in boards:
+            board.close()
+        db.close()
+
+
+@benchmark("kantu_board.move_card", params=[10_000], rounds=5, number=50)
+def move_card(cards):
+    app = QApplication.instance() or QApplication(sys.argv)
+    with workspace(), full_board():
+        db = Database("bench.db")
+        db.save_board_state(board_state(cards))
+        board = KantuBoard(db=db)
+
+        def move():
+            source, target = (board.backlog, board.now) if board.backlog.card_model.rowCount() else (board.now, board.backlog)
+            board.move_card(source, 0, target, 0)
+        yield move
+        board.close()
+        db.close()
@@ -0,0 +1,59 @@
+# benchmarks/bench_database.py
+
+from itertools import islice
+
+from .harness import benchmark, workspace
+from core.utils.database import Database
+from core.utils.synthetic_data import SyntheticWorkload, write_sessions
+
+
+def seeded_database(sessions, seed=7):
+    """Return a Database in the current directory holding *sessions* synthetic sessions."""
+    db = Database("bench.db")
+    # More days than needed; the generator is lazy and islice stops at *sessions*
+    workload = SyntheticWorkload(seed=seed, days=sessions)
+    write_sessions(db, islice(workload.sessions(), sessions))
+    return db
+
+
+@benchmark("database.get_session_stats", params=[100_000], rounds=10)
+def session_stats(sessions):
+    with workspace():
+        db = seeded_database(sessions)
+        yield db.get_session_stats
+        db.close()
+
+
+@benchmark("database.legacy_dashboard_queries", params=[100_000], rounds=10)
+def legacy_dashboard_queries(sessions):
+    """The three per-metric queries each dashboard widget used to run."""
+    with workspace():
+        db = seeded_database(sessions)
+
+        def run():
+            db.get_success_rate()
+            db.get_average_work_duration()
+            db.get_average_distractions()
+        yield run
+        db.close()
+
+
+@benchmark("database.get_sessions_page", params=[100_000], rounds=10, number=20)
+def sessions_page_deep(sessions):
+    """A page far into the history, sorted by a non-key column."""
+    with workspace():
+        db = seeded_database(sessions)
+        after = None
+        for _ in range(50):
+            page = db.get_sessions_page(limit=100, after=after, sort_column="work_duration_actual")
+            after = (page[-1][2], page[-1][0])
+        yield lambda: db.get_sessions_page(limit=100, after=after, sort_column="work_duration_actual")
+        db.close()
+
+
+@benchmark("database.get_work_history", params=[100_000], rounds=10, number=20)
+def work_history(sessions):
+    with workspace():
+        db = seeded_database(sessions)
+        yield lambda: db.get_work_history(limit=200)
+        db.close()
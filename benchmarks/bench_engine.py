@@ -0,0 +1,19 @@
+# benchmarks/bench_engine.py
+
+from types import SimpleNamespace
+
+from .harness import benchmark, workspace
+from .bench_database import seeded_database
+from core.engine.focus_env import FocusEnv
+
+
+@benchmark("focus_env.step", params=[1_000, 100_000], rounds=5, number=100)
+def env_step(sessions):
+    with workspace():
+        db = seeded_database(sessions)
+        # FocusEnv only reads and writes the two duration attributes
+        engine = SimpleNamespace(work_duration=25, break_duration=5)
+        env = FocusEnv(db, engine)
+        env.reset()
+        yield lambda: env.step(4)
+        db.close()
@@ -0,0 +1,44 @@
+# benchmarks/bench_reports.py
+
+from datetime import datetime
+
+from .harness import benchmark, workspace
+from .bench_trackers import seed_distraction_log
+from core.analytics.focus_report import FocusReport
+from core.analytics.rollups import RollupPipeline
+from core.utils.database import Database
+
+
+@benchmark("focus_report.generate_report", params=[10_000, 100_000], rounds=3)
+def generate_report(events):
+    with workspace():
+        seed_distraction_log(events)
+        report = FocusReport()
+        yield report.generate_report
+
+
+@benchmark("rollups.ingest", params=[100_000], rounds=3)
+def rollup_ingest(events):
+    """Full first-run ingest of a distraction log into the rollup tables."""
+    with workspace():
+        seed_distraction_log(events)
+
+        def run():
+            db = Database(":memory:")
+            RollupPipeline(db).ingest()
+            db.close()
+        yield run
+
+
+@benchmark("rollups.daily_history", params=[100_000], rounds=5, number=20)
+def rollup_daily_history(events):
+    """A 90-day view served from day buckets."""
+    with workspace():
+        seed_distraction_log(events)
+        db = Database("bench.db")
+        pipeline = RollupPipeline(db)
+        pipeline.ingest()
+        # Synthetic events start in January 2025
+        now = datetime(2025, 3, 31).timestamp()
+        yield lambda: pipeline.daily_history(days=90, now=now)
+        db.close()
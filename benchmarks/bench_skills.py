@@ -0,0 +1,11 @@
+# benchmarks/bench_skills.py
+
+from .harness import benchmark, workspace
+from meta_skills.levels.meta_skills import MetaSkillManager
+
+
+@benchmark("meta_skills.add_xp", rounds=5, number=200)
+def add_xp():
+    with workspace():
+        manager = MetaSkillManager("bench_skills.json")
+        yield lambda: manager.add_xp("Grit", 5)
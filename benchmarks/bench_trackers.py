@@ -0,0 +1,21 @@
+# benchmarks/bench_trackers.py
+
+from itertools import islice
+
+from .harness import benchmark, workspace
+from core.trackers.distraction_logger import DistractionLogger, LOG_FILE
+from core.utils.synthetic_data import SyntheticWorkload, write_distraction_log
+
+
+def seed_distraction_log(events, seed=7):
+    """Write *events* synthetic App Switch/Inactivity entries to the distraction log."""
+    workload = SyntheticWorkload(seed=seed, days=events)
+    write_distraction_log(LOG_FILE, islice(workload.events(include_polls=False), events))
+
+
+@benchmark("distraction_logger.log_event", params=[10_000, 100_000], rounds=5)
+def log_event(existing):
+    with workspace():
+        seed_distraction_log(existing)
+        logger = DistractionLogger()
+        yield lambda: logger.log_event("Distraction", {"window": "YouTube - Chrome"})
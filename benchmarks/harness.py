@@ -0,0 +1,152 @@
+# benchmarks/harness.py
+
+"""Minimal headless benchmark harness with JSON results and baseline comparison.
+
+Benchmarks are generator functions registered with ``@benchmark``. The code
+before ``yield`` is setup, the yielded callable is what gets timed, and the
+code after ``yield`` is teardown::
+
+    @benchmark("database.get_success_rate", params=[100_000])
+    def success_rate(sessions):
+        with workspace():
+            db = seeded_database(sessions)
+            yield db.get_success_rate
+            db.close()
+"""
+
+import contextlib
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime
+
+# Everything here runs without a display
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+os.environ.setdefault("MPLBACKEND", "Agg")
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, PROJECT_ROOT)
+
+BENCHMARKS = []
+
+
+class Benchmark:
+    def __init__(self, name, func, params, rounds, number):
+        self.name = name
+        self.func = func
+        self.params = params
+        self.rounds = rounds
+        self.number = number
+
+    def cases(self):
+        if not self.params:
+            return [(self.name, None)]
+        return [(f"{self.name}[{param}]", param) for param in self.params]
+
+    def run(self, param, rounds=None):
+        """Time one parameter value; returns per-call statistics in seconds."""
+        rounds = rounds or self.rounds
+        gen = self.func(param) if param is not None else self.func()
+        target = next(gen)
+        try:
+            target()  # warm-up
+            samples = []
+            for _ in range(rounds):
+                started = time.perf_counter()
+                for _ in range(self.number):
+                    target()
+                samples.append((time.perf_counter() - started) / self.number)
+        finally:
+            gen.close()
+        median = statistics.median(samples)
+        return {
+            "min": min(samples),
+            "median": median,
+            "mean": statistics.fmean(samples),
+            "stdev": statistics.stdev(samples) if len(samples) > 1 else 0.0,
+            "ops_per_sec": 1.0 / median if median > 0 else float("inf"),
+            "rounds": rounds,
+            "number": self.number,
+        }
+
+
+def benchmark(name, params=None, rounds=5, number=1):
+    """Register a generator benchmark under *name* (see module docstring)."""
+    def decorator(func):
+        BENCHMARKS.append(Benchmark(name, func, params, rounds, number))
+        return func
+    return decorator
+
+
+@contextlib.contextmanager
+def workspace():
+    """Run inside a throwaway directory, since trackers write to relative ``logs/`` paths."""
+    cwd = os.getcwd()
+    with tempfile.TemporaryDirectory(prefix="focusforge-bench-") as tmp:
+        os.chdir(tmp)
+        os.makedirs("logs", exist_ok=True)
+        try:
+            yield tmp
+        finally:
+            os.chdir(cwd)
+
+
+# ----------------------------------------------------------------------
+# Results
+# ----------------------------------------------------------------------
+
+def environment():
+    try:
+        commit = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], cwd=PROJECT_ROOT,
+            capture_output=True, text=True, check=False
+        ).stdout.strip() or None
+    except OSError:
+        commit = None
+    return {
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "machine": platform.machine(),
+        "commit": commit,
+        "timestamp": datetime.now().isoformat(),
+    }
+
+
+def save_results(path, results):
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    with open(path, "w") as f:
+        json.dump({"environment": environment(), "results": results}, f, indent=2, sort_keys=True)
+
+
+def load_results(path):
+    if not os.path.exists(path):
+        return None
+    with open(path, "r") as f:
+        return json.load(f)["results"]
+
+
+def compare(results, baseline, tolerance):
+    """Return ``[(name, ratio)]`` for cases whose median slowed by more than *tolerance*."""
+    regressions = []
+    for name, current in results.items():
+        previous = baseline.get(name)
+        if not previous or "median" not in current or not previous.get("median"):
+            continue
+        ratio = current["median"] / previous["median"]
+        if ratio > 1.0 + tolerance:
+            regressions.append((name, ratio))
+    return regressions
+
+
+def format_duration(seconds):
+    if seconds < 1e-3:
+        return f"{seconds * 1e6:8.1f} µs"
+    if seconds < 1:
+        return f"{seconds * 1e3:8.2f} ms"
+    return f"{seconds:8.3f} s "
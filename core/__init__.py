@@ -2,8 +2,16 @@
 Core functionality for FocusForge.
 """
 
-from .trackers.advanced_distraction import AdvancedDistractionDetector
 from .analytics.focus_report import FocusReport
 from .utils.database import Database
 
 __all__ = ['AdvancedDistractionDetector', 'FocusReport', 'Database']
+
+
+def __getattr__(name):
+    # The detector pulls in pynput and transformers; load it only when asked for,
+    # so a GUI attached to the tracker daemon never imports them
+    if name == 'AdvancedDistractionDetector':
+        from .trackers.advanced_distraction import AdvancedDistractionDetector
+        return AdvancedDistractionDetector
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,232 @@
+# event_archive.py
+
+"""Compact, memory-mapped archive for distraction events past raw retention.
+
+Events are stored as fixed-width binary records (28 bytes instead of ~150
+bytes of JSON), one segment file per month, sorted by timestamp. Strings
+(event types, window titles, extra details) live once per segment in a
+string table and records refer to them by id. ``index.json`` lists each
+segment's time span, so a range read opens only the overlapping segments,
+binary-searches the mmapped records and unpacks just that slice::
+
+    archive = EventArchive()
+    for event in archive.iter_range(since_ns, until_ns):
+        ...
+"""
+
+import contextlib
+import json
+import mmap
+import os
+import struct
+from datetime import datetime
+
+from ..trackers.events import Event, NS_PER_SECOND, event_type, type_name
+from ..utils.atomic_io import atomic_write_json, load_json
+
+ARCHIVE_DIR = "logs/archive"
+MAGIC = b"FFEV"
+VERSION = 1
+HEADER = struct.Struct("<4sH10x")  # magic, version, padding to 16 bytes
+# ts_ns, type id, window id, previous window id, duration, extra id (0 = None)
+RECORD = struct.Struct("<qIIIfI")
+TS = struct.Struct("<q")
+# Index entry recording the source log position archived so far (not a segment)
+SOURCE_KEY = "_source"
+
+
+def segment_name(ts_ns):
+    return datetime.fromtimestamp(ts_ns / NS_PER_SECOND).strftime("events-%Y-%m")
+
+
+class StringTable:
+    def __init__(self, strings=None):
+        self.strings = [None] + list(strings or [])
+        self.ids = {s: i for i, s in enumerate(self.strings) if i}
+
+    def id(self, value):
+        if value is None:
+            return 0
+        i = self.ids.get(value)
+        if i is None:
+            i = self.ids[value] = len(self.strings)
+            self.strings.append(value)
+        return i
+
+    def to_list(self):
+        return self.strings[1:]
+
+
+class Segment:
+    """One month of events: ``<name>.bin`` records plus ``<name>.strings.json``."""
+
+    def __init__(self, directory, name):
+        self.name = name
+        self.path = os.path.join(directory, name + ".bin")
+        self.strings_path = os.path.join(directory, name + ".strings.json")
+        self._strings = None
+        self._extras = {}
+
+    @property
+    def strings(self):
+        if self._strings is None:
+            self._strings = StringTable(load_json(self.strings_path, default=[]))
+        return self._strings
+
+    def count(self):
+        if not os.path.exists(self.path):
+            return 0
+        return (os.path.getsize(self.path) - HEADER.size) // RECORD.size
+
+    def ts_at(self, i):
+        with open(self.path, "rb") as f:
+            f.seek(HEADER.size + i * RECORD.size)
+            return TS.unpack(f.read(TS.size))[0]
+
+    def encode(self, event):
+        strings = self.strings
+        extra = json.dumps(event.extra, sort_keys=True) if event.extra else None
+        return RECORD.pack(
+            event.ts_ns, strings.id(type_name(event.type)), strings.id(event.window),
+            strings.id(event.previous_window), event.duration, strings.id(extra),
+        )
+
+    def decode(self, record):
+        ts_ns, type_id, window_id, previous_id, duration, extra_id = record
+        strings = self.strings.strings
+        extra = None
+        if extra_id:
+            extra = self._extras.get(extra_id)
+            if extra is None:
+                extra = self._extras[extra_id] = json.loads(strings[extra_id])
+        return Event(ts_ns, event_type(strings[type_id]), strings[window_id],
+                     strings[previous_id], duration, extra)
+
+    def save_strings(self):
+        atomic_write_json(self.strings_path, self.strings.to_list())
+
+    @contextlib.contextmanager
+    def records(self):
+        """Yield a memoryview over the records, mmapped read-only."""
+        with open(self.path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            magic, version = HEADER.unpack_from(mm)[:2]
+            if magic != MAGIC or version != VERSION:
+                raise ValueError(f"{self.path} is not a v{VERSION} event segment")
+            view = memoryview(mm)[HEADER.size:]
+            try:
+                yield view
+            finally:
+                view.release()
+
+    def bisect(self, view, ts_ns):
+        """Index of the first record with timestamp >= *ts_ns*."""
+        lo, hi = 0, len(view) // RECORD.size
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if TS.unpack_from(view, mid * RECORD.size)[0] < ts_ns:
+                lo = mid + 1
+            else:
+                hi = mid
+        return lo
+
+    def iter_range(self, since_ns=None, until_ns=None):
+        with self.records() as view:
+            start = self.bisect(view, since_ns) if since_ns is not None else 0
+            end = self.bisect(view, until_ns) if until_ns is not None else len(view) // RECORD.size
+            chunk = view[start * RECORD.size:end * RECORD.size]
+            records = RECORD.iter_unpack(chunk)
+            try:
+                for record in records:
+                    yield self.decode(record)
+            finally:
+                # Drop buffer exports before the mmap is closed
+                del records
+                chunk.release()
+
+
+class EventArchive:
+    def __init__(self, directory=ARCHIVE_DIR):
+        self.directory = directory
+        self.index_path = os.path.join(directory, "index.json")
+
+    def index(self):
+        """``{segment name: {"first_ns", "last_ns", "count"}}``"""
+        index = load_json(self.index_path, default={})
+        index.pop(SOURCE_KEY, None)
+        return index
+
+    def source(self):
+        """``{"inode", "offset"}``: how much of the source log the last writer archived, or None."""
+        return load_json(self.index_path, default={}).get(SOURCE_KEY)
+
+    def segment(self, name):
+        return Segment(self.directory, name)
+
+    # ------------------------------------------------------------------
+    # Writing
+    # ------------------------------------------------------------------
+    @contextlib.contextmanager
+    def writer(self, source=None):
+        """Yield an ``add(event)`` callable; events must arrive oldest first.
+
+        Every added event is stored, duplicates included: resuming is the caller's
+        job. A *source* dict (``{"inode", "offset"}`` of the log being archived,
+        updated by the caller as it goes) is saved in the same index write as the
+        events, so an interrupted move can tell exactly what was already archived.
+        """
+        os.makedirs(self.directory, exist_ok=True)
+        index = self.index()
+        open_segments = {}
+        files = {}
+
+        def add(event):
+            name = segment_name(event.ts_ns)
+            segment = open_segments.get(name)
+            if segment is None:
+                segment = open_segments[name] = self.segment(name)
+                count = segment.count()
+                if name not in index:
+                    # Rebuilt from the segment if the index write was lost
+                    index[name] = {
+                        "first_ns": segment.ts_at(0) if count else event.ts_ns,
+                        "last_ns": segment.ts_at(count - 1) if count else event.ts_ns,
+                        "count": count,
+                    }
+                new = not os.path.exists(segment.path)
+                files[name] = open(segment.path, "ab")
+                if new:
+                    files[name].write(HEADER.pack(MAGIC, VERSION))
+                else:
+                    # Cut off a record torn by a crash so appends stay aligned
+                    files[name].truncate(HEADER.size + count * RECORD.size)
+            entry = index[name]
+            files[name].write(segment.encode(event))
+            entry["last_ns"] = event.ts_ns
+            entry["count"] += 1
+
+        try:
+            yield add
+        finally:
+            for name, f in files.items():
+                # Strings first: a table with extra entries is harmless, a missing one is not
+                open_segments[name].save_strings()
+                f.flush()
+                os.fsync(f.fileno())
+                f.close()
+            if source is not None:
+                index[SOURCE_KEY] = dict(source)
+            atomic_write_json(self.index_path, index, indent=2, sort_keys=True)
+
+    # ------------------------------------------------------------------
+    # Reading
+    # ------------------------------------------------------------------
+    def iter_range(self, since_ns=None, until_ns=None):
+        """Yield archived Events in [since_ns, until_ns), oldest first."""
+        for name, entry in sorted(self.index().items(), key=lambda item: item[1]["first_ns"]):
+            if since_ns is not None and entry["last_ns"] < since_ns:
+                continue
+            if until_ns is not None and entry["first_ns"] >= until_ns:
+                continue
+            segment = self.segment(name)
+            if os.path.exists(segment.path):
+                yield from segment.iter_range(since_ns, until_ns)
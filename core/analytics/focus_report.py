@@ -1,82 +1,118 @@
 import json
 import os
+import time
 from datetime import datetime
-import pandas as pd
 import logging
 import csv
 from pathlib import Path
+from .event_archive import EventArchive
 from ..utils.database import Database
+from ..utils.atomic_io import atomic_write_json, atomic_writer
+from ..trackers.distraction_logger import LOG_FILE, iter_history
+from ..trackers.events import EventType, format_ns, to_ns
+from ..trackers.app_catalog import default_catalog
 
-LOG_FILE = "logs/distraction_log.json"
 REPORT_FILE = "logs/focus_report.json"
+# Marks a final report deferred at shutdown, to be written at the next startup
+PENDING_FILE = "logs/focus_report.pending"
 
 class FocusReport:
-    def __init__(self):
-        """Initialize by loading distraction logs."""
+    def __init__(self, log_file=LOG_FILE, since=None, until=None, archive=None):
+        """Initialize the report; the distraction history is streamed from disk on demand.
+
+        *since*/*until* (datetimes, timestamp strings or epoch ns) limit the report to a
+        time range; archived segments outside it are never opened.
+        """
         os.makedirs("logs", exist_ok=True)
         self.db = Database()
+        self.log_file = log_file
+        self.since = to_ns(since)
+        self.until = to_ns(until)
+        self.archive = archive or EventArchive(os.path.join(os.path.dirname(log_file), "archive"))
         self.report_data = {
             'sessions': [],
             'distractions': [],
             'tasks': []
         }
-        self.logs = self.load_logs()
+        self._scan_result = None
 
     def load_logs(self):
-        """Loads existing distraction logs from JSON file if available."""
-        if os.path.exists(LOG_FILE):
-            with open(LOG_FILE, "r") as f:
-                return json.load(f)
-        return []
+        """Lazily iterates the distraction history in range, oldest first: archive, then live log."""
+        yield from self.archive.iter_range(self.since, self.until)
+        # Skip the part of the log an interrupted archive run already moved
+        marker = self.archive.source()
+        start = 0
+        if marker and os.path.exists(self.log_file) and os.stat(self.log_file).st_ino == marker["inode"]:
+            start = marker["offset"]
+        yield from iter_history(self.log_file, self.since, self.until, start)
+
+    def _scan(self):
+        """One streaming pass over the history computing every aggregate the report needs."""
+        if self._scan_result is not None:
+            return self._scan_result
+        count = 0
+        first = last = None
+        summary = {"total_distractions": 0, "work_sessions": 0, "by_type": {}}
+        time_data = {"work_apps": {}, "distractions": {}}
+        catalog = default_catalog()
+        for event in self.load_logs():
+            count += 1
+            if first is None:
+                first = event.ts_ns
+            last = event.ts_ns
+
+            if event.type == EventType.WORK_APP_USAGE:
+                summary["work_sessions"] += 1
+            else:
+                name = event.type_name
+                summary["total_distractions"] += 1
+                summary["by_type"][name] = summary["by_type"].get(name, 0) + 1
+
+            if event.type == EventType.APP_SWITCH:
+                # The duration was spent in the window being left, not the new one
+                app_name = event.previous_window
+                if app_name is None:
+                    continue  # first switch of a run; nothing was timed yet
+
+                bucket = "work_apps" if catalog.is_work(app_name) else "distractions"
+                time_data[bucket][app_name] = time_data[bucket].get(app_name, 0) + event.duration
+
+        self._scan_result = {
+            "count": count, "first": first, "last": last,
+            "summary": summary, "time_data": time_data,
+        }
+        return self._scan_result
+
+    def event_count(self):
+        """Number of events in the distraction history."""
+        return self._scan()["count"]
 
     def generate_report(self):
         """Generates a structured focus report based on distraction logs."""
+        self._scan_result = None  # pick up events logged since the last report
+        scan = self._scan()
         report = {
-            "total_sessions": len(self.logs),
-            "start_time": self.logs[0]["timestamp"] if self.logs else "N/A",
-            "end_time": self.logs[-1]["timestamp"] if self.logs else "N/A",
+            "total_sessions": scan["count"],
+            "start_time": format_ns(scan["first"]) if scan["first"] is not None else "N/A",
+            "end_time": format_ns(scan["last"]) if scan["last"] is not None else "N/A",
             "distraction_summary": self.get_summary(),
             "time_distribution": self.get_time_analysis(),
             "recommendations": self.get_recommendations()
         }
 
         # Save report to file
-        with open(REPORT_FILE, "w") as f:
-            json.dump(report, f, indent=4)
+        atomic_write_json(REPORT_FILE, report, indent=4)
 
         print("✅ Focus Report Generated!")
         return report
 
     def get_summary(self):
         """Summarizes distraction logs by category."""
-        summary = {"total_distractions": 0, "work_sessions": 0, "by_type": {}}
-        for log in self.logs:
-            event_type = log["event_type"]
-            if event_type == "Work App Usage":
-                summary["work_sessions"] += 1
-            else:
-                summary["total_distractions"] += 1
-                summary["by_type"][event_type] = summary["by_type"].get(event_type, 0) + 1
-        return summary
+        return self._scan()["summary"]
 
     def get_time_analysis(self):
         """Analyzes time spent in work vs. distractions."""
-        time_data = {"work_apps": {}, "distractions": {}}
-        for log in self.logs:
-            if log["event_type"] == "App Switch":
-                details = log.get("details", {})
-                app_name = details.get("new_window")
-                duration = details.get("duration_in_previous_window", 0)
-
-                if app_name is None:
-                    logging.warning("Missing 'new_window' in log details.")
-                    continue
-
-                if any(work_app in app_name for work_app in ["ChatGPT", "Cursor", "VS Code"]):
-                    time_data["work_apps"][app_name] = time_data["work_apps"].get(app_name, 0) + duration
-                else:
-                    time_data["distractions"][app_name] = time_data["distractions"].get(app_name, 0) + duration
-        return time_data
+        return self._scan()["time_data"]
 
     def get_recommendations(self):
         """AI-driven suggestions based on focus trends."""
@@ -94,12 +130,37 @@ class FocusReport:
         return recommendations
 
     def export_csv(self):
-        """Exports log data to a CSV file for further analysis."""
-        df = pd.DataFrame(self.logs)
+        """Exports log data to a CSV file for further analysis, streaming row by row."""
         csv_file = "logs/focus_report.csv"
-        df.to_csv(csv_file, index=False)
+        with atomic_writer(csv_file, newline="") as f:
+            writer = csv.writer(f)
+            writer.writerow(["timestamp", "event_type", "details"])
+            for event in self.load_logs():
+                writer.writerow([event.timestamp, event.type_name, json.dumps(event.details)])
         print(f"✅ Report exported to {csv_file}")
 
+
+def write_final_report(defer=False, log_file=LOG_FILE):
+    """Writes the end-of-run report and CSV, or with *defer* only marks them due at next startup."""
+    if defer:
+        with atomic_writer(PENDING_FILE) as f:
+            f.write(str(time.time()))
+        print("🕒 Focus report deferred to next startup")
+        return None
+    report = FocusReport(log_file)
+    result = report.generate_report()
+    report.export_csv()
+    if os.path.exists(PENDING_FILE):
+        os.remove(PENDING_FILE)
+    return result
+
+
+def generate_pending_report(log_file=LOG_FILE):
+    """Writes a report deferred by the previous run, if any."""
+    if not os.path.exists(PENDING_FILE):
+        return None
+    return write_final_report(log_file=log_file)
+
 # Example Usage:
 if __name__ == "__main__":
     report = FocusReport()
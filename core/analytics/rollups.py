@@ -0,0 +1,242 @@
+# rollups.py
+
+"""Compact raw distraction events into minute/hour/day rollups with retention.
+
+``RollupPipeline.run()`` incrementally reads the JSONL distraction log from
+a stored byte offset, adds per-type event counts and inactivity time to the
+``event_rollups``/``dwell_rollups`` tables, then ages data out:
+
+* raw events older than ``raw_days`` move from the log to the binary archive,
+* minute buckets after ``minute_days``, hour buckets after ``hour_days``,
+* day buckets are kept forever.
+
+Long-range views ("last 90 days") read day buckets instead of raw events::
+
+    python -m core.analytics.rollups --db focus_forge.db
+"""
+
+import argparse
+import json
+import os
+import time
+from collections import defaultdict
+
+from .event_archive import EventArchive
+from ..trackers.app_catalog import default_catalog
+from ..trackers.distraction_logger import LOG_FILE
+from ..trackers.dwell import bucket_start
+from ..trackers.events import Event, EventType, NS_PER_SECOND
+from ..utils.atomic_io import atomic_writer
+from ..utils.database import Database
+
+GRANULARITIES = ("minute", "hour", "day")
+DAY = 24 * 60 * 60
+IDLE = "idle"
+IDLE_APP = "Inactive"
+
+
+class RollupPipeline:
+    def __init__(self, db, log_file=LOG_FILE, poll_interval=5, raw_days=30,
+                 minute_days=7, hour_days=180, backfill_dwell=False, archive=None, clock=time.time):
+        """
+        Args:
+            poll_interval (int): Seconds of idle time each Inactivity event stands for.
+            backfill_dwell (bool): Also derive per-app dwell from App Switch events. Only
+                for logs recorded without the live dwell accumulator, or time is counted twice.
+            archive (EventArchive): Where raw events go when they age out of the log;
+                defaults to an ``archive/`` directory next to it.
+        """
+        self.db = db
+        self.log_file = log_file
+        self.poll_interval = poll_interval
+        self.raw_days = raw_days
+        self.minute_days = minute_days
+        self.hour_days = hour_days
+        self.backfill_dwell = backfill_dwell
+        self.clock = clock
+        self.archive = archive or EventArchive(os.path.join(os.path.dirname(log_file), "archive"))
+        self.catalog = default_catalog()
+        self._buckets = {}
+
+    def run(self):
+        started = time.perf_counter()
+        ingested = self.ingest()
+        pruned = self.apply_retention()
+        result = dict(pruned, ingested=ingested, seconds=round(time.perf_counter() - started, 3))
+        print(f"✅ Rollups updated: {result}")
+        return result
+
+    # ------------------------------------------------------------------
+    # Ingest
+    # ------------------------------------------------------------------
+    def _bucket_starts(self, ts):
+        """(minute, hour, day) bucket starts for epoch seconds *ts*, memoized per minute."""
+        key = int(ts) // 60
+        starts = self._buckets.get(key)
+        if starts is None:
+            if len(self._buckets) > 100_000:
+                self._buckets.clear()
+            starts = self._buckets[key] = tuple(bucket_start(ts, g) for g in GRANULARITIES)
+        return starts
+
+    def ingest(self):
+        """Roll up events appended since the last run; returns how many were added."""
+        if not os.path.exists(self.log_file):
+            return 0
+        stat = os.stat(self.log_file)
+        state = self.db.get_rollup_state("events", {"offset": 0, "inode": stat.st_ino, "watermark_ns": 0})
+        offset = state["offset"]
+        resumed = state["inode"] == stat.st_ino and offset <= stat.st_size
+        if not resumed:
+            offset = 0  # the log was rewritten elsewhere; fall back to the timestamp watermark
+        watermark = state["watermark_ns"]
+
+        counts = defaultdict(int)
+        dwell = defaultdict(float)
+        ingested = 0
+        with open(self.log_file, "rb") as f:
+            f.seek(offset)
+            for line in f:
+                if not line.endswith(b"\n"):
+                    break  # partially written; pick it up next run
+                offset += len(line)
+                try:
+                    event = Event.from_record(json.loads(line))
+                except (ValueError, KeyError):
+                    continue
+                if not resumed and event.ts_ns <= watermark:
+                    continue
+                watermark = max(watermark, event.ts_ns)
+                ingested += 1
+                self._add(event, counts, dwell)
+
+        self.db.add_event_counts([key + (n,) for key, n in counts.items()], commit=False)
+        self.db.add_dwell([key + (seconds,) for key, seconds in dwell.items()], commit=False)
+        self.db.set_rollup_state("events", {"offset": offset, "inode": stat.st_ino, "watermark_ns": watermark},
+                                 commit=False)
+        self.db.conn.commit()
+        return ingested
+
+    def _add(self, event, counts, dwell):
+        ts = event.ts_ns / NS_PER_SECOND
+        starts = self._bucket_starts(ts)
+        for granularity, start in zip(GRANULARITIES, starts):
+            counts[(granularity, start, event.type_name)] += 1
+        if event.type == EventType.INACTIVITY:
+            for granularity, start in zip(GRANULARITIES, starts):
+                dwell[(granularity, start, IDLE_APP, IDLE)] += self.poll_interval
+        elif self.backfill_dwell and event.type == EventType.APP_SWITCH and event.previous_window:
+            # Charged to the bucket the switch happened in
+            app = self.catalog.app_name(event.previous_window)
+            category = self.catalog.category(event.previous_window)
+            for granularity, start in zip(GRANULARITIES, starts):
+                dwell[(granularity, start, app, category)] += event.duration
+
+    # ------------------------------------------------------------------
+    # Retention
+    # ------------------------------------------------------------------
+    def apply_retention(self):
+        now = self.clock()
+        return {
+            "raw_events": self.prune_raw_events(now - self.raw_days * DAY),
+            "minute_buckets": self.db.prune_rollups("minute", bucket_start(now - self.minute_days * DAY, "minute")),
+            "hour_buckets": self.db.prune_rollups("hour", bucket_start(now - self.hour_days * DAY, "hour")),
+        }
+
+    def prune_raw_events(self, before):
+        """Move already rolled-up raw events older than *before* (epoch seconds) to the archive.
+
+        Rewrites the log, so run it while the tracker is not appending (e.g. at startup).
+        Only a prefix of the log is moved. The archive records the log's inode
+        and how many bytes of it it holds, so a run interrupted between the
+        archive write and the log replace skips those bytes instead of archiving
+        them twice.
+        """
+        if not os.path.exists(self.log_file):
+            return 0
+        state = self.db.get_rollup_state("events")
+        if not state:
+            return 0
+        inode = os.stat(self.log_file).st_ino
+        marker = self.archive.source()
+        archived = marker["offset"] if marker and marker["inode"] == inode else 0
+        cutoff = min(int(before * NS_PER_SECOND), state["watermark_ns"] + 1)
+        with open(self.log_file, "rb") as f:
+            first = self._event(f.readline())
+        if not archived and (first is None or first.ts_ns >= cutoff):
+            return 0  # nothing old enough; skip the rewrite
+
+        dropped = 0
+        offset = 0
+        position = 0
+        source = {"inode": inode, "offset": archived}
+        moving = True
+        with open(self.log_file, "rb") as src, atomic_writer(self.log_file, "wb") as dst, \
+                self.archive.writer(source) as archive:
+            for line in src:
+                position += len(line)
+                if position <= archived:
+                    dropped += 1  # archived by an interrupted earlier run
+                    continue
+                event = self._event(line) if line.endswith(b"\n") else None
+                ts = event.ts_ns if event is not None else None
+                moving = moving and ts is not None and ts < cutoff
+                if moving:
+                    archive(event)
+                    source["offset"] = position
+                    dropped += 1
+                    continue
+                dst.write(line)
+                if ts is not None and ts <= state["watermark_ns"]:
+                    offset = dst.tell()
+        state.update(offset=offset, inode=os.stat(self.log_file).st_ino)
+        self.db.set_rollup_state("events", state)
+        return dropped
+
+    @staticmethod
+    def _event(line):
+        try:
+            return Event.from_record(json.loads(line))
+        except (ValueError, KeyError):
+            return None
+
+    # ------------------------------------------------------------------
+    # Queries
+    # ------------------------------------------------------------------
+    def daily_history(self, days=90, now=None):
+        """Per-day event counts and dwell seconds by category for the last *days* days."""
+        since = bucket_start((now or self.clock()) - (days - 1) * DAY, "day")
+        history = defaultdict(lambda: {"counts": {}, "dwell": defaultdict(float)})
+        for start, event_type, count in self.db.get_event_counts("day", since):
+            history[start]["counts"][event_type] = count
+        for start, _, category, seconds in self.db.get_dwell("day", since):
+            history[start]["dwell"][category] += seconds
+        return [
+            {"day": start, "counts": day["counts"], "dwell": dict(day["dwell"])}
+            for start, day in sorted(history.items())
+        ]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Roll up FocusForge distraction events")
+    parser.add_argument("--db", default="focus_forge.db")
+    parser.add_argument("--log", default=LOG_FILE)
+    parser.add_argument("--raw-days", type=int, default=30, help="keep raw events this many days")
+    parser.add_argument("--minute-days", type=int, default=7)
+    parser.add_argument("--hour-days", type=int, default=180)
+    parser.add_argument("--backfill-dwell", action="store_true",
+                        help="derive per-app dwell from App Switch events (logs without live dwell tracking)")
+    args = parser.parse_args(argv)
+
+    db = Database(args.db)
+    try:
+        RollupPipeline(
+            db, log_file=args.log, raw_days=args.raw_days, minute_days=args.minute_days,
+            hour_days=args.hour_days, backfill_dwell=args.backfill_dwell,
+        ).run()
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,200 @@
+# continual.py
+
+"""Continual learning from logged sessions instead of retraining from scratch.
+
+At every session boundary DecisionEngine appends ``(state, action, reward)``
+to the ``replay_buffer`` table. A ``ContinualLearner`` running in a
+low-priority worker process periodically takes the transitions it has not
+seen yet, applies a small incremental update to the latest policy version
+and publishes the result as a new, numbered file:
+
+    models/policies/bandit-v0007.npz
+    models/policies/bandit.json        # manifest: current version and file
+
+A DecisionEngine given the ``PolicyStore`` checks the manifest at each
+session boundary and hot-swaps in a newer version without a restart.
+Older versions are kept (up to ``keep``) so a bad update can be rolled back
+by pointing the manifest at an earlier file.
+"""
+
+import multiprocessing
+import os
+import time
+
+from ..utils.atomic_io import atomic_write_json, load_json
+from ..utils.database import Database
+from .bandit import BANDIT_FILE, ContextualBandit
+from .policies import PPO_MODEL_PATH, EngineState, PPOPolicy, RulePolicy
+
+POLICY_DIR = "models/policies"
+SUFFIXES = {"bandit": ".npz", "ppo": ".zip"}
+
+
+class PolicyStore:
+    def __init__(self, directory=POLICY_DIR, keep=5):
+        self.directory = directory
+        self.keep = keep
+
+    def manifest_path(self, engine):
+        return os.path.join(self.directory, engine + ".json")
+
+    def current(self, engine):
+        """``{"engine", "version", "file", "trained_through", "created"}`` or None."""
+        return load_json(self.manifest_path(engine))
+
+    def load(self, manifest):
+        path = os.path.join(self.directory, manifest["file"])
+        if manifest["engine"] == "bandit":
+            return ContextualBandit.load(path)
+        if manifest["engine"] == "ppo":
+            return PPOPolicy.load(path)
+        raise ValueError(f"No continual learning for engine {manifest['engine']!r}")
+
+    def publish(self, engine, save, trained_through):
+        """Write a new version with *save(path)* and point the manifest at it."""
+        os.makedirs(self.directory, exist_ok=True)
+        previous = self.current(engine)
+        version = previous["version"] + 1 if previous else 1
+        filename = f"{engine}-v{version:04d}{SUFFIXES[engine]}"
+        save(os.path.join(self.directory, filename))
+        manifest = {
+            "engine": engine,
+            "version": version,
+            "file": filename,
+            "trained_through": trained_through,
+            "created": time.time(),
+        }
+        atomic_write_json(self.manifest_path(engine), manifest, indent=2)
+        self._prune(engine, version)
+        return manifest
+
+    def versions(self, engine):
+        """Published version numbers still on disk, oldest first."""
+        prefix, suffix = engine + "-v", SUFFIXES[engine]
+        return sorted(
+            int(name[len(prefix):-len(suffix)])
+            for name in os.listdir(self.directory)
+            if name.startswith(prefix) and name.endswith(suffix) and name[len(prefix):-len(suffix)].isdigit()
+        ) if os.path.isdir(self.directory) else []
+
+    def _prune(self, engine, version):
+        for old in self.versions(engine):
+            if old <= version - self.keep:
+                os.remove(os.path.join(self.directory, f"{engine}-v{old:04d}{SUFFIXES[engine]}"))
+
+
+class ContinualLearner:
+    def __init__(self, db, engine="bandit", store=None, min_new=1, ppo_steps=2048, keep_transitions=10_000,
+                 bandit_path=BANDIT_FILE):
+        """
+        Args:
+            min_new (int): New transitions needed before publishing a new version.
+            ppo_steps (int): Environment steps per incremental PPO update.
+            bandit_path (str): Online bandit the first published version starts from.
+        """
+        if engine not in SUFFIXES:
+            raise ValueError(f"No continual learning for engine {engine!r}")
+        self.db = db
+        self.engine = engine
+        self.store = store or PolicyStore()
+        self.min_new = min_new
+        self.ppo_steps = ppo_steps
+        self.keep_transitions = keep_transitions
+        self.bandit_path = bandit_path
+
+    def step(self):
+        """Update on unseen transitions; returns the new manifest, or None if there was too little data."""
+        manifest = self.store.current(self.engine)
+        seen = manifest["trained_through"] if manifest else 0
+        transitions = self.db.get_transitions(after_id=seen)
+        if len(transitions) < self.min_new:
+            return None
+        started = time.perf_counter()
+        update = self._update_bandit if self.engine == "bandit" else self._update_ppo
+        manifest = self.store.publish(self.engine, update(manifest, transitions), transitions[-1][0])
+        self.db.prune_transitions(self.keep_transitions)
+        print(f"✅ Published {self.engine} policy v{manifest['version']} "
+              f"({len(transitions)} new sessions, {time.perf_counter() - started:.2f}s)")
+        return manifest
+
+    def _update_bandit(self, manifest, transitions):
+        if manifest:
+            bandit = self.store.load(manifest)
+        else:
+            # The first version continues the bandit the engine has been updating
+            # online, minus the rows that bandit has already learned from
+            bandit = ContextualBandit.load(self.bandit_path)
+            transitions = [t for t in transitions if not (t[6] and t[2] == "bandit")]
+        for _, _, _, state, action, reward, _ in transitions:
+            bandit.update(EngineState(**state), action, reward)
+        return bandit.save
+
+    def _update_ppo(self, manifest, transitions):
+        # PPO is on-policy: the logged sessions shape FocusEnv's rewards, and a few
+        # thousand steps continue the current model instead of training a new one
+        from stable_baselines3 import PPO
+        from .decision_engine import DecisionEngine
+
+        engine = DecisionEngine(self.db, _NoDistractions(), policy=RulePolicy())
+        if manifest:
+            model = PPO.load(os.path.join(self.store.directory, manifest["file"]), env=engine.env)
+        elif os.path.exists(PPO_MODEL_PATH + ".zip"):
+            model = PPO.load(PPO_MODEL_PATH, env=engine.env)
+        else:
+            model = PPO("MlpPolicy", engine.env, verbose=0)
+        model.learn(total_timesteps=self.ppo_steps, reset_num_timesteps=False)
+        return model.save
+
+
+class _NoDistractions:
+    def reset_distractions(self):
+        return 0
+
+
+# ----------------------------------------------------------------------
+# Worker process
+# ----------------------------------------------------------------------
+
+def run_learner(db_name, engine, interval, stop_event, directory=POLICY_DIR, niceness=10):
+    """Process entry point: learn every *interval* seconds until *stop_event* is set."""
+    if niceness and hasattr(os, "nice"):
+        os.nice(niceness)  # never compete with the GUI or the tracker for CPU
+    db = Database(db_name)
+    learner = ContinualLearner(db, engine, PolicyStore(directory))
+    try:
+        while True:
+            try:
+                learner.step()
+            except Exception as e:
+                print(f"⚠️ Continual learning step failed: {e}")
+            if stop_event.wait(interval):
+                break
+    finally:
+        db.close()
+
+
+class LearnerProcess:
+    """Handle for the learner worker; ``request_stop``/``wait`` fit the ShutdownCoordinator."""
+
+    def __init__(self, db_name="focus_forge.db", engine="bandit", interval=300.0, directory=POLICY_DIR):
+        self._stop = multiprocessing.Event()
+        self.process = multiprocessing.Process(
+            target=run_learner, args=(db_name, engine, interval, self._stop, directory),
+            name=f"{engine}-learner", daemon=True,
+        )
+
+    def start(self):
+        self.process.start()
+        return self
+
+    def request_stop(self):
+        self._stop.set()
+
+    def wait(self, timeout=5.0):
+        self.process.join(timeout)
+        if self.process.is_alive():
+            # Mid-update; the published versions on disk are always complete
+            self.process.terminate()
+            self.process.join(1.0)  # reap it
+            return False
+        return True
@@ -1,72 +1,153 @@
 # decision_engine.py
 
-from stable_baselines3 import PPO
-from .focus_env import FocusEnv
-import os
-from gym import Wrapper
 import logging
-import numpy as np
+import threading
+from datetime import datetime
+
+from ..utils import metrics
+from .policies import EngineState, PPOPolicy, PPO_MODEL_PATH, RulePolicy, load_policy
+from .rules import adjust_durations, session_reward
 
 class DecisionEngine:
-    def __init__(self, db, distraction_detector):
+    def __init__(self, db, distraction_detector, policy=None, policy_store=None):
+        """
+        Args:
+            policy: A DurationPolicy, or "rules", "bandit" or "ppo". Defaults to
+                $FOCUSFORGE_ENGINE, else PPO when a trained model exists, else the bandit.
+            policy_store: A continual.PolicyStore. When set, learning is left to the
+                background learner and newer published versions are swapped in live.
+        """
         self.db = db
         self.distraction_detector = distraction_detector
         # Default Pomodoro settings
         self.work_duration = 25  # minutes
         self.break_duration = 5  # minutes
 
-        # Initialize RL environment with both db and decision_engine
-        self.env = FocusEnv(db, self)
+        # apply_rules runs on a worker thread while Settings may swap the policy
+        self._lock = threading.RLock()
+        self.policy = policy if hasattr(policy, "select") else load_policy(policy)
+        # (session id, state, action) awaiting the outcome of the next session
+        self._pending = None
+        self._env = None
+        self.policy_store = policy_store
+        self.policy_version = None
+
+    @property
+    def env(self):
+        """RL environment for PPO training; gymnasium is only imported when needed."""
+        if self._env is None:
+            from .focus_env import FocusEnv
+            self._env = FocusEnv(self.db, self)
+        return self._env
 
-        # Load trained PPO model if available
-        self.model = None
-        model_path = "ppo_focus_forge"
-        if os.path.exists(model_path + ".zip"):
+    @property
+    def model(self):
+        """The PPO model when the PPO policy is active, else None."""
+        return getattr(self.policy, "model", None)
+
+    @model.setter
+    def model(self, model):
+        with self._lock:
+            self.policy = PPOPolicy(model) if model is not None else RulePolicy()
+            self._pending = None
+
+    def set_policy(self, name):
+        """Switch engines ("rules", "bandit" or "ppo") without restarting."""
+        policy = load_policy(name)  # may load a model; keep it outside the lock
+        with self._lock:
+            self.policy = policy
+            self.policy_version = None
+            self._pending = None
+            self.refresh_policy()
+
+    def refresh_policy(self):
+        """Swap in the newest published version of the current engine; True if it changed."""
+        if self.policy_store is None:
+            return False
+        with self._lock:
+            manifest = self.policy_store.current(self.policy.name)
+            if not manifest or manifest["version"] == self.policy_version:
+                return False
             try:
-                self.model = PPO.load(model_path)
-                print("PPO model loaded successfully.")
+                self.policy = self.policy_store.load(manifest)
             except Exception as e:
-                print(f"Failed to load PPO model: {e}")
-                self.model = None
-        else:
-            print("PPO model not found. Proceeding with rule-based adjustments.")
+                print(f"⚠️ Could not load {manifest['file']}: {e}")
+                return False
+            self.policy_version = manifest["version"]
+        print(f"🔄 Switched to {manifest['engine']} policy v{manifest['version']}")
+        return True
+
+    def current_state(self, db=None, distractions=0):
+        db = db or self.db
+        return EngineState(
+            success_rate=db.get_success_rate(),
+            consecutive_failures=db.get_consecutive_failures(),
+            work=db.get_average_work_duration() or 25,
+            brk=db.get_average_distractions() or 5,
+            distractions=distractions,
+            hour=datetime.now().hour,
+        )
 
     def get_optimal_durations(self):
-        state = self.env.reset()
-        action, _states = self.model.predict(state, deterministic=True)
-        return action
+        state = self.current_state()
+        with self._lock:
+            return self.policy.select(state)
 
-    def apply_rules(self):
+    @metrics.timed("engine.apply_rules")
+    def apply_rules(self, db=None):
         """
         Adjusts work and break durations based on focus performance and distractions.
+
+        Pass *db* to run the queries on another connection, e.g. from a worker thread.
         """
-        success_rate = self.db.get_success_rate()
-        consecutive_failures = self.db.get_consecutive_failures()
-        current_work_duration = self.db.get_average_work_duration() or 25
-        current_break_duration = self.db.get_average_distractions() or 5
+        db = db or self.db
 
         # Check for distractions
         detected_distractions = self.distraction_detector.reset_distractions()
-        distraction_penalty = min(10, detected_distractions * 2)  # Reduce work time if distractions occur
+        state = self.current_state(db, detected_distractions)
+        latest = db.get_recent_sessions(limit=1)
 
-        # Convert observation into a NumPy array for RL model
-        obs = np.array([[success_rate, consecutive_failures, current_work_duration, current_break_duration]], dtype=np.float32)
-        
-        # Ensure the model receives the correct input format
-        action, _states = self.model.predict(obs, deterministic=True)
+        with self._lock:
+            self.learn_from_last_session(db)
+            self.refresh_policy()
+            with metrics.timer("engine.inference"):
+                action = self.policy.select(state)
+            self._pending = (latest[0][0] if latest else 0, state, action)
 
-        # Decode action into work/break duration changes
-        work_change = (action // 3 - 1) * 5  # -5, 0, +5
-        break_change = (action % 3 - 1) * 5  # -5, 0, +5
-
-        # Adjust work duration based on distractions
-        new_work = np.clip(current_work_duration + work_change - distraction_penalty, 15, 60)
-        new_break = np.clip(current_break_duration + break_change + (detected_distractions * 1), 5, 30)
+        # Decode the action into -5/0/+5 minute changes, shorten work and lengthen
+        # the break for distractions, and clip both to their allowed ranges
+        new_work, new_break = adjust_durations(state.work, state.brk, action, detected_distractions)
+        new_work, new_break = new_work.item(), new_break.item()
 
         print(f"Adjusted Work Time: {new_work} min, Adjusted Break Time: {new_break} min")
         return new_work, new_break
 
-    def save_model(self, path="ppo_focus_forge"):
+    def learn_from_last_session(self, db=None):
+        """Record the outcome of the session after the previous decision and learn from it.
+
+        Every transition goes to the replay buffer; the policy itself is only
+        updated here when no background learner owns it (no *policy_store*).
+        """
+        db = db or self.db
+        with self._lock:
+            if self._pending is None:
+                return
+            decided_after, state, action = self._pending
+            latest = db.get_recent_sessions(limit=1)
+            if not latest or latest[0][0] <= decided_after:
+                return  # no session finished since that decision
+            session = latest[0]
+            reward = session_reward(session[6] == 1, session[7])
+            online = self.policy_store is None
+            db.add_transition(session[0], self.policy.name, state._asdict(), action, reward, learned=online)
+            self._pending = None
+            if not online:
+                return  # the background learner owns updates
+            with metrics.timer("engine.policy_update"):
+                self.policy.update(state, action, reward)
+            self.policy.save()
+
+    def save_model(self, path=PPO_MODEL_PATH):
         if self.model:
             self.model.save(path)
             print("PPO model saved successfully.")
@@ -76,15 +157,7 @@ class DecisionEngine:
     def train_model(self, total_timesteps=10000):
         if not self.model:
             # Initialize a new model
+            from stable_baselines3 import PPO
             self.model = PPO("MlpPolicy", self.env, verbose=1)
         self.model.learn(total_timesteps=total_timesteps)
         self.save_model()
-
-class ObservationOnlyWrapper(Wrapper):
-    def reset(self, **kwargs):
-        observation, info = self.env.reset(**kwargs)
-        return observation  # Return only the observation
-
-    def step(self, action):
-        observation, reward, done, truncated, info = self.env.step(action)
-        return observation, reward, done, truncated, info
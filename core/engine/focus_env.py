@@ -4,6 +4,8 @@ import gymnasium as gym
 from gymnasium import spaces
 import numpy as np
 
+from .rules import adjust_durations, session_reward
+
 class FocusEnv(gym.Env):
     """
     Custom Environment for Focus Forge AI Agent.
@@ -50,13 +52,8 @@ class FocusEnv(gym.Env):
         # Validate action
         assert self.action_space.contains(action), f"Invalid action: {action}"
 
-        # Decode action
-        work_change = (action // 3 - 1) * 5  # -5, 0, +5
-        break_change = (action % 3 - 1) * 5  # -5, 0, +5
-
-        # Apply action adjustments
-        new_work = np.clip(self.state[2] + work_change, 15, 60)
-        new_break = np.clip(self.state[3] + break_change, 5, 30)
+        # Decode action into -5/0/+5 minute changes and apply them (no distraction penalty here)
+        new_work, new_break = adjust_durations(self.state[2], self.state[3], action)
 
         # Update Decision Engine settings
         self.decision_engine.work_duration = new_work
@@ -64,16 +61,7 @@ class FocusEnv(gym.Env):
 
         # Calculate reward based on recent sessions
         recent_sessions = self.db.get_recent_sessions(limit=10)
-        reward = 0
-        for session in recent_sessions:
-            if session[6] == 1 and session[7] <= 3:  # completed without excessive distractions
-                reward += 1
-            elif session[6] == 1 and session[7] > 3:
-                reward -= 2  # Completed but with distractions
-            elif session[6] == 0 and session[7] > 3:
-                reward -= 5  # Abandoned with excessive distractions
-            else:
-                reward -= 1  # Other failures
+        reward = sum(session_reward(session[6] == 1, session[7]) for session in recent_sessions)
 
         # Bonus for streaks
         streak = self.db.get_streak()
@@ -99,3 +87,13 @@ class FocusEnv(gym.Env):
 
     def close(self):
         pass
+
+
+class ObservationOnlyWrapper(gym.Wrapper):
+    def reset(self, **kwargs):
+        observation, info = self.env.reset(**kwargs)
+        return observation  # Return only the observation
+
+    def step(self, action):
+        observation, reward, done, truncated, info = self.env.step(action)
+        return observation, reward, done, truncated, info
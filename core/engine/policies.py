@@ -0,0 +1,110 @@
+# policies.py
+
+"""Pluggable duration policies for DecisionEngine.
+
+A policy picks one of the 9 actions of ``rules.decode_action`` for an
+``EngineState`` and may learn from the reward of each finished session:
+
+* ``RulePolicy``   - never changes durations; only the distraction rules apply,
+* ``PPOPolicy``    - a trained Stable-Baselines3 PPO model (``train_rl.py``),
+* ``ContextualBandit`` (``bandit.py``) - pure NumPy, learns online.
+
+``load_policy`` resolves a name (or ``$FOCUSFORGE_ENGINE``) to a policy and
+only imports stable-baselines3 when PPO is actually requested.
+"""
+
+import math
+import os
+from typing import NamedTuple
+
+import numpy as np
+
+from .rules import HOLD, observation
+
+PPO_MODEL_PATH = "ppo_focus_forge"
+ENGINES = ("rules", "bandit", "ppo")
+
+
+class EngineState(NamedTuple):
+    success_rate: float
+    consecutive_failures: bool
+    work: float
+    brk: float
+    distractions: int = 0  # detected since the last adjustment
+    hour: int = 12         # local hour of day
+
+    def observation(self):
+        """The 4-value PPO/FocusEnv observation as a (1, 4) float32 array."""
+        return observation(self.success_rate, self.consecutive_failures, self.work, self.brk)
+
+    def context(self):
+        """Bandit features: bias, success, failures, time of day on a circle, distractions."""
+        angle = 2 * math.pi * self.hour / 24
+        return np.array([
+            1.0,
+            self.success_rate / 100,
+            float(self.consecutive_failures),
+            math.sin(angle),
+            math.cos(angle),
+            math.log1p(self.distractions) / 3,
+        ])
+
+
+class DurationPolicy:
+    name = "rules"
+
+    def select(self, state):
+        """Return an action 0-8 for *state*."""
+        raise NotImplementedError
+
+    def update(self, state, action, reward):
+        """Learn from the *reward* of the session that followed choosing *action* in *state*."""
+
+    def save(self):
+        pass
+
+
+class RulePolicy(DurationPolicy):
+    name = "rules"
+
+    def select(self, state):
+        return HOLD
+
+
+class PPOPolicy(DurationPolicy):
+    name = "ppo"
+
+    def __init__(self, model):
+        self.model = model
+
+    @classmethod
+    def load(cls, path=PPO_MODEL_PATH):
+        from stable_baselines3 import PPO  # heavy (torch); only when PPO is selected
+        return cls(PPO.load(path))
+
+    def select(self, state):
+        action, _states = self.model.predict(state.observation(), deterministic=True)
+        return int(np.asarray(action).reshape(-1)[0])
+
+
+def load_policy(name=None, ppo_path=PPO_MODEL_PATH):
+    """Build the policy called *name*; by default PPO if a trained model exists, else the bandit."""
+    from .bandit import ContextualBandit
+
+    name = name or os.environ.get("FOCUSFORGE_ENGINE") or None
+    if name not in (None,) + ENGINES:
+        raise ValueError(f"Unknown engine {name!r}; expected one of {', '.join(ENGINES)}")
+    if name == "rules":
+        return RulePolicy()
+    if name in (None, "ppo"):
+        if os.path.exists(ppo_path + ".zip"):
+            try:
+                policy = PPOPolicy.load(ppo_path)
+                print("PPO model loaded successfully.")
+                return policy
+            except Exception as e:
+                print(f"Failed to load PPO model: {e}")
+        else:
+            print("PPO model not found.")
+        print("Proceeding with the contextual bandit.")
+    return ContextualBandit.load()
@@ -0,0 +1,59 @@
+# rules.py
+
+"""Duration adjustment rules shared by DecisionEngine, FocusEnv and the simulator.
+
+Pure NumPy, so callers can apply them to one session or to thousands of
+simulated ones at once. Each of the 9 discrete actions changes work and break
+duration by -5, 0 or +5 minutes; distractions detected since the last
+adjustment shorten work and lengthen the break, and both are clipped to
+their allowed ranges.
+"""
+
+from typing import NamedTuple
+
+import numpy as np
+
+N_ACTIONS = 9
+HOLD = 4  # no change to either duration
+
+
+class Rules(NamedTuple):
+    step: float = 5
+    penalty_per_distraction: float = 2
+    max_penalty: float = 10
+    break_per_distraction: float = 1
+    work_range: tuple = (15, 60)
+    break_range: tuple = (5, 30)
+
+
+DEFAULT_RULES = Rules()
+
+
+def decode_action(action, step=DEFAULT_RULES.step):
+    """(work_change, break_change) in minutes for an action or array of actions."""
+    action = np.asarray(action)
+    return (action // 3 - 1) * step, (action % 3 - 1) * step
+
+
+def adjust_durations(work, brk, action, distractions=0, rules=DEFAULT_RULES):
+    """New (work, break) minutes after *action* and the distraction penalty."""
+    work_change, break_change = decode_action(action, rules.step)
+    distractions = np.asarray(distractions)
+    penalty = np.minimum(rules.max_penalty, distractions * rules.penalty_per_distraction)
+    new_work = np.clip(work + work_change - penalty, *rules.work_range)
+    new_break = np.clip(brk + break_change + distractions * rules.break_per_distraction, *rules.break_range)
+    return new_work, new_break
+
+
+def session_reward(completed, distractions):
+    """Score one finished session, as FocusEnv does for each of its recent sessions."""
+    if completed:
+        return 1 if distractions <= 3 else -2   # completed, or completed but distracted
+    return -5 if distractions > 3 else -1      # abandoned while distracted, or other failures
+
+
+def observation(success_rate, consecutive_failures, work, brk):
+    """Policy input rows ``[success_rate, consecutive_failures, work, break]`` as float32."""
+    return np.column_stack(np.broadcast_arrays(
+        success_rate, np.asarray(consecutive_failures, dtype=np.float32), work, brk,
+    )).astype(np.float32)
@@ -0,0 +1,281 @@
+# simulator.py
+
+"""Offline what-if evaluation of duration policies against session history.
+
+An ``OutcomeModel`` is fitted to the ``sessions`` table: per-minute
+distraction rates are resampled from history, and completion odds come from
+a logistic regression on planned duration and distraction count. The
+simulator then replays ``DecisionEngine.apply_rules`` for thousands of
+independent days at once, one NumPy step per session:
+
+1. build the observation the engine would see (success rate, consecutive
+   failures, average completed work, average distractions - the engine's
+   current inputs, quirks included),
+2. ask the candidate policy for one of the 9 actions,
+3. apply ``rules.adjust_durations`` with the previous session's distractions,
+4. sample the session's outcome and fold it into the running averages.
+
+Policies are vectorized callables ``policy(obs) -> actions`` over an
+``(n, 4)`` float32 array, so a PPO model's ``predict`` works as is::
+
+    python -m core.engine.simulator --days 5000 --policy hold --policy adaptive --ppo ppo_focus_forge
+"""
+
+import argparse
+import os
+import tempfile
+import time
+from typing import NamedTuple
+
+import numpy as np
+
+from ..utils.database import Database
+from .rules import DEFAULT_RULES, HOLD, N_ACTIONS, Rules, adjust_durations, observation
+
+MIN_SESSIONS = 10
+
+
+class History(NamedTuple):
+    planned: np.ndarray
+    actual: np.ndarray
+    completed: np.ndarray
+    distractions: np.ndarray
+
+
+def load_history(db):
+    """All logged sessions, oldest first, as NumPy columns."""
+    rows = db.conn.execute('''
+        SELECT work_duration_planned, work_duration_actual, completed, distraction_events
+        FROM sessions ORDER BY id
+    ''').fetchall()
+    columns = np.array(rows, dtype=np.float64).reshape(-1, 4)
+    return History(columns[:, 0], columns[:, 1], columns[:, 2].astype(bool), columns[:, 3])
+
+
+# ----------------------------------------------------------------------
+# Outcome model
+# ----------------------------------------------------------------------
+
+def _features(planned, distractions):
+    planned = np.asarray(planned, dtype=np.float64)
+    distractions = np.asarray(distractions, dtype=np.float64)
+    return np.stack(np.broadcast_arrays(1.0, (planned - 30) / 15, np.log1p(distractions)), axis=-1)
+
+
+class OutcomeModel:
+    def __init__(self, coef, rates, partial):
+        """
+        Args:
+            coef: Logistic regression weights for ``[1, (planned - 30) / 15, log1p(distractions)]``.
+            rates: Historical distractions per planned minute, resampled per simulated session.
+            partial: Historical actual/planned ratios of abandoned sessions.
+        """
+        self.coef = np.asarray(coef, dtype=np.float64)
+        self.rates = np.asarray(rates, dtype=np.float64)
+        self.partial = np.asarray(partial, dtype=np.float64)
+
+    @classmethod
+    def fit(cls, history, ridge=1e-2, iterations=25):
+        if len(history.planned) < MIN_SESSIONS:
+            raise ValueError(f"Need at least {MIN_SESSIONS} logged sessions to fit outcomes, "
+                             f"found {len(history.planned)}")
+        x = _features(history.planned, history.distractions)
+        y = history.completed.astype(np.float64)
+        penalty = np.diag([0.0] + [ridge] * (x.shape[1] - 1)) * len(y)
+        coef = np.zeros(x.shape[1])
+        # Newton-Raphson (IRLS); the ridge term keeps it finite when outcomes are separable
+        for _ in range(iterations):
+            p = 1 / (1 + np.exp(-x @ coef))
+            gradient = x.T @ (y - p) - penalty @ coef
+            hessian = (x * (p * (1 - p))[:, None]).T @ x + penalty + 1e-9 * np.eye(x.shape[1])
+            delta = np.linalg.solve(hessian, gradient)
+            coef += delta
+            if np.abs(delta).max() < 1e-8:
+                break
+
+        rates = history.distractions / np.maximum(history.planned, 1)
+        abandoned = ~history.completed & (history.planned > 0)
+        partial = np.clip(history.actual[abandoned] / history.planned[abandoned], 0, 1)
+        return cls(coef, rates, partial if len(partial) else [0.5])
+
+    def completion_probability(self, planned, distractions):
+        return 1 / (1 + np.exp(-_features(planned, distractions) @ self.coef))
+
+    def sample(self, rng, planned):
+        """Simulated (completed, actual minutes, distractions) for sessions of *planned* minutes."""
+        n = len(planned)
+        rates = self.rates[rng.integers(len(self.rates), size=n)]
+        distractions = rng.poisson(rates * planned)
+        completed = rng.random(n) < self.completion_probability(planned, distractions)
+        ratio = self.partial[rng.integers(len(self.partial), size=n)]
+        actual = np.where(completed, planned, planned * ratio)
+        return completed, actual, distractions
+
+
+# ----------------------------------------------------------------------
+# Policies
+# ----------------------------------------------------------------------
+
+def hold_policy(obs):
+    """Never change durations: only the distraction rules apply."""
+    return np.full(len(obs), HOLD)
+
+
+def constant_policy(action):
+    def policy(obs):
+        return np.full(len(obs), action)
+    return policy
+
+
+def adaptive_policy(low=50.0, high=80.0):
+    """Shorten work while the success rate is below *low*, lengthen it above *high*."""
+    def policy(obs):
+        success = obs[:, 0]
+        return np.where(success < low, 1, np.where(success > high, 7, HOLD))
+    return policy
+
+
+def model_policy(model):
+    """Wrap anything with a Stable-Baselines3 style ``predict(obs, deterministic)``."""
+    def policy(obs):
+        action, _ = model.predict(obs, deterministic=True)
+        return np.asarray(action).reshape(len(obs))
+    return policy
+
+
+def load_ppo_policy(path="ppo_focus_forge"):
+    from stable_baselines3 import PPO  # only needed to evaluate a trained model
+    return model_policy(PPO.load(path))
+
+
+POLICIES = {
+    "hold": hold_policy,
+    "adaptive": adaptive_policy(),
+    **{f"action{a}": constant_policy(a) for a in range(N_ACTIONS)},
+}
+
+
+# ----------------------------------------------------------------------
+# Simulation
+# ----------------------------------------------------------------------
+
+def simulate(policy, history, days=1000, sessions_per_day=6, rules=DEFAULT_RULES, model=None, seed=0):
+    """Replay *days* independent days of *sessions_per_day* sessions starting from *history*.
+
+    Returns predicted completion rate, durations and focus time; the same
+    *seed* gives every policy the same random draws.
+    """
+    model = model or OutcomeModel.fit(history)
+    rng = np.random.default_rng(seed)
+
+    # Running aggregates behind the engine's observation, seeded from history
+    total = np.full(days, float(len(history.planned)))
+    completed_n = np.full(days, float(history.completed.sum()))
+    completed_work = np.full(days, float(history.actual[history.completed].sum()))
+    distraction_sum = np.full(days, float(history.distractions.sum()))
+    recent = np.tile(history.completed[-3:].astype(float), (days, 1))
+    detected = np.zeros(days)
+
+    done = np.zeros(days)
+    focus = np.zeros(days)
+    planned_sum = np.zeros(days)
+    break_sum = np.zeros(days)
+    distracted = np.zeros(days)
+    for _ in range(sessions_per_day):
+        success = 100 * completed_n / np.maximum(total, 1)
+        failures = (recent.shape[1] == 3) & (recent == 0).all(axis=1)
+        # Database averages are rounded to 2 places; apply_rules falls back to 25/5 on 0
+        avg_work = np.round(completed_work / np.maximum(completed_n, 1), 2)
+        avg_distractions = np.round(distraction_sum / np.maximum(total, 1), 2)
+        current_work = np.where(avg_work > 0, avg_work, 25)
+        current_break = np.where(avg_distractions > 0, avg_distractions, 5)
+
+        actions = np.asarray(policy(observation(success, failures, current_work, current_break))).reshape(days)
+        work, brk = adjust_durations(current_work, current_break, actions, detected, rules)
+        completed, actual, distractions = model.sample(rng, work)
+
+        total += 1
+        completed_n += completed
+        completed_work += np.where(completed, actual, 0)
+        distraction_sum += distractions
+        recent = np.column_stack([recent, completed])[:, -3:]
+        detected = distractions
+
+        done += completed
+        focus += actual
+        planned_sum += work
+        break_sum += brk
+        distracted += distractions
+
+    sessions = days * sessions_per_day
+    per_day = 100 * done / sessions_per_day
+    return {
+        "days": days,
+        "sessions": sessions,
+        "completion_rate": round(100 * done.sum() / sessions, 2),
+        "completion_rate_p5": round(float(np.percentile(per_day, 5)), 2),
+        "completion_rate_p95": round(float(np.percentile(per_day, 95)), 2),
+        "avg_work_minutes": round(planned_sum.sum() / sessions, 2),
+        "avg_break_minutes": round(break_sum.sum() / sessions, 2),
+        "focus_minutes_per_day": round(float(focus.mean()), 2),
+        "distractions_per_session": round(distracted.sum() / sessions, 2),
+    }
+
+
+def compare(policies, history, **kwargs):
+    """``simulate`` each of ``{name: policy}`` with one fitted model and shared random draws."""
+    kwargs.setdefault("model", OutcomeModel.fit(history))
+    results = []
+    for name, policy in policies.items():
+        started = time.perf_counter()
+        result = simulate(policy, history, **kwargs)
+        results.append(dict(result, policy=name, seconds=round(time.perf_counter() - started, 3)))
+    return results
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Evaluate FocusForge duration policies on past sessions")
+    parser.add_argument("--db", default="focus_forge.db")
+    parser.add_argument("--synthetic-days", type=int, default=0,
+                        help="use this many days of seeded synthetic sessions instead of --db")
+    parser.add_argument("--days", type=int, default=1000, help="simulated days per policy")
+    parser.add_argument("--sessions-per-day", type=int, default=6)
+    parser.add_argument("--policy", action="append", choices=sorted(POLICIES),
+                        help="built-in policy to evaluate (repeatable; default: hold and adaptive)")
+    parser.add_argument("--ppo", help="also evaluate a saved PPO model (path without .zip)")
+    parser.add_argument("--penalty", type=float, default=DEFAULT_RULES.penalty_per_distraction,
+                        help="work minutes removed per detected distraction")
+    parser.add_argument("--max-penalty", type=float, default=DEFAULT_RULES.max_penalty)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args(argv)
+
+    if args.synthetic_days:
+        from ..utils.synthetic_data import SyntheticWorkload, write_sessions
+        db = Database(os.path.join(tempfile.mkdtemp(prefix="focusforge-sim-"), "synthetic.db"))
+        write_sessions(db, SyntheticWorkload(seed=args.seed, days=args.synthetic_days).sessions())
+    else:
+        db = Database(args.db)
+    try:
+        history = load_history(db)
+    finally:
+        db.close()
+
+    policies = {name: POLICIES[name] for name in args.policy or ["hold", "adaptive"]}
+    if args.ppo:
+        policies["ppo"] = load_ppo_policy(args.ppo)
+    rules = Rules(penalty_per_distraction=args.penalty, max_penalty=args.max_penalty)
+    results = compare(policies, history, days=args.days, sessions_per_day=args.sessions_per_day,
+                      rules=rules, seed=args.seed)
+
+    print(f"{'policy':<10} {'complete %':>10} {'p5-p95 %':>13} {'work min':>9} {'break min':>10} "
+          f"{'focus/day':>10} {'distr.':>7}")
+    for r in results:
+        print(f"{r['policy']:<10} {r['completion_rate']:>10.2f} "
+              f"{r['completion_rate_p5']:>6.1f}-{r['completion_rate_p95']:<6.1f} "
+              f"{r['avg_work_minutes']:>9.2f} {r['avg_break_minutes']:>10.2f} "
+              f"{r['focus_minutes_per_day']:>10.1f} {r['distractions_per_session']:>7.2f}")
+    return results
+
+
+if __name__ == "__main__":
+    main()
@@ -1,14 +1,30 @@
 # train_rl.py
 
+import argparse
+import os
+import tempfile
+
 import gymnasium as gym
 from stable_baselines3 import PPO
 from stable_baselines3.common.env_checker import check_env
 from core.engine.focus_env import FocusEnv
 from core.utils.database import Database
 from core.engine.decision_engine import DecisionEngine
+from core.utils.synthetic_data import SyntheticWorkload, write_sessions
 
 def main():
-    db = Database()
+    parser = argparse.ArgumentParser(description="Train the FocusForge PPO policy")
+    parser.add_argument("--synthetic-days", type=int, default=0,
+                        help="train on this many days of seeded synthetic sessions instead of focus_forge.db")
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    if args.synthetic_days:
+        db = Database(os.path.join(tempfile.mkdtemp(prefix="focusforge-rl-"), "synthetic.db"))
+        count = write_sessions(db, SyntheticWorkload(seed=args.seed, days=args.synthetic_days).sessions())
+        print(f"Seeded {count} synthetic sessions.")
+    else:
+        db = Database()
     # Placeholder distraction detector that satisfies DecisionEngine API during offline training.
     class _StubDistractionDetector:
         def reset_distractions(self):
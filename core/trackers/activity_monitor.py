@@ -38,7 +38,7 @@ class ActivityMonitor:
                 self.distraction_events += 1
                 print("Inactivity detected as distraction!")
                 self.last_activity = current_time  # Reset to prevent multiple counts
-            time.sleep(1)
+            self.stop_event.wait(1)
 
     def get_distractions(self):
         return self.distraction_events
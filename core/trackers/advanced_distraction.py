@@ -3,23 +3,25 @@ import json
 from datetime import datetime
 from pathlib import Path
 from ..utils.database import Database
-from .activity_monitor import ActivityMonitor
+from ..utils import metrics
 from .distraction_logger import DistractionLogger
+from .events import EventType, intern_title
+from .app_catalog import default_catalog
+from .dwell import DwellAccumulator
+from .runtime import TrackerRuntime
+from . import events
 from pynput import keyboard, mouse
 from transformers import pipeline
-from threading import Thread, Event
 import pygetwindow as gw
 
 class AdvancedDistractionDetector:
     def __init__(self):
         self.db = Database()
-        self.activity_monitor = ActivityMonitor()
-        self.distraction_logger = DistractionLogger()
         self.is_monitoring = False
         self.last_activity_time = time.time()
         self.inactivity_threshold = 300
         self.check_interval = 5
-        self.work_apps = ["ChatGPT", "Cursor", "VS Code", "PyCharm"]
+        self.app_catalog = default_catalog()
 
         # AI-based distraction detection model
         self.classifier = pipeline("text-classification", model="facebook/bart-large-mnli")
@@ -29,11 +31,18 @@ class AdvancedDistractionDetector:
         self.last_active_window = None
         self.last_switch_time = time.time()
 
-        # Threading for background monitoring
-        self.stop_event = Event()
+        # Live time-per-app, flushed to the dwell_rollups table
+        self.dwell = DwellAccumulator(self.app_catalog)
+        self.dwell_flush_interval = 60
+
+        # Background monitoring runs as asyncio tasks on a TrackerRuntime
+        self.runtime = None
         self.monitoring = False
+        self.listeners = []  # callback(name, value) for "event", "inactive" and "classified"
+        self.logger.listeners.append(lambda event: self.notify("event", event))
 
         # Start keyboard & mouse tracking
+        # (callbacks only store a float, which is atomic; everything else reads it)
         self.keyboard_listener = keyboard.Listener(on_press=self.on_activity)
         self.mouse_listener = mouse.Listener(on_move=self.on_activity, on_click=self.on_activity)
         self.keyboard_listener.start()
@@ -52,55 +61,117 @@ class AdvancedDistractionDetector:
     def get_active_window(self):
         """ Returns the title of the currently active window. """
         active_window = gw.getActiveWindow()
-        return active_window.title if active_window else "Unknown"
+        # Interned, so the same title polled every few seconds is stored once
+        return intern_title(active_window.title) if active_window else "Unknown"
 
+    @metrics.timed("tracker.detect_off_task_window")
     def detect_off_task_window(self):
         """ Detects if the active window is non-work related and logs it. """
         active_window = self.get_active_window()
 
         if active_window and active_window != self.last_active_window:
             switch_duration = time.time() - self.last_switch_time
-            self.logger.log_event("App Switch", {
-                "previous_window": self.last_active_window,
-                "new_window": active_window,
-                "duration_in_previous_window": round(switch_duration, 2)
-            })
+            self.logger.log(events.Event.now(
+                EventType.APP_SWITCH,
+                window=active_window,
+                previous_window=self.last_active_window,
+                duration=round(switch_duration, 2),
+            ))
             self.last_switch_time = time.time()
             self.last_active_window = active_window
+            metrics.inc("tracker.app_switches")
+
+        self.track_dwell(active_window)
 
-        if active_window and any(app in active_window for app in self.work_apps):
-            self.logger.log_event("Work App Usage", {"window": active_window})
+        if active_window and self.app_catalog.is_work(active_window):
+            self.logger.log(events.Event.now(EventType.WORK_APP_USAGE, window=active_window))
         else:
-            self.logger.log_event("Distraction", {"window": active_window})
+            self.logger.log(events.Event.now(EventType.DISTRACTION, window=active_window))
+
+    def track_dwell(self, active_window):
+        """ Charges elapsed time to the window it was spent in; idle time is not charged. """
+        window = None if self.is_inactive() else active_window
+        if window != self.dwell.window:
+            self.dwell.switch(window)
+        else:
+            self.dwell.tick()
+
+    def flush_dwell(self, db=None):
+        """ Writes accumulated dwell buckets to the database. """
+        rows = self.dwell.drain()
+        if rows:
+            (db or self.db).add_dwell(rows)
+
+    def focus_seconds_today(self):
+        """ Work seconds today: flushed buckets plus time not yet flushed. O(1). """
+        return self.db.focus_seconds_today() + self.dwell.pending_seconds()
 
     def detect_distraction_in_text(self, text):
-        """ Uses AI to classify whether text is work-related or a distraction. """
+        """ Uses AI to classify whether text is work-related or a distraction, and logs the result. """
+        if self.runtime is not None:
+            # Logged on the runtime's io worker, in order with the tracker's other events
+            return self.runtime.classify(text).result()
+        category = self.categorize_text(text)
+        self.log_classification(text, category)
+        return category
+
+    def categorize_text(self, text):
+        """ Runs the classifier on *text* and returns its category without logging it. """
         labels = ["Productive Work", "Distraction (Social Media, Entertainment)"]
         result = self.classifier(text, candidate_labels=labels)
-        category = result["labels"][0]
-        self.logger.log_event("Text Classification", {"text": text, "category": category})
-        return category
+        return result["labels"][0]
+
+    def log_classification(self, text, category):
+        """ Logs a classification result. """
+        self.logger.log(events.Event.now(EventType.TEXT_CLASSIFICATION, extra={"text": text, "category": category}))
+
+    def classify_async(self, text):
+        """ Queues text for classification off the caller's thread; returns a Future of the category. """
+        if self.runtime is None:
+            raise RuntimeError("Monitoring is not running")
+        return self.runtime.classify(text)
+
+    def add_listener(self, callback):
+        """ Registers callback(name, value), called from tracker threads on each update. """
+        self.listeners.append(callback)
+
+    def notify(self, name, value):
+        for listener in self.listeners:
+            listener(name, value)
+
+    def poll(self):
+        """ One monitoring step: logs inactivity, then checks the active window. """
+        if self.is_inactive():
+            metrics.inc("tracker.inactivity_polls")
+            self.logger.log(events.Event.now(EventType.INACTIVITY, extra={"message": "User inactive for too long!"}))
+
+        self.detect_off_task_window()
 
     def start_monitoring(self):
-        """ Starts background distraction monitoring. """
+        """ Starts background distraction monitoring (no-op if already running). """
+        if self.runtime is not None:
+            return
+        self.runtime = TrackerRuntime(self).start()
         self.monitoring = True
-        self.thread = Thread(target=self.monitor, daemon=True)
-        self.thread.start()
-
-    def stop_monitoring(self):
-        """ Stops background monitoring. """
-        self.monitoring = False
-        self.stop_event.set()
-        self.thread.join()
 
-    def monitor(self):
-        """ Periodically checks for distractions and logs them. """
-        while not self.stop_event.is_set():
-            if self.is_inactive():
-                self.logger.log_event("Inactivity", {"message": "User inactive for too long!"})
+    def stop_monitoring(self, timeout=5.0):
+        """ Stops background monitoring, waiting at most *timeout* seconds. Returns True if it stopped. """
+        self.request_stop()
+        return self.wait_stopped(timeout)
 
-            self.detect_off_task_window()
-            time.sleep(self.check_interval)
+    def request_stop(self):
+        """ Signals monitoring to stop without waiting (see wait_stopped). """
+        self.monitoring = False
+        if self.runtime is not None:
+            self.runtime.request_stop()
+
+    def wait_stopped(self, timeout=5.0):
+        """ Waits up to *timeout* seconds for monitoring to wind down. Returns True if it did. """
+        if self.runtime is None:
+            return True
+        stopped = self.runtime.wait(timeout)
+        self.runtime = None
+        return stopped
 
     def get_distraction_count(self):
         """ Return the number of distractions. """
@@ -0,0 +1,78 @@
+# app_catalog.py
+
+"""Window-title classification shared by the tracker and the reports.
+
+App names come from ``config/app_catalog.json``. Each category is compiled
+into one regex that matches names case-sensitively, like the substring checks
+it replaced, and results are memoized per title, so the title polled every few
+seconds is matched once rather than on every poll.
+"""
+
+import json
+import os
+import re
+from functools import lru_cache
+
+CATALOG_FILE = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))),
+    "config", "app_catalog.json",
+)
+
+WORK = "work"
+DISTRACTION = "distraction"
+OTHER = "other"
+
+
+def _compile(names):
+    if not names:
+        return None
+    # Longest first so "Visual Studio Code" wins over a shorter overlapping name
+    pattern = "|".join(re.escape(name) for name in sorted(names, key=len, reverse=True))
+    return re.compile(pattern)
+
+
+class AppCatalog:
+    def __init__(self, work_apps=(), distraction_apps=(), cache_size=4096):
+        self.work_apps = list(work_apps)
+        self.distraction_apps = list(distraction_apps)
+        self._work = _compile(self.work_apps)
+        self._distraction = _compile(self.distraction_apps)
+        self.category = lru_cache(maxsize=cache_size)(self._category)
+        self.app_name = lru_cache(maxsize=cache_size)(self._app_name)
+
+    @classmethod
+    def load(cls, path=CATALOG_FILE):
+        with open(path, "r") as f:
+            catalog = json.load(f)
+        return cls(catalog.get(WORK, []), catalog.get(DISTRACTION, []))
+
+    def _category(self, title):
+        """Return WORK, DISTRACTION or OTHER for a window *title*; work apps take precedence."""
+        if not title:
+            return OTHER
+        if self._work is not None and self._work.search(title):
+            return WORK
+        if self._distraction is not None and self._distraction.search(title):
+            return DISTRACTION
+        return OTHER
+
+    def is_work(self, title):
+        return self.category(title) == WORK
+
+    def _app_name(self, title):
+        """The catalog name a title matches, or the title itself if it matches none."""
+        for regex in (self._work, self._distraction):
+            match = regex.search(title) if regex is not None and title else None
+            if match:
+                return match.group(0)
+        return title
+
+
+@lru_cache(maxsize=None)
+def default_catalog():
+    """The catalog from config/app_catalog.json, loaded once per process."""
+    return AppCatalog.load()
+
+
+def classify(title):
+    return default_catalog().category(title)
@@ -0,0 +1,417 @@
+# daemon.py
+
+"""Standalone tracker process that the GUI attaches to over local IPC.
+
+The daemon owns the input listeners, the window poller and the text
+classifier, so inference and mouse callbacks never compete with Qt painting
+for the GIL. It listens on a Unix socket (a named pipe on Windows) using
+``multiprocessing.connection`` with a per-user auth key:
+
+* ``rpc`` connections send ``(call_id, method, args)`` and get
+  ``(call_id, "ok", value)`` or ``(call_id, "error", message)`` back,
+* ``events`` connections receive every logged event as ``("event", record)``,
+  each through its own bounded queue so a stuck GUI never stalls logging.
+
+Tracking keeps running while GUIs attach and detach::
+
+    python -m core.trackers.daemon            # headless tracking
+    python -m core.trackers.daemon --status
+    python -m core.trackers.daemon --stop
+    python main.py --attach                   # GUI on top of the daemon (spawned if needed)
+"""
+
+import argparse
+import os
+import queue
+import secrets
+import signal
+import subprocess
+import sys
+import threading
+import time
+from multiprocessing.connection import AuthenticationError, Client, Listener
+
+from ..utils.database import Database
+from .distraction_logger import LOG_FILE, iter_history
+from .events import Event
+
+if sys.platform == "win32":
+    DEFAULT_ADDRESS = r"\\.\pipe\focusforge-tracker"
+else:
+    DEFAULT_ADDRESS = "logs/tracker.sock"
+AUTHKEY_FILE = "logs/tracker.key"
+# Events buffered per GUI before a subscriber that stopped reading is dropped
+SUBSCRIBER_BACKLOG = 1000
+
+
+def load_authkey(path=AUTHKEY_FILE, create=False):
+    """Read the shared auth key, creating it (readable by the owner only) if asked."""
+    if create and not os.path.exists(path):
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o600)
+        with os.fdopen(fd, "w") as f:
+            f.write(secrets.token_hex(32))
+    with open(path, "r") as f:
+        return f.read().strip().encode()
+
+
+def connect(address=DEFAULT_ADDRESS, authkey_file=AUTHKEY_FILE, role="rpc"):
+    conn = Client(address, authkey=load_authkey(authkey_file))
+    conn.send(role)
+    return conn
+
+
+def is_running(address=DEFAULT_ADDRESS, authkey_file=AUTHKEY_FILE):
+    try:
+        conn = connect(address, authkey_file, role="ping")
+    except (OSError, EOFError, AuthenticationError):
+        return False
+    conn.close()
+    return True
+
+
+# ----------------------------------------------------------------------
+# Daemon
+# ----------------------------------------------------------------------
+
+class TrackerDaemon:
+    def __init__(self, detector=None, address=DEFAULT_ADDRESS, authkey_file=AUTHKEY_FILE, run_rollups=True):
+        """
+        Args:
+            detector: An ``AdvancedDistractionDetector``; created in ``serve()`` when omitted,
+                since loading the classifier takes a while.
+            run_rollups (bool): Compact the distraction log before tracking starts, which
+                the GUI cannot do while the daemon is appending to it.
+        """
+        self.detector = detector
+        self.address = address
+        self.authkey_file = authkey_file
+        self.run_rollups = run_rollups
+        self.started = None
+        self._stop = threading.Event()
+        self._subscribers = []
+        self._lock = threading.Lock()
+
+    def handlers(self):
+        detector = self.detector
+        return {
+            "get_summary": detector.logger.get_summary,
+            "clear_logs": detector.logger.clear,
+            "reset_distractions": detector.reset_distractions,
+            "get_distraction_count": detector.get_distraction_count,
+            "focus_seconds_today": detector.focus_seconds_today,
+            "detect_distraction_in_text": detector.detect_distraction_in_text,
+            "status": self.status,
+            "shutdown": self.stop,
+        }
+
+    def status(self):
+        return {
+            "pid": os.getpid(),
+            "started": self.started,
+            "monitoring": bool(getattr(self.detector, "monitoring", False)),
+            "subscribers": len(self._subscribers),
+        }
+
+    def serve(self):
+        """Track and serve clients until ``stop()``, SIGINT or SIGTERM."""
+        if is_running(self.address, self.authkey_file):
+            raise RuntimeError(f"A tracker daemon is already listening on {self.address}")
+        if sys.platform != "win32" and os.path.exists(self.address):
+            os.unlink(self.address)  # left behind by a daemon that crashed
+
+        if self.detector is None:
+            from .advanced_distraction import AdvancedDistractionDetector
+            self.detector = AdvancedDistractionDetector()
+        if self.run_rollups:
+            from ..analytics.rollups import RollupPipeline
+            RollupPipeline(self.detector.db).run()
+
+        if threading.current_thread() is threading.main_thread():
+            signal.signal(signal.SIGTERM, signal.default_int_handler)
+
+        handlers = self.handlers()
+        listener = Listener(self.address, authkey=load_authkey(self.authkey_file, create=True))
+        self.detector.logger.listeners.append(self.publish)
+        self.detector.start_monitoring()
+        self.started = time.time()
+        print(f"🛰️ Tracker daemon listening on {self.address}")
+        try:
+            while not self._stop.is_set():
+                try:
+                    conn = listener.accept()
+                except (OSError, EOFError, AuthenticationError):
+                    continue  # wake-up from stop() or a client without the key
+                threading.Thread(target=self._handle, args=(conn, handlers), daemon=True).start()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            self.detector.logger.listeners.remove(self.publish)
+            self.detector.stop_monitoring()
+            with self._lock:
+                for subscriber in self._subscribers:
+                    subscriber.close()
+                self._subscribers.clear()
+            listener.close()
+            print("🛑 Tracker daemon stopped")
+
+    def stop(self):
+        self._stop.set()
+        # Unblock accept(); the unauthenticated connection is rejected right away
+        try:
+            Client(self.address).close()
+        except OSError:
+            pass
+
+    def publish(self, event):
+        """Logger listener: queue *event* for every attached GUI without blocking on any of them."""
+        record = event.to_record()
+        with self._lock:
+            for subscriber in list(self._subscribers):
+                if not subscriber.put(("event", record)):
+                    self._subscribers.remove(subscriber)
+                    subscriber.close()
+
+    def _handle(self, conn, handlers):
+        subscriber = None
+        try:
+            role = conn.recv()
+            if role == "events":
+                subscriber = _Subscriber(conn)
+                with self._lock:
+                    self._subscribers.append(subscriber)
+                conn.recv()  # blocks until the client detaches
+            elif role == "rpc":
+                while True:
+                    call_id, method, args = conn.recv()
+                    handler = handlers.get(method)
+                    if handler is None:
+                        conn.send((call_id, "error", f"Unknown method {method!r}"))
+                        continue
+                    try:
+                        conn.send((call_id, "ok", handler(*args)))
+                    except Exception as e:
+                        conn.send((call_id, "error", f"{type(e).__name__}: {e}"))
+        except (EOFError, OSError):
+            pass
+        finally:
+            if subscriber is not None:
+                with self._lock:
+                    if subscriber in self._subscribers:
+                        self._subscribers.remove(subscriber)
+                subscriber.close()
+            else:
+                conn.close()
+
+
+class _Subscriber:
+    """One attached GUI's event stream: a bounded queue drained by its own sender thread."""
+
+    def __init__(self, conn, backlog=SUBSCRIBER_BACKLOG):
+        self.conn = conn
+        self.queue = queue.Queue(maxsize=backlog)
+        self.alive = True
+        threading.Thread(target=self._send_loop, name="tracker-subscriber", daemon=True).start()
+
+    def put(self, message):
+        """Queue *message*; False if this subscriber is dead or too far behind."""
+        if not self.alive:
+            return False
+        try:
+            self.queue.put_nowait(message)
+        except queue.Full:
+            return False
+        return True
+
+    def _send_loop(self):
+        while True:
+            message = self.queue.get()
+            if message is None:
+                break
+            try:
+                self.conn.send(message)
+            except OSError:
+                break
+        self.alive = False
+        self.conn.close()
+
+    def close(self):
+        if not self.alive:
+            return
+        self.alive = False
+        try:
+            self.queue.put_nowait(None)
+        except queue.Full:
+            # The sender is stuck on a GUI that stopped reading; closing unblocks it
+            self.conn.close()
+
+
+# ----------------------------------------------------------------------
+# GUI side
+# ----------------------------------------------------------------------
+
+class TrackerClient:
+    """Thread-safe RPC connection to a running daemon, plus optional event subscription."""
+
+    def __init__(self, address=DEFAULT_ADDRESS, authkey_file=AUTHKEY_FILE, timeout=10.0):
+        self.address = address
+        self.authkey_file = authkey_file
+        self.timeout = timeout
+        self._conn = connect(address, authkey_file)
+        self._lock = threading.Lock()
+        self._events = None
+        self._next_id = 0
+
+    def call(self, method, *args):
+        with self._lock:
+            if self._conn is None:
+                raise ConnectionError("Detached from the tracker daemon")
+            self._next_id += 1
+            call_id = self._next_id
+            self._conn.send((call_id, method, args))
+            deadline = time.monotonic() + self.timeout
+            while True:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0 or not self._conn.poll(remaining):
+                    raise TimeoutError(f"Tracker daemon did not answer {method!r} within {self.timeout}s")
+                reply_id, status, value = self._conn.recv()
+                if reply_id == call_id:
+                    break
+                # Late answer to an earlier call that timed out; drop it
+        if status == "error":
+            raise RuntimeError(value)
+        return value
+
+    def subscribe(self, callback):
+        """Call *callback(event)* from a reader thread for each event the daemon logs."""
+        self._events = connect(self.address, self.authkey_file, role="events")
+
+        def read(conn):
+            try:
+                while True:
+                    _, record = conn.recv()
+                    callback(Event.from_record(record))
+            except (EOFError, OSError):
+                pass
+
+        threading.Thread(target=read, args=(self._events,), name="tracker-events", daemon=True).start()
+
+    def close(self):
+        with self._lock:
+            for conn in (self._conn, self._events):
+                if conn is not None:
+                    conn.close()
+            self._conn = self._events = None
+
+
+class RemoteLogger:
+    def __init__(self, client, log_file=LOG_FILE):
+        self.client = client
+        self.log_file = log_file
+
+    def get_summary(self):
+        return self.client.call("get_summary")
+
+    def clear(self):
+        self.client.call("clear_logs")
+
+    def iter_history(self, since=None, until=None):
+        # The daemon only appends, so the GUI reads the history straight from disk
+        return iter_history(self.log_file, since, until)
+
+
+class RemoteDetector:
+    """Stands in for ``AdvancedDistractionDetector`` in a GUI attached to the daemon.
+
+    Tracking lives in the daemon: ``start_monitoring`` is a no-op and
+    ``stop_monitoring`` only detaches this GUI.
+    """
+
+    def __init__(self, client, db=None):
+        self.client = client
+        self.db = db or Database()
+        self.logger = RemoteLogger(client)
+        self.monitoring = True
+
+    def start_monitoring(self):
+        pass
+
+    def stop_monitoring(self, timeout=None):
+        self.request_stop()
+        return True
+
+    def request_stop(self):
+        self.monitoring = False
+        self.client.close()
+
+    def wait_stopped(self, timeout=None):
+        return True  # detaching is immediate
+
+    def reset_distractions(self):
+        return self.client.call("reset_distractions")
+
+    def get_distraction_count(self):
+        return self.client.call("get_distraction_count")
+
+    def focus_seconds_today(self):
+        return self.client.call("focus_seconds_today")
+
+    def detect_distraction_in_text(self, text):
+        return self.client.call("detect_distraction_in_text", text)
+
+    def add_listener(self, callback):
+        """Only ``"event"`` updates are forwarded from the daemon."""
+        self.client.subscribe(lambda event: callback("event", event))
+
+
+def spawn(address=DEFAULT_ADDRESS):
+    """Start a detached headless daemon process."""
+    kwargs = {}
+    if sys.platform == "win32":
+        kwargs["creationflags"] = subprocess.DETACHED_PROCESS | subprocess.CREATE_NEW_PROCESS_GROUP
+    else:
+        kwargs["start_new_session"] = True
+    return subprocess.Popen(
+        [sys.executable, "-m", "core.trackers.daemon", "--address", address],
+        stdin=subprocess.DEVNULL, **kwargs,
+    )
+
+
+def attach(address=DEFAULT_ADDRESS, authkey_file=AUTHKEY_FILE, spawn_timeout=120.0):
+    """Connect to the daemon, spawning one if none is running, and return a RemoteDetector."""
+    if not is_running(address, authkey_file):
+        print("🛰️ Starting tracker daemon...")
+        process = spawn(address)
+        deadline = time.monotonic() + spawn_timeout
+        while not is_running(address, authkey_file):
+            if process.poll() is not None:
+                raise RuntimeError(f"Tracker daemon exited with code {process.returncode}")
+            if time.monotonic() > deadline:
+                raise TimeoutError("Tracker daemon did not start in time")
+            time.sleep(0.5)
+    return RemoteDetector(TrackerClient(address, authkey_file))
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="FocusForge tracker daemon")
+    parser.add_argument("--address", default=DEFAULT_ADDRESS)
+    parser.add_argument("--status", action="store_true", help="print the running daemon's status")
+    parser.add_argument("--stop", action="store_true", help="stop the running daemon")
+    parser.add_argument("--no-rollups", action="store_true", help="skip log compaction at startup")
+    args = parser.parse_args(argv)
+
+    if args.status or args.stop:
+        if not is_running(args.address):
+            print("Tracker daemon is not running")
+            return 1
+        client = TrackerClient(args.address)
+        print(client.call("shutdown" if args.stop else "status"))
+        client.close()
+        return 0
+
+    TrackerDaemon(address=args.address, run_rollups=not args.no_rollups).serve()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,54 +1,149 @@
 import json
 import os
+import threading
 import time
-from datetime import datetime
+from collections import Counter, deque
+
+from ..utils import metrics
+from ..utils.atomic_io import atomic_writer
+from .events import NS_PER_SECOND, Event, to_ns, type_name
+
+# Append-only, one JSON event per line. The full history lives only on disk.
+LOG_FILE = "logs/distraction_log.jsonl"
+# Pre-JSONL format: a single JSON array rewritten on every event
+LEGACY_LOG_FILE = "logs/distraction_log.json"
+
+DEFAULT_CAPACITY = 2048
+# Lines are appended in time order, give or take events stamped on one thread
+# and written just after one stamped later on another
+ORDER_SLACK_NS = NS_PER_SECOND
+
+
+def migrate_legacy_log(log_file=LOG_FILE, legacy_file=None):
+    """Move events from the legacy JSON array (next to *log_file*) into the JSONL log, once."""
+    legacy_file = legacy_file or os.path.splitext(log_file)[0] + ".json"
+    if not os.path.exists(legacy_file):
+        return 0
+    with open(legacy_file, "r") as f:
+        try:
+            legacy = json.load(f)
+        except json.JSONDecodeError:
+            legacy = []
+    # Legacy events are older than anything already in the JSONL log
+    with atomic_writer(log_file) as out:
+        for entry in legacy:
+            out.write(json.dumps(Event.from_record(entry).to_record()) + "\n")
+        if os.path.exists(log_file):
+            with open(log_file, "r") as f:
+                for line in f:
+                    out.write(line)
+    os.replace(legacy_file, legacy_file + ".migrated")
+    print(f"✅ Migrated {len(legacy)} distraction events to {log_file}")
+    return len(legacy)
+
+
+def iter_history(log_file=LOG_FILE, since=None, until=None, start=0):
+    """Lazily yield logged Events, oldest first, optionally within [since, until).
+
+    *since* and *until* may be epoch nanoseconds, datetimes or timestamp strings;
+    *start* is a byte offset (at a line boundary) to begin reading from. Reading
+    stops at the first event more than ``ORDER_SLACK_NS`` past *until*.
+    """
+    since, until = to_ns(since), to_ns(until)
+    migrate_legacy_log(log_file)
+    if not os.path.exists(log_file):
+        return
+    with open(log_file, "rb") as f:
+        f.seek(start)
+        for line in f:
+            if not line.strip():
+                continue
+            try:
+                event = Event.from_record(json.loads(line))
+            except (json.JSONDecodeError, KeyError, ValueError):
+                continue  # torn final line from a crash
+            if since is not None and event.ts_ns < since:
+                continue
+            if until is not None and event.ts_ns >= until:
+                if event.ts_ns >= until + ORDER_SLACK_NS:
+                    break
+                continue
+            yield event
 
-LOG_FILE = "logs/distraction_log.json"
 
 class DistractionLogger:
-    def __init__(self):
-        """Initialize log storage and ensure log directory exists."""
-        os.makedirs("logs", exist_ok=True)
-        self.logs = self.load_logs()
+    def __init__(self, capacity=DEFAULT_CAPACITY, log_file=LOG_FILE):
+        """
+        Keeps a bounded window of recent events in memory and appends every event to disk.
+
+        Args:
+            capacity (int): Number of recent events kept for live queries.
+            log_file (str): JSONL file holding the full history.
+        """
+        self.log_file = log_file
+        os.makedirs(os.path.dirname(log_file) or ".", exist_ok=True)
+        migrate_legacy_log(log_file)
+        self._repair_tail()
+        self.logs = deque(maxlen=capacity)
+        self.counts = Counter()  # events by type since the last clear()
+        self.listeners = []  # callables receiving each Event after it is written
+        self._lock = threading.Lock()  # the tracker io and classifier threads both log
+
+    def _repair_tail(self):
+        """Terminate a line torn by a crash, so the next event does not get glued onto it."""
+        if not os.path.exists(self.log_file) or os.path.getsize(self.log_file) == 0:
+            return
+        with open(self.log_file, "rb+") as f:
+            f.seek(-1, os.SEEK_END)
+            if f.read(1) != b"\n":
+                f.write(b"\n")
 
     def load_logs(self):
-        """Load existing logs from JSON file if available."""
-        if os.path.exists(LOG_FILE):
-            with open(LOG_FILE, "r") as f:
-                return json.load(f)
-        return []
+        """Load the most recent *capacity* events from disk into the window."""
+        self.logs.extend(iter_history(self.log_file))
+        return self.logs
+
+    @metrics.timed("distraction_logger.log_event")
+    def log(self, event):
+        """Record a typed Event in the live window and append it to the history."""
+        line = json.dumps(event.to_record()) + "\n"
+        with self._lock:
+            self.logs.append(event)
+            self.counts[event.type] += 1
+            # Append one line instead of rewriting the whole history
+            with open(self.log_file, "a") as f:
+                f.write(line)
+        metrics.set_gauge("distraction_logger.logs", len(self.logs))
+
+        for listener in self.listeners:
+            listener(event)
 
     def log_event(self, event_type, details):
         """
-        Logs a distraction event with a timestamp.
-        
+        Logs a distraction event with the current time.
+
         Args:
             event_type (str): Type of event (e.g., "Inactivity", "App Switch", "Distraction").
             details (dict): Additional info about the event.
         """
-        timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        log_entry = {
-            "timestamp": timestamp,
-            "event_type": event_type,
-            "details": details
-        }
-        self.logs.append(log_entry)
-
-        # Save to JSON file
-        with open(LOG_FILE, "w") as f:
-            json.dump(self.logs, f, indent=4)
+        self.log(Event.from_details(time.time_ns(), event_type, details))
 
     def get_logs(self):
-        """Retrieve all logs."""
-        return self.logs
+        """Retrieve the recent events window (Event tuples), oldest first."""
+        return list(self.logs)
+
+    def iter_history(self, since=None, until=None):
+        """Lazily iterate the full on-disk history."""
+        return iter_history(self.log_file, since, until)
+
+    def clear(self):
+        """Start a new live window (e.g. at the end of a session); history on disk is kept."""
+        self.logs.clear()
+        self.counts.clear()
 
     def get_summary(self):
-        """Summarizes logged distractions by category."""
-        summary = {
-            "total_distractions": len(self.logs),
-            "by_type": {}
+        """Summarizes logged distractions by category since the last clear()."""
+        return {
+            "total_distractions": sum(self.counts.values()),
+            "by_type": {type_name(t): n for t, n in self.counts.items()}
         }
-        for log in self.logs:
-            event_type = log["event_type"]
-            summary["by_type"][event_type] = summary["by_type"].get(event_type, 0) + 1
-        return summary
@@ -0,0 +1,105 @@
+# dwell.py
+
+"""Live per-app dwell time, attributed to the window the time was spent in.
+
+The detector reports the active window on every poll; the accumulator
+charges the time since the previous poll to the previous window, split at
+minute boundaries, and keeps running per-category totals for today. Pending
+minute/hour/day buckets are drained into ``Database.add_dwell`` periodically,
+so "focus minutes today" is a lookup rather than a log scan.
+"""
+
+import threading
+import time
+from collections import defaultdict
+from datetime import datetime
+
+from .app_catalog import WORK, default_catalog
+
+
+def bucket_start(ts, granularity):
+    """Local-time start (epoch seconds) of the bucket containing *ts*."""
+    moment = datetime.fromtimestamp(ts)
+    if granularity == "minute":
+        moment = moment.replace(second=0, microsecond=0)
+    elif granularity == "hour":
+        moment = moment.replace(minute=0, second=0, microsecond=0)
+    elif granularity == "day":
+        moment = moment.replace(hour=0, minute=0, second=0, microsecond=0)
+    else:
+        raise ValueError(f"Unknown granularity: {granularity}")
+    return int(moment.timestamp())
+
+
+class DwellAccumulator:
+    def __init__(self, catalog=None, clock=time.time):
+        self.catalog = catalog or default_catalog()
+        self.clock = clock
+        self.window = None  # None while inactive or before the first poll
+        self.since = None
+        self._lock = threading.Lock()
+        self._pending = defaultdict(float)  # (minute_start, app, category) -> seconds
+        self._day = None
+        self._today = defaultdict(float)  # category -> seconds, current local day
+
+    def switch(self, window, now=None):
+        """Charge time so far to the current window, then start timing *window*."""
+        with self._lock:
+            now = self.clock() if now is None else now
+            self._attribute(now)
+            self.window = window
+            self.since = now
+
+    def tick(self, now=None):
+        """Charge time so far to the current window without changing it."""
+        with self._lock:
+            self._attribute(self.clock() if now is None else now)
+
+    def _attribute(self, now):
+        if self.window is None or self.since is None:
+            return
+        app = self.catalog.app_name(self.window)
+        category = self.catalog.category(self.window)
+        t = self.since
+        while t < now:
+            minute = bucket_start(t, "minute")
+            end = min(now, minute + 60)
+            self._pending[(minute, app, category)] += end - t
+            day = bucket_start(t, "day")
+            if day != self._day:
+                self._day = day
+                self._today.clear()
+            self._today[category] += end - t
+            t = end
+        self.since = now
+
+    def seconds_today(self, category=WORK, now=None):
+        """Seconds spent in *category* today, including the window still being timed."""
+        with self._lock:
+            now = self.clock() if now is None else now
+            self._attribute(now)
+            if self._day != bucket_start(now, "day"):
+                return 0.0
+            return self._today[category]
+
+    def pending_seconds(self, category=WORK, now=None):
+        """Seconds in *category* today that have not been drained yet (bounded by the flush interval)."""
+        with self._lock:
+            now = self.clock() if now is None else now
+            self._attribute(now)
+            day = bucket_start(now, "day")
+            return sum(
+                seconds for (minute, _, cat), seconds in self._pending.items()
+                if cat == category and minute >= day
+            )
+
+    def drain(self):
+        """Return pending ``(granularity, bucket_start, app, category, seconds)`` rows and reset them."""
+        with self._lock:
+            pending, self._pending = self._pending, defaultdict(float)
+        rows = defaultdict(float)
+        for (minute, app, category), seconds in pending.items():
+            rows[("minute", minute, app, category)] += seconds
+            rows[("hour", bucket_start(minute, "hour"), app, category)] += seconds
+            rows[("day", bucket_start(minute, "day"), app, category)] += seconds
+        return [key + (seconds,) for key, seconds in rows.items()]
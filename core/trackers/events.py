@@ -0,0 +1,134 @@
+# events.py
+
+"""Typed distraction events.
+
+Events are small immutable tuples with an integer epoch-nanosecond timestamp,
+an ``EventType`` member and interned window titles, so the thousands of
+polling events a day share their strings and never need re-parsing::
+
+    Event.now(EventType.DISTRACTION, window="YouTube - Google Chrome")
+
+On disk each event is one JSON object; ``to_record``/``from_record`` convert,
+and records written before ``ts_ns`` existed are parsed from ``timestamp``.
+"""
+
+import sys
+import time
+from datetime import datetime
+from enum import Enum
+from typing import NamedTuple, Optional
+
+TIMESTAMP_FORMAT = "%Y-%m-%d %H:%M:%S"
+NS_PER_SECOND = 1_000_000_000
+
+
+class EventType(str, Enum):
+    APP_SWITCH = "App Switch"
+    WORK_APP_USAGE = "Work App Usage"
+    DISTRACTION = "Distraction"
+    INACTIVITY = "Inactivity"
+    TEXT_CLASSIFICATION = "Text Classification"
+
+    def __str__(self):
+        return self.value
+
+
+_TYPES = {t.value: t for t in EventType}
+
+
+def event_type(value):
+    """Return the EventType for *value*; unknown names stay (interned) strings."""
+    if isinstance(value, EventType):
+        return value
+    return _TYPES.get(value) or sys.intern(value)
+
+
+def type_name(value):
+    return value.value if isinstance(value, EventType) else value
+
+
+def intern_title(title):
+    return sys.intern(title) if title is not None else None
+
+
+def to_ns(value):
+    """Convert a datetime or a TIMESTAMP_FORMAT string to epoch nanoseconds."""
+    if isinstance(value, str):
+        value = datetime.strptime(value, TIMESTAMP_FORMAT)
+    if isinstance(value, datetime):
+        return int(value.timestamp()) * NS_PER_SECOND
+    return value
+
+
+def format_ns(ts_ns):
+    return datetime.fromtimestamp(ts_ns / NS_PER_SECOND).strftime(TIMESTAMP_FORMAT)
+
+
+_DETAIL_FIELDS = frozenset(("window", "new_window", "previous_window", "duration_in_previous_window"))
+
+
+class Event(NamedTuple):
+    ts_ns: int
+    type: EventType
+    window: Optional[str] = None           # window the event is about (new window for App Switch)
+    previous_window: Optional[str] = None  # App Switch only
+    duration: float = 0.0                  # seconds spent in previous_window (App Switch only)
+    extra: Optional[dict] = None           # anything else, e.g. Text Classification results
+
+    @classmethod
+    def now(cls, type, window=None, previous_window=None, duration=0.0, extra=None):
+        return cls(time.time_ns(), event_type(type), intern_title(window),
+                   intern_title(previous_window), duration, extra)
+
+    @classmethod
+    def from_details(cls, ts_ns, type, details):
+        """Build an event from the legacy ``(event_type, details dict)`` form."""
+        if not details:
+            return cls(ts_ns, event_type(type))
+        window = details.get("window")
+        if window is None:
+            window = details.get("new_window")
+        extra = {k: v for k, v in details.items() if k not in _DETAIL_FIELDS}
+        return cls(ts_ns, event_type(type), intern_title(window),
+                   intern_title(details.get("previous_window")),
+                   details.get("duration_in_previous_window") or 0.0, extra or None)
+
+    @classmethod
+    def from_record(cls, record):
+        ts_ns = record.get("ts_ns")
+        if ts_ns is None:
+            ts_ns = to_ns(record["timestamp"])
+        return cls.from_details(ts_ns, record["event_type"], record.get("details"))
+
+    @property
+    def timestamp(self):
+        return format_ns(self.ts_ns)
+
+    @property
+    def type_name(self):
+        return type_name(self.type)
+
+    @property
+    def details(self):
+        """The legacy details dict, as written to the log."""
+        if self.type == EventType.APP_SWITCH:
+            details = {
+                "previous_window": self.previous_window,
+                "new_window": self.window,
+                "duration_in_previous_window": self.duration,
+            }
+        elif self.window is not None:
+            details = {"window": self.window}
+        else:
+            details = {}
+        if self.extra:
+            details.update(self.extra)
+        return details
+
+    def to_record(self):
+        return {
+            "ts_ns": self.ts_ns,
+            "timestamp": self.timestamp,
+            "event_type": self.type_name,
+            "details": self.details,
+        }
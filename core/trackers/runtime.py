@@ -0,0 +1,190 @@
+# runtime.py
+
+"""One asyncio event loop running all tracker work as cooperative tasks.
+
+Replaces the per-component ``Thread`` + ``sleep`` loops. A single
+background thread runs the loop with four tasks:
+
+* ``idle``     - inactivity detection, every ``idle_interval`` seconds,
+* ``focus``    - active-window polling, every ``check_interval`` seconds,
+* ``classify`` - queued text classification requests, one at a time,
+* ``persist``  - dwell flushes to SQLite, every ``dwell_flush_interval`` seconds.
+
+Blocking calls run in executors: window lookups, log appends and SQLite on
+one ``tracker-io`` worker, the classifier on a ``tracker-model`` worker.
+The model worker only computes a category; the result goes back to the io
+worker to be logged. Every read and write of the detector's tracking state,
+and every log line the tracker writes, therefore happens on the io worker,
+in order. (The keyboard and mouse hooks run on pynput's own threads, but
+they only store a timestamp.) ``stop()`` cancels the tasks, waits for the io
+worker to do a final dwell flush and returns within its timeout.
+"""
+
+import asyncio
+import concurrent.futures
+import threading
+
+from ..utils.database import Database
+
+
+class TrackerRuntime:
+    def __init__(self, detector, idle_interval=1.0):
+        self.detector = detector
+        self.idle_interval = idle_interval
+        self.loop = None
+        self._thread = None
+        self._tasks = []
+        self._queue = None
+        self._classifying = None  # the request whose category is being computed or logged
+        self._ready = threading.Event()
+        self._io = concurrent.futures.ThreadPoolExecutor(max_workers=1, thread_name_prefix="tracker-io")
+        self._model = concurrent.futures.ThreadPoolExecutor(max_workers=1, thread_name_prefix="tracker-model")
+        self._db = None  # opened on the io worker; SQLite connections stay on their thread
+
+    @property
+    def running(self):
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self):
+        self._thread = threading.Thread(target=self._run, name="tracker-runtime", daemon=True)
+        self._thread.start()
+        self._ready.wait()
+        return self
+
+    def request_stop(self):
+        """Cancel all tasks without waiting; pair with ``wait()``."""
+        if self.running:
+            self.loop.call_soon_threadsafe(self._cancel)
+
+    def wait(self, timeout=5.0):
+        """Wait up to *timeout* seconds for the loop to finish; returns True if it did."""
+        if self._thread is not None:
+            self._thread.join(timeout)
+        # A classification in progress is abandoned rather than waited for
+        self._model.shutdown(wait=False, cancel_futures=True)
+        if self.running:
+            return False  # the loop still needs the io worker for its final flush; _run shuts it down
+        self._io.shutdown(wait=False)
+        return True
+
+    def stop(self, timeout=5.0):
+        """Cancel all tasks and wait up to *timeout* seconds; returns True if the loop finished."""
+        self.request_stop()
+        return self.wait(timeout)
+
+    def classify(self, text):
+        """Queue *text* for classification; returns a ``concurrent.futures.Future`` of its category."""
+        future = concurrent.futures.Future()
+        self.loop.call_soon_threadsafe(self._queue.put_nowait, (text, future))
+        return future
+
+    # ------------------------------------------------------------------
+    # Loop
+    # ------------------------------------------------------------------
+    def _run(self):
+        self.loop = asyncio.new_event_loop()
+        try:
+            self.loop.run_until_complete(self._main())
+        finally:
+            self.loop.close()
+            # Only now: _main's final flush is the io worker's last job
+            self._io.shutdown(wait=False)
+
+    async def _main(self):
+        self._queue = asyncio.Queue()
+        self._tasks = [
+            asyncio.create_task(self._idle(), name="idle"),
+            asyncio.create_task(self._focus(), name="focus"),
+            asyncio.create_task(self._classify(), name="classify"),
+            asyncio.create_task(self._persist(), name="persist"),
+        ]
+        self._ready.set()
+        try:
+            await asyncio.gather(*self._tasks)
+        except asyncio.CancelledError:
+            pass
+        finally:
+            while not self._queue.empty():
+                self._queue.get_nowait()[1].cancel()
+            # Queued after any poll still running, so it sees the final state
+            await self._in_io(self._close)
+
+    def _cancel(self):
+        for task in self._tasks:
+            task.cancel()
+
+    async def _in_io(self, func, *args):
+        return await self.loop.run_in_executor(self._io, func, *args)
+
+    async def _guarded(self, name, func):
+        try:
+            await self._in_io(func)
+        except Exception as e:
+            # One failed poll (e.g. no window manager answer) must not end tracking
+            print(f"⚠️ Tracker {name} failed: {e}")
+
+    # ------------------------------------------------------------------
+    # Tasks
+    # ------------------------------------------------------------------
+    async def _idle(self):
+        inactive = False
+        while True:
+            if self.detector.is_inactive() != inactive:
+                inactive = not inactive
+                self.detector.notify("inactive", inactive)
+            await asyncio.sleep(self.idle_interval)
+
+    async def _focus(self):
+        while True:
+            await self._guarded("poll", self.detector.poll)
+            await asyncio.sleep(self.detector.check_interval)
+
+    async def _classify(self):
+        while True:
+            text, future = await self._queue.get()
+            if not future.set_running_or_notify_cancel():
+                continue
+            self._classifying = future
+            category, error = await self.loop.run_in_executor(self._model, self._categorize, text)
+            if error is not None:
+                future.set_exception(error)
+                continue
+            await self._in_io(self._record_classification, text, category, future)
+
+    def _categorize(self, text):
+        # Failures are returned rather than raised through the await, so the caller's
+        # exception never carries (and can never clear) this loop's coroutine frames
+        try:
+            return self.detector.categorize_text(text), None
+        except Exception as e:
+            return None, e
+
+    async def _persist(self):
+        while True:
+            await asyncio.sleep(self.detector.dwell_flush_interval)
+            await self._guarded("dwell flush", self._flush)
+
+    # ------------------------------------------------------------------
+    # io worker
+    # ------------------------------------------------------------------
+    def _flush(self):
+        if self._db is None:
+            self._db = Database(self.detector.db.db_name)
+        self.detector.flush_dwell(self._db)
+
+    def _record_classification(self, text, category, future):
+        try:
+            self.detector.log_classification(text, category)
+        except Exception as e:
+            print(f"⚠️ Tracker classification log failed: {e}")
+        self.detector.notify("classified", (text, category))
+        future.set_result(category)
+
+    def _close(self):
+        if self._classifying is not None and not self._classifying.done():
+            # Abandoned mid-classification; don't leave the caller waiting forever
+            self._classifying.set_exception(concurrent.futures.CancelledError())
+        self.detector.dwell.switch(None)
+        self._flush()
+        self._db.close()
+        self._db = None
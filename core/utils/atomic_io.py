@@ -0,0 +1,115 @@
+# atomic_io.py
+
+"""Crash-safe file writes and recovering JSON loads.
+
+Writes go to a temporary file in the target's directory, are fsynced and
+then renamed over the target, so readers see either the old or the new
+content and never a truncated file. With ``backup=True`` the previous
+version is kept as a gzip-compressed ``<name>.bak.gz`` that
+``load_json`` falls back to when the main file is missing or corrupt.
+"""
+
+import contextlib
+import gzip
+import json
+import os
+import shutil
+import stat
+import tempfile
+
+
+def _file_mode(path):
+    """Permission bits *path* has, or that a plain ``open()`` would give a new file."""
+    try:
+        return stat.S_IMODE(os.stat(path).st_mode)
+    except FileNotFoundError:
+        umask = os.umask(0)
+        os.umask(umask)
+        return 0o666 & ~umask
+
+
+def backup_path(path):
+    return path + ".bak.gz"
+
+
+def _fsync_dir(directory):
+    # Makes the rename itself durable; not supported on every platform
+    try:
+        fd = os.open(directory, os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.fsync(fd)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
+
+
+def _write_backup(path):
+    """Compress the current *path* into its backup, itself written atomically."""
+    if not os.path.exists(path):
+        return
+    directory = os.path.dirname(os.path.abspath(path))
+    fd, tmp = tempfile.mkstemp(prefix=".bak-", dir=directory)
+    try:
+        with os.fdopen(fd, "wb") as raw, gzip.GzipFile(fileobj=raw, mode="wb") as gz, open(path, "rb") as src:
+            shutil.copyfileobj(src, gz)
+        shutil.copymode(path, tmp)
+        os.replace(tmp, backup_path(path))
+    except BaseException:
+        with contextlib.suppress(OSError):
+            os.unlink(tmp)
+        raise
+
+
+@contextlib.contextmanager
+def atomic_writer(path, mode="w", backup=False, **open_kwargs):
+    """Yield a file object whose contents replace *path* only if the block succeeds."""
+    directory = os.path.dirname(os.path.abspath(path))
+    os.makedirs(directory, exist_ok=True)
+    fd, tmp = tempfile.mkstemp(prefix=f".{os.path.basename(path)}-", suffix=".tmp", dir=directory)
+    try:
+        with os.fdopen(fd, mode, **open_kwargs) as f:
+            yield f
+            f.flush()
+            os.fsync(f.fileno())
+        if backup:
+            _write_backup(path)
+        # mkstemp creates 0600 files; keep the target's permissions instead
+        os.chmod(tmp, _file_mode(path))
+        os.replace(tmp, path)
+    except BaseException:
+        with contextlib.suppress(OSError):
+            os.unlink(tmp)
+        raise
+    _fsync_dir(directory)
+
+
+def atomic_write_json(path, data, backup=False, **dump_kwargs):
+    with atomic_writer(path, backup=backup) as f:
+        json.dump(data, f, **dump_kwargs)
+
+
+def load_json(path, default=None):
+    """Load JSON from *path*, falling back to its backup if the file is missing or corrupt.
+
+    Returns *default* when neither can be read.
+    """
+    try:
+        with open(path, "r") as f:
+            return json.load(f)
+    except FileNotFoundError:
+        pass
+    except (OSError, ValueError) as e:
+        print(f"⚠️ {path} is unreadable ({e}); trying backup")
+    try:
+        with gzip.open(backup_path(path), "rt") as f:
+            data = json.load(f)
+    except FileNotFoundError:
+        return default
+    except (OSError, ValueError, EOFError) as e:
+        print(f"⚠️ Backup of {path} is unreadable too ({e})")
+        return default
+    print(f"✅ Recovered {path} from backup")
+    return data
@@ -0,0 +1,90 @@
+# countdown.py
+
+import math
+import time
+
+
+if hasattr(time, "CLOCK_BOOTTIME"):
+    def suspend_aware_clock():
+        """Monotonic seconds that keep counting while the machine is suspended.
+
+        CLOCK_BOOTTIME (Linux) includes sleep, so a session whose deadline
+        passes during suspend is seen as finished on resume.
+        """
+        return time.clock_gettime(time.CLOCK_BOOTTIME)
+else:
+    suspend_aware_clock = time.monotonic
+
+
+class CountdownTimer:
+    """Pomodoro countdown driven by a monotonic deadline instead of tick counting.
+
+    The remaining time is always ``deadline - now``, so a stalled event loop
+    (modal dialog, slow redraw, DB commit) delays only the label refresh, never
+    the session itself. ``elapsed()`` reports the time actually spent running,
+    excluding pauses.
+    """
+
+    def __init__(self, duration=0, clock=None):
+        self.clock = clock or suspend_aware_clock
+        self.reset(duration)
+
+    def reset(self, duration=None):
+        """Stop and rewind to *duration* seconds (or the current duration)."""
+        if duration is not None:
+            self.duration = float(duration)
+        self._deadline = None
+        self._remaining = self.duration
+        self._elapsed = 0.0
+        self._started_at = None
+
+    def set_duration(self, duration):
+        """Change the planned length of the current countdown, keeping time already elapsed."""
+        running = self.is_running
+        self.pause()
+        self.duration = float(duration)
+        self._remaining = max(0.0, self.duration - self._elapsed)
+        if running:
+            self.start()
+
+    def start(self):
+        if self._deadline is None:
+            now = self.clock()
+            self._started_at = now
+            self._deadline = now + self._remaining
+
+    def pause(self):
+        if self._deadline is not None:
+            now = self.clock()
+            self._remaining = max(0.0, self._deadline - now)
+            self._elapsed += min(now, self._deadline) - self._started_at
+            self._deadline = None
+            self._started_at = None
+
+    @property
+    def is_running(self):
+        return self._deadline is not None
+
+    def remaining(self):
+        """Seconds left, never negative."""
+        if self._deadline is None:
+            return self._remaining
+        return max(0.0, self._deadline - self.clock())
+
+    def remaining_seconds(self):
+        """Whole seconds left, rounded up so the display shows 00:00 only at the end."""
+        return int(math.ceil(self.remaining()))
+
+    def elapsed(self):
+        """Seconds spent running since the last reset, capped at the duration."""
+        if self._deadline is None:
+            return self._elapsed
+        now = min(self.clock(), self._deadline)
+        return self._elapsed + (now - self._started_at)
+
+    def is_finished(self):
+        return self.remaining() <= 0.0
+
+    def format(self):
+        mins, secs = divmod(self.remaining_seconds(), 60)
+        return f"{mins:02d}:{secs:02d}"
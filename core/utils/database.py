@@ -1,10 +1,20 @@
 # database.py
 
+import json
 import sqlite3
 from datetime import datetime
 
+from .metrics import timed
+
 class Database:
+    # Session columns the history view may sort on
+    SESSION_SORT_COLUMNS = (
+        "id", "task", "work_duration_planned", "work_duration_actual",
+        "break_taken", "distraction_events", "completed",
+    )
+
     def __init__(self, db_name="focus_forge.db"):
+        self.db_name = db_name
         self.conn = sqlite3.connect(db_name, check_same_thread=False)
         self.create_tables()
 
@@ -24,6 +34,12 @@ class Database:
                 timestamp TEXT
             )
         ''')
+        # Indexes backing sorted, paged browsing of session history
+        for column in self.SESSION_SORT_COLUMNS:
+            if column != "id":
+                cursor.execute(f'''
+                    CREATE INDEX IF NOT EXISTS idx_sessions_{column} ON sessions ({column}, id)
+                ''')
         # Tasks table
         cursor.execute('''
             CREATE TABLE IF NOT EXISTS tasks (
@@ -35,7 +51,7 @@ class Database:
                 created_at TEXT
             )
         ''')
-        # Board state table (single-row JSON payload)
+        # Board state table (legacy single-row JSON payload, migrated into board_cards)
         cursor.execute('''
             CREATE TABLE IF NOT EXISTS board_state (
                 id INTEGER PRIMARY KEY CHECK (id = 1),
@@ -43,9 +59,81 @@ class Database:
                 updated_at TEXT
             )
         ''')
+        # Board cards table (one row per KantuBoard card)
+        cursor.execute('''
+            CREATE TABLE IF NOT EXISTS board_cards (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                column_name TEXT NOT NULL,
+                position REAL NOT NULL,
+                payload TEXT NOT NULL,
+                updated_at TEXT
+            )
+        ''')
+        cursor.execute('''
+            CREATE INDEX IF NOT EXISTS idx_board_cards_column
+            ON board_cards (column_name, position)
+        ''')
+        # Cold storage for old Done cards
+        cursor.execute('''
+            CREATE TABLE IF NOT EXISTS board_cards_archive (
+                id INTEGER PRIMARY KEY,
+                column_name TEXT NOT NULL,
+                position REAL NOT NULL,
+                payload TEXT NOT NULL,
+                updated_at TEXT,
+                archived_at TEXT
+            )
+        ''')
+        cursor.execute('''
+            CREATE INDEX IF NOT EXISTS idx_board_cards_archive_recency
+            ON board_cards_archive (updated_at, id)
+        ''')
+        # Time spent per app, by minute/hour/day bucket (see core/trackers/dwell.py)
+        cursor.execute('''
+            CREATE TABLE IF NOT EXISTS dwell_rollups (
+                granularity TEXT NOT NULL,
+                bucket_start INTEGER NOT NULL,
+                app TEXT NOT NULL,
+                category TEXT NOT NULL,
+                seconds REAL NOT NULL DEFAULT 0,
+                PRIMARY KEY (granularity, bucket_start, app, category)
+            )
+        ''')
+        # Distraction event counts per type, by minute/hour/day bucket (see core/analytics/rollups.py)
+        cursor.execute('''
+            CREATE TABLE IF NOT EXISTS event_rollups (
+                granularity TEXT NOT NULL,
+                bucket_start INTEGER NOT NULL,
+                event_type TEXT NOT NULL,
+                count INTEGER NOT NULL DEFAULT 0,
+                PRIMARY KEY (granularity, bucket_start, event_type)
+            )
+        ''')
+        # Watermarks and other small pieces of pipeline state
+        cursor.execute('''
+            CREATE TABLE IF NOT EXISTS rollup_state (
+                name TEXT PRIMARY KEY,
+                value TEXT
+            )
+        ''')
+        # (state, action, reward) per session boundary for continual learning (see core/engine/continual.py)
+        cursor.execute('''
+            CREATE TABLE IF NOT EXISTS replay_buffer (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                session_id INTEGER,
+                policy TEXT NOT NULL,
+                state TEXT NOT NULL,
+                action INTEGER NOT NULL,
+                reward REAL NOT NULL,
+                learned INTEGER NOT NULL DEFAULT 0,  -- already applied by the engine online
+                timestamp TEXT
+            )
+        ''')
         self.conn.commit()
+        self._migrate_board_state()
 
     # Session Methods
+    @timed("db.log_session")
     def log_session(self, work_planned, work_actual, break_taken, break_duration, task, completed, distractions):
         cursor = self.conn.cursor()
         timestamp = datetime.now().isoformat()
@@ -57,6 +145,7 @@ class Database:
         ''', (work_planned, work_actual, break_taken, break_duration, task, completed, distractions, timestamp))
         self.conn.commit()
 
+    @timed("db.get_recent_sessions")
     def get_recent_sessions(self, limit=10):
         cursor = self.conn.cursor()
         cursor.execute('''
@@ -64,6 +153,50 @@ class Database:
         ''', (limit,))
         return cursor.fetchall()
 
+    @timed("db.get_sessions_page")
+    def get_sessions_page(self, limit=100, after=None, sort_column="id", descending=True,
+                          task_filter=None):
+        """Return one page of sessions, sorted and filtered in SQL.
+
+        Paging is keyset-based: pass the ``(sort_value, id)`` of the last row
+        of the previous page as *after* to continue, so later pages cost the
+        same as the first no matter how deep the history goes.
+        """
+        if sort_column not in self.SESSION_SORT_COLUMNS:
+            raise ValueError(f"Cannot sort sessions by {sort_column!r}")
+        direction = "DESC" if descending else "ASC"
+        comparison = "<" if descending else ">"
+        clauses = []
+        params = []
+        if task_filter:
+            escaped = task_filter.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+            clauses.append("task LIKE ? ESCAPE '\\'")
+            params.append(f"%{escaped}%")
+        if after is not None:
+            clauses.append(f"({sort_column}, id) {comparison} (?, ?)")
+            params.extend(after)
+        where = f"WHERE {' AND '.join(clauses)}" if clauses else ""
+        cursor = self.conn.cursor()
+        cursor.execute(f'''
+            SELECT * FROM sessions {where}
+            ORDER BY {sort_column} {direction}, id {direction}
+            LIMIT ?
+        ''', (*params, limit))
+        return cursor.fetchall()
+
+    @timed("db.get_work_history")
+    def get_work_history(self, limit=20):
+        """Return ``(planned, actual)`` work minutes of the last *limit* sessions, oldest first."""
+        cursor = self.conn.cursor()
+        cursor.execute('''
+            SELECT work_duration_planned, work_duration_actual FROM (
+                SELECT id, work_duration_planned, work_duration_actual
+                FROM sessions ORDER BY id DESC LIMIT ?
+            ) ORDER BY id ASC
+        ''', (limit,))
+        return cursor.fetchall()
+
+    @timed("db.get_success_rate")
     def get_success_rate(self):
         cursor = self.conn.cursor()
         cursor.execute('''
@@ -76,6 +209,7 @@ class Database:
         total = cursor.fetchone()[0]
         return (completed / total) * 100 if total > 0 else 0
 
+    @timed("db.get_consecutive_failures")
     def get_consecutive_failures(self, threshold=3):
         cursor = self.conn.cursor()
         cursor.execute('''
@@ -86,6 +220,7 @@ class Database:
         results = cursor.fetchall()
         return all(r[0] == 0 for r in results) if len(results) == threshold else False
 
+    @timed("db.get_streak")
     def get_streak(self, limit=5):
         cursor = self.conn.cursor()
         cursor.execute('''
@@ -100,6 +235,7 @@ class Database:
                 break
         return streak
 
+    @timed("db.get_average_work_duration")
     def get_average_work_duration(self):
         cursor = self.conn.cursor()
         cursor.execute('''
@@ -108,6 +244,7 @@ class Database:
         result = cursor.fetchone()[0]
         return round(result, 2) if result else 0.0
 
+    @timed("db.get_average_distractions")
     def get_average_distractions(self):
         cursor = self.conn.cursor()
         cursor.execute('''
@@ -116,6 +253,27 @@ class Database:
         result = cursor.fetchone()[0]
         return round(result, 2) if result else 0.0
 
+    @timed("db.get_session_stats")
+    def get_session_stats(self):
+        """Return success rate, averages and counts in a single aggregate query."""
+        cursor = self.conn.cursor()
+        cursor.execute('''
+            SELECT
+                COUNT(*),
+                COALESCE(SUM(completed = 1), 0),
+                AVG(CASE WHEN completed = 1 THEN work_duration_actual END),
+                AVG(distraction_events)
+            FROM sessions
+        ''')
+        total, completed, avg_work, avg_distractions = cursor.fetchone()
+        return {
+            "total_sessions": total,
+            "completed_sessions": completed,
+            "success_rate": (completed / total) * 100 if total > 0 else 0,
+            "average_work_duration": round(avg_work, 2) if avg_work else 0.0,
+            "average_distractions": round(avg_distractions, 2) if avg_distractions else 0.0,
+        }
+
     # Task Methods
     def add_task(self, description, priority=1, estimated_time=25):
         cursor = self.conn.cursor()
@@ -126,6 +284,7 @@ class Database:
         ''', (description, priority, estimated_time, created_at))
         self.conn.commit()
 
+    @timed("db.get_pending_tasks")
     def get_pending_tasks(self):
         cursor = self.conn.cursor()
         cursor.execute('''
@@ -140,6 +299,121 @@ class Database:
         ''', (task_id,))
         self.conn.commit()
 
+    # Dwell Rollup Methods
+    @timed("db.add_dwell")
+    def add_dwell(self, rows, commit=True):
+        """Add ``(granularity, bucket_start, app, category, seconds)`` rows to existing buckets."""
+        self.conn.executemany('''
+            INSERT INTO dwell_rollups (granularity, bucket_start, app, category, seconds)
+            VALUES (?, ?, ?, ?, ?)
+            ON CONFLICT (granularity, bucket_start, app, category)
+            DO UPDATE SET seconds = seconds + excluded.seconds
+        ''', rows)
+        if commit:
+            self.conn.commit()
+
+    def get_dwell(self, granularity, since, until=None, category=None):
+        """Rows of (bucket_start, app, category, seconds) for buckets in [since, until)."""
+        query = "SELECT bucket_start, app, category, seconds FROM dwell_rollups WHERE granularity = ? AND bucket_start >= ?"
+        params = [granularity, since]
+        if until is not None:
+            query += " AND bucket_start < ?"
+            params.append(until)
+        if category is not None:
+            query += " AND category = ?"
+            params.append(category)
+        return self.conn.execute(query + " ORDER BY bucket_start, app", params).fetchall()
+
+    @timed("db.focus_seconds_today")
+    def focus_seconds_today(self, category="work", now=None):
+        """Seconds recorded in *category* today; reads the day bucket, not the raw events."""
+        today = (now or datetime.now()).replace(hour=0, minute=0, second=0, microsecond=0)
+        row = self.conn.execute('''
+            SELECT COALESCE(SUM(seconds), 0) FROM dwell_rollups
+            WHERE granularity = 'day' AND bucket_start = ? AND category = ?
+        ''', (int(today.timestamp()), category)).fetchone()
+        return row[0]
+
+    # Event Rollup Methods
+    @timed("db.add_event_counts")
+    def add_event_counts(self, rows, commit=True):
+        """Add ``(granularity, bucket_start, event_type, count)`` rows to existing buckets."""
+        self.conn.executemany('''
+            INSERT INTO event_rollups (granularity, bucket_start, event_type, count)
+            VALUES (?, ?, ?, ?)
+            ON CONFLICT (granularity, bucket_start, event_type)
+            DO UPDATE SET count = count + excluded.count
+        ''', rows)
+        if commit:
+            self.conn.commit()
+
+    def get_event_counts(self, granularity, since, until=None):
+        """Rows of (bucket_start, event_type, count) for buckets in [since, until)."""
+        query = "SELECT bucket_start, event_type, count FROM event_rollups WHERE granularity = ? AND bucket_start >= ?"
+        params = [granularity, since]
+        if until is not None:
+            query += " AND bucket_start < ?"
+            params.append(until)
+        return self.conn.execute(query + " ORDER BY bucket_start, event_type", params).fetchall()
+
+    def prune_rollups(self, granularity, before, commit=True):
+        """Delete *granularity* buckets of both rollup tables that start before *before*."""
+        deleted = 0
+        for table in ("event_rollups", "dwell_rollups"):
+            deleted += self.conn.execute(
+                f"DELETE FROM {table} WHERE granularity = ? AND bucket_start < ?", (granularity, before)
+            ).rowcount
+        if commit:
+            self.conn.commit()
+        return deleted
+
+    def get_rollup_state(self, name, default=None):
+        row = self.conn.execute("SELECT value FROM rollup_state WHERE name = ?", (name,)).fetchone()
+        return json.loads(row[0]) if row else default
+
+    def set_rollup_state(self, name, value, commit=True):
+        self.conn.execute(
+            "INSERT OR REPLACE INTO rollup_state (name, value) VALUES (?, ?)", (name, json.dumps(value))
+        )
+        if commit:
+            self.conn.commit()
+
+    # Replay Buffer Methods
+    def add_transition(self, session_id, policy, state, action, reward, learned=False, commit=True):
+        """Record one decision (*state* is a JSON-serializable dict) and the reward of its session.
+
+        *learned* marks a transition the engine has already applied to its online policy.
+        """
+        self.conn.execute('''
+            INSERT INTO replay_buffer (session_id, policy, state, action, reward, learned, timestamp)
+            VALUES (?, ?, ?, ?, ?, ?, ?)
+        ''', (session_id, policy, json.dumps(state), action, reward, int(learned), datetime.now().isoformat()))
+        if commit:
+            self.conn.commit()
+
+    @timed("db.get_transitions")
+    def get_transitions(self, after_id=0, limit=None):
+        """Rows of (id, session_id, policy, state dict, action, reward, learned) with id > *after_id*, oldest first."""
+        query = ("SELECT id, session_id, policy, state, action, reward, learned FROM replay_buffer "
+                 "WHERE id > ? ORDER BY id")
+        params = [after_id]
+        if limit is not None:
+            query += " LIMIT ?"
+            params.append(limit)
+        return [
+            (row_id, session_id, policy, json.loads(state), action, reward, bool(learned))
+            for row_id, session_id, policy, state, action, reward, learned in self.conn.execute(query, params)
+        ]
+
+    def prune_transitions(self, keep=10_000, commit=True):
+        """Keep only the newest *keep* transitions."""
+        deleted = self.conn.execute('''
+            DELETE FROM replay_buffer WHERE id <= (SELECT MAX(id) FROM replay_buffer) - ?
+        ''', (keep,)).rowcount
+        if commit:
+            self.conn.commit()
+        return deleted
+
     def close(self):
         self.conn.close()
 
@@ -147,23 +421,219 @@ class Database:
     # Kanban Board (KantuBoard) persistence helpers
     # ------------------------------------------------------------------
 
-    def save_board_state(self, state_dict):
-        """Persist full board state (dict) as JSON in the single-row table."""
-        import json, datetime
-        payload = json.dumps(state_dict, indent=2)
-        ts = datetime.datetime.now().isoformat()
+    BOARD_COLUMNS = ("backlog", "now", "done")
+    # Smallest gap between neighbouring cards that is still split for a midpoint;
+    # below it the column is renumbered before ~50 halvings exhaust float precision
+    BOARD_POSITION_EPSILON = 1e-6
+
+    def _migrate_board_state(self):
+        """Explode a legacy ``board_state`` JSON blob into ``board_cards`` rows.
+
+        Runs once: the blob row is deleted after its cards have been copied.
+        """
+        cursor = self.conn.cursor()
+        cursor.execute('SELECT state_json FROM board_state WHERE id = 1')
+        row = cursor.fetchone()
+        if not row:
+            return
+        cursor.execute('SELECT COUNT(*) FROM board_cards')
+        if cursor.fetchone()[0] == 0 and row[0]:
+            self.save_board_state(json.loads(row[0]), commit=False)
+        cursor.execute('DELETE FROM board_state WHERE id = 1')
+        self.conn.commit()
+
+    def next_board_position(self, column):
+        """Position just past the last card of *column*."""
+        cursor = self.conn.cursor()
+        cursor.execute('''
+            SELECT MAX(position) FROM board_cards WHERE column_name = ?
+        ''', (column,))
+        result = cursor.fetchone()[0]
+        return result + 1 if result is not None else 0
+
+    def board_position_between(self, column, before_id=None, after_id=None):
+        """Position for a card placed between cards *before_id* and *after_id* of *column*.
+
+        Either neighbour may be None for the start or end of the column. Returns
+        None when the two are too close to split; renumber the column and retry.
+        """
+        if after_id is None:
+            return self.next_board_position(column)
+        cursor = self.conn.cursor()
+        cursor.execute('SELECT position FROM board_cards WHERE id = ?', (after_id,))
+        after = cursor.fetchone()[0]
+        if before_id is None:
+            return after - 1
+        cursor.execute('SELECT position FROM board_cards WHERE id = ?', (before_id,))
+        before = cursor.fetchone()[0]
+        if after - before < self.BOARD_POSITION_EPSILON:
+            return None
+        return (before + after) / 2
+
+    def renumber_board_column(self, column):
+        """Reset *column* to positions 0, 1, 2, ... in its current order; returns ``{id: position}``."""
+        cursor = self.conn.cursor()
+        cursor.execute('''
+            SELECT id FROM board_cards WHERE column_name = ? ORDER BY position, id
+        ''', (column,))
+        positions = {card_id: float(i) for i, (card_id,) in enumerate(cursor.fetchall())}
+        cursor.executemany('UPDATE board_cards SET position = ? WHERE id = ?',
+                           [(position, card_id) for card_id, position in positions.items()])
+        self.conn.commit()
+        return positions
+
+    def add_board_card(self, column, card, position=None):
+        """Insert a single card at the end of *column* (or at *position*); return its id."""
+        if position is None:
+            position = self.next_board_position(column)
+        cursor = self.conn.cursor()
+        cursor.execute('''
+            INSERT INTO board_cards (column_name, position, payload, updated_at)
+            VALUES (?, ?, ?, ?)
+        ''', (column, position, json.dumps(card), datetime.now().isoformat()))
+        self.conn.commit()
+        return cursor.lastrowid
+
+    def update_board_card(self, card_id, card):
+        """Overwrite the payload of an existing card."""
+        cursor = self.conn.cursor()
+        cursor.execute('''
+            UPDATE board_cards SET payload = ?, updated_at = ? WHERE id = ?
+        ''', (json.dumps(card), datetime.now().isoformat(), card_id))
+        self.conn.commit()
+
+    def move_board_card(self, card_id, column, position=None):
+        """Move a card to *column*, appending it unless *position* is given.
+
+        Positions are REAL, so a card dropped between two others can take the
+        midpoint of their positions without renumbering the rest of the column.
+        """
+        if position is None:
+            position = self.next_board_position(column)
         cursor = self.conn.cursor()
         cursor.execute('''
-            INSERT INTO board_state (id, state_json, updated_at)
-            VALUES (1, ?, ?)
-            ON CONFLICT(id) DO UPDATE SET state_json = excluded.state_json, updated_at = excluded.updated_at
-        ''', (payload, ts))
+            UPDATE board_cards SET column_name = ?, position = ?, updated_at = ? WHERE id = ?
+        ''', (column, position, datetime.now().isoformat(), card_id))
+        self.conn.commit()
+
+    def delete_board_card(self, card_id):
+        cursor = self.conn.cursor()
+        cursor.execute('DELETE FROM board_cards WHERE id = ?', (card_id,))
         self.conn.commit()
 
+    @timed("db.save_board_state")
+    def save_board_state(self, state_dict, commit=True):
+        """Replace every card with the contents of *state_dict* in one transaction.
+
+        Kept for full snapshots (seeding, migration); day-to-day edits should use
+        the per-card helpers above.
+        """
+        ts = datetime.now().isoformat()
+        rows = [
+            (column, position, json.dumps(card), ts)
+            for column in self.BOARD_COLUMNS
+            for position, card in enumerate(state_dict.get(column, []))
+        ]
+        cursor = self.conn.cursor()
+        cursor.execute('DELETE FROM board_cards')
+        cursor.executemany('''
+            INSERT INTO board_cards (column_name, position, payload, updated_at)
+            VALUES (?, ?, ?, ?)
+        ''', rows)
+        if commit:
+            self.conn.commit()
+
+    def has_board_state(self):
+        """True once any card has ever been written to the board."""
+        cursor = self.conn.cursor()
+        cursor.execute("SELECT seq FROM sqlite_sequence WHERE name = 'board_cards'")
+        return cursor.fetchone() is not None
+
+    @timed("db.load_board_column")
+    def load_board_column(self, column, limit=None, after_position=None):
+        """Return cards of *column* ordered by position, optionally one page at a time.
+
+        Pages are keyed on position, so fetching the next page never rescans
+        the rows that were already loaded.
+        """
+        query = 'SELECT id, position, payload FROM board_cards WHERE column_name = ?'
+        params = [column]
+        if after_position is not None:
+            query += ' AND position > ?'
+            params.append(after_position)
+        query += ' ORDER BY position'
+        if limit is not None:
+            query += ' LIMIT ?'
+            params.append(limit)
+        cursor = self.conn.cursor()
+        cursor.execute(query, params)
+        cards = []
+        for card_id, position, payload in cursor.fetchall():
+            card = json.loads(payload)
+            card["id"] = card_id
+            card["position"] = position
+            cards.append(card)
+        return cards
+
+    def count_board_cards(self, column):
+        cursor = self.conn.cursor()
+        cursor.execute('SELECT COUNT(*) FROM board_cards WHERE column_name = ?', (column,))
+        return cursor.fetchone()[0]
+
     def load_board_state(self):
-        """Return board state dict if stored, else None."""
-        import json
+        """Return ``{column: [card dict with "id", ...]}``, or None if the board was never saved."""
+        if not self.has_board_state():
+            return None
+        return {column: self.load_board_column(column) for column in self.BOARD_COLUMNS}
+
+    @timed("db.archive_done_cards")
+    def archive_done_cards(self, keep_recent=500):
+        """Move all but the *keep_recent* most recently moved (or edited) Done cards
+        into ``board_cards_archive``.
+
+        Recency is the card's ``updated_at``, which every move and edit stamps;
+        drag-and-drop can put a just-finished card anywhere in the column, so
+        position says nothing about when it was done. Returns the number of cards archived.
+        """
         cursor = self.conn.cursor()
-        cursor.execute('SELECT state_json FROM board_state WHERE id = 1')
-        row = cursor.fetchone()
-        return json.loads(row[0]) if row and row[0] else None
+        stale = '''
+            SELECT id FROM board_cards WHERE column_name = 'done'
+            ORDER BY COALESCE(updated_at, '') DESC, id DESC LIMIT -1 OFFSET ?
+        '''
+        archived_at = datetime.now().isoformat()
+        cursor.execute(f'''
+            INSERT OR REPLACE INTO board_cards_archive
+                (id, column_name, position, payload, updated_at, archived_at)
+            SELECT id, column_name, position, payload, COALESCE(updated_at, ''), ?
+            FROM board_cards WHERE id IN ({stale})
+        ''', (archived_at, keep_recent))
+        archived = cursor.rowcount
+        if archived:
+            cursor.execute(f'DELETE FROM board_cards WHERE id IN ({stale})', (keep_recent,))
+        self.conn.commit()
+        return archived
+
+    def load_archived_cards(self, limit=100, before=None):
+        """Return archived Done cards, most recently finished first, one page at a time.
+
+        Cards are ordered by the ``updated_at`` they had when archived, ties broken
+        by id. Pass ``before=(card["updated_at"], card["id"])`` of the last card of
+        a page to get the next one.
+        """
+        query = 'SELECT id, position, payload, updated_at FROM board_cards_archive'
+        params = []
+        if before is not None:
+            query += ' WHERE (updated_at, id) < (?, ?)'
+            params.extend(before)
+        query += ' ORDER BY updated_at DESC, id DESC LIMIT ?'
+        params.append(limit)
+        cursor = self.conn.cursor()
+        cursor.execute(query, params)
+        cards = []
+        for card_id, position, payload, updated_at in cursor.fetchall():
+            card = json.loads(payload)
+            card["id"] = card_id
+            card["position"] = position
+            card["updated_at"] = updated_at
+            cards.append(card)
+        return cards
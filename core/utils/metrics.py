@@ -0,0 +1,210 @@
+# metrics.py
+
+"""Lightweight in-process metrics: counters, gauges and latency histograms.
+
+Disabled unless ``FOCUSFORGE_METRICS=1`` is set (or ``registry.enable()`` is
+called); while disabled every helper is a single flag check. Hot paths are
+instrumented with the ``timed`` decorator or the ``timer`` context manager::
+
+    @timed("db.get_session_stats")
+    def get_session_stats(self): ...
+
+    with timer("engine.inference"):
+        action, _ = model.predict(obs)
+
+``MetricsExporter`` writes periodic snapshots to ``logs/metrics.json``.
+"""
+
+import contextlib
+import functools
+import os
+import threading
+import time
+from bisect import bisect_left
+
+from .atomic_io import atomic_write_json
+
+METRICS_FILE = "logs/metrics.json"
+
+# Latency bucket upper bounds in seconds: 1 µs doubling up to ~67 s
+BUCKETS = tuple(1e-6 * 2 ** i for i in range(27))
+
+
+class Histogram:
+    """Fixed exponential buckets, so observing is O(log buckets) and memory is constant."""
+
+    __slots__ = ("counts", "count", "total", "min", "max")
+
+    def __init__(self):
+        self.counts = [0] * (len(BUCKETS) + 1)
+        self.count = 0
+        self.total = 0.0
+        self.min = float("inf")
+        self.max = 0.0
+
+    def observe(self, value):
+        self.counts[bisect_left(BUCKETS, value)] += 1
+        self.count += 1
+        self.total += value
+        if value < self.min:
+            self.min = value
+        if value > self.max:
+            self.max = value
+
+    def percentile(self, q):
+        """Upper bound of the bucket holding the *q*-th percentile (0-100)."""
+        if not self.count:
+            return 0.0
+        rank = q / 100 * self.count
+        seen = 0
+        for i, n in enumerate(self.counts):
+            seen += n
+            if seen >= rank:
+                return min(BUCKETS[i], self.max) if i < len(BUCKETS) else self.max
+        return self.max
+
+    def summary(self):
+        return {
+            "count": self.count,
+            "sum": self.total,
+            "mean": self.total / self.count if self.count else 0.0,
+            "min": self.min if self.count else 0.0,
+            "max": self.max,
+            "p50": self.percentile(50),
+            "p95": self.percentile(95),
+            "p99": self.percentile(99),
+        }
+
+
+class MetricsRegistry:
+    def __init__(self, enabled=False):
+        self.enabled = enabled
+        self._lock = threading.Lock()
+        self.reset()
+
+    def enable(self):
+        self.enabled = True
+
+    def disable(self):
+        self.enabled = False
+
+    def reset(self):
+        with self._lock:
+            self.counters = {}
+            self.gauges = {}
+            self.histograms = {}
+
+    def inc(self, name, amount=1):
+        if not self.enabled:
+            return
+        with self._lock:
+            self.counters[name] = self.counters.get(name, 0) + amount
+
+    def set_gauge(self, name, value):
+        if not self.enabled:
+            return
+        self.gauges[name] = value
+
+    def observe(self, name, value):
+        if not self.enabled:
+            return
+        with self._lock:
+            histogram = self.histograms.get(name)
+            if histogram is None:
+                histogram = self.histograms[name] = Histogram()
+            histogram.observe(value)
+
+    def snapshot(self):
+        with self._lock:
+            return {
+                "timestamp": time.time(),
+                "counters": dict(self.counters),
+                "gauges": dict(self.gauges),
+                "histograms": {name: h.summary() for name, h in self.histograms.items()},
+            }
+
+
+registry = MetricsRegistry(enabled=os.environ.get("FOCUSFORGE_METRICS", "") not in ("", "0", "false"))
+
+
+# ----------------------------------------------------------------------
+# Instrumentation helpers
+# ----------------------------------------------------------------------
+
+def inc(name, amount=1):
+    registry.inc(name, amount)
+
+
+def set_gauge(name, value):
+    registry.set_gauge(name, value)
+
+
+@contextlib.contextmanager
+def _timer(name):
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        registry.observe(name, time.perf_counter() - started)
+
+
+_NULL_TIMER = contextlib.nullcontext()
+
+
+def timer(name):
+    """Context manager recording the block's latency under *name*."""
+    if not registry.enabled:
+        return _NULL_TIMER
+    return _timer(name)
+
+
+def timed(name):
+    """Decorator recording each call's latency (and so its call count) under *name*."""
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if not registry.enabled:
+                return func(*args, **kwargs)
+            started = time.perf_counter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                registry.observe(name, time.perf_counter() - started)
+        return wrapper
+    return decorator
+
+
+# ----------------------------------------------------------------------
+# Export
+# ----------------------------------------------------------------------
+
+class MetricsExporter:
+    """Background thread writing ``registry.snapshot()`` to *path* every *interval* seconds."""
+
+    def __init__(self, path=METRICS_FILE, interval=30.0, metrics=None):
+        self.path = path
+        self.interval = interval
+        self.metrics = metrics or registry
+        self._stop = threading.Event()
+        self._thread = None
+
+    def start(self):
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._run, name="metrics-exporter", daemon=True)
+            self._thread.start()
+        return self
+
+    def stop(self):
+        """Stop the thread and write a final snapshot."""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout=self.interval + 1)
+            self._thread = None
+        self.export()
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            self.export()
+
+    def export(self):
+        atomic_write_json(self.path, self.metrics.snapshot(), indent=2, sort_keys=True)
@@ -0,0 +1,87 @@
+# shutdown.py
+
+"""Bounded, run-once application shutdown.
+
+Workers register a non-blocking ``signal`` and a ``wait(timeout)``. On
+``shutdown()`` every worker is signalled first, so they all wind down in
+parallel, then each is waited for out of one shared time budget. Final
+steps (the focus report, the last metrics snapshot) run once afterwards,
+in registration order::
+
+    coordinator = ShutdownCoordinator(timeout=3)
+    coordinator.add_worker("tracker", detector.request_stop, detector.wait_stopped)
+    coordinator.add_final_step("focus report", write_final_report)
+    app.aboutToQuit.connect(coordinator.shutdown)
+
+Calling ``shutdown()`` again returns the first result without redoing
+anything, so several quit paths can share one coordinator.
+"""
+
+import time
+
+from . import metrics
+
+
+class ShutdownCoordinator:
+    def __init__(self, timeout=3.0, clock=time.monotonic):
+        """
+        Args:
+            timeout (float): Seconds all workers together get to finish after being signalled.
+        """
+        self.timeout = timeout
+        self.clock = clock
+        self.workers = []
+        self.final_steps = []
+        self.result = None
+
+    def add_worker(self, name, signal, wait=None):
+        """*signal()* must return at once; *wait(timeout)* returns True once the worker has finished."""
+        self.workers.append((name, signal, wait))
+
+    def add_final_step(self, name, func):
+        self.final_steps.append((name, func))
+
+    def shutdown(self):
+        """Stop everything once; returns ``{"seconds", "steps", "stalled"}``."""
+        if self.result is not None:
+            return self.result
+        started = self.clock()
+        steps = {}
+        stalled = []
+
+        for name, signal, _ in self.workers:
+            self._run(name, signal)
+
+        deadline = started + self.timeout
+        for name, _, wait in self.workers:
+            if wait is None:
+                continue
+            step_started = self.clock()
+            if not self._run(name, wait, max(0.0, deadline - self.clock())):
+                stalled.append(name)
+            steps[name] = self.clock() - step_started
+
+        for name, func in self.final_steps:
+            step_started = self.clock()
+            self._run(name, func)
+            steps[name] = self.clock() - step_started
+
+        seconds = self.clock() - started
+        metrics.registry.observe("shutdown.seconds", seconds)
+        self.result = {
+            "seconds": round(seconds, 3),
+            "steps": {name: round(t, 3) for name, t in steps.items()},
+            "stalled": stalled,
+        }
+        note = f" (gave up waiting for {', '.join(stalled)})" if stalled else ""
+        print(f"✅ Shutdown finished in {seconds:.2f}s{note}")
+        return self.result
+
+    @staticmethod
+    def _run(name, func, *args):
+        try:
+            return func(*args)
+        except Exception as e:
+            # Keep going: one failing step must not block the rest of shutdown
+            print(f"⚠️ Shutdown step '{name}' failed: {e}")
+            return False
@@ -0,0 +1,265 @@
+# synthetic_data.py
+
+"""Seeded synthetic workloads: sessions, distraction events, tasks and boards.
+
+Used to fill a FocusForge database and distraction log with months of
+realistic-looking data for benchmarks, load tests and RL training::
+
+    python -m core.utils.synthetic_data --days 90 --db synthetic.db --log synthetic_log.jsonl
+"""
+
+import argparse
+import json
+import math
+import os
+import random
+from datetime import datetime, timedelta
+
+from .database import Database
+from ..trackers.events import Event, to_ns
+
+WORK_APPS = [
+    ("Visual Studio Code", 30), ("Cursor", 15), ("PyCharm", 10), ("ChatGPT", 10),
+    ("Terminal", 10), ("Notion", 5), ("Slack", 5),
+]
+DISTRACTION_APPS = [
+    ("YouTube - Google Chrome", 30), ("Twitter / X", 20), ("Reddit - Firefox", 15),
+    ("Discord", 15), ("Netflix", 5), ("Instagram", 10), ("Steam", 5),
+]
+TASK_VERBS = ["Implement", "Refactor", "Fix", "Document", "Review", "Design", "Test", "Plan"]
+TASK_NOUNS = ["login flow", "database layer", "KantuBoard", "analytics tab", "timer engine",
+              "report export", "settings dialog", "RL policy", "tracker daemon", "API client"]
+SKILLS = ["Grit", "Discipline", "Charisma", "Precision"]
+PLANNED_DURATIONS = [15, 20, 25, 25, 25, 30, 30, 45, 50, 60]
+
+
+class SyntheticWorkload:
+    """Deterministic generator for a single simulated user.
+
+    The same *seed* and parameters always produce the same data. Weekdays get
+    more sessions than weekends, long sessions and distraction-heavy sessions
+    are completed less often, and window titles are drawn from weighted work
+    and distraction app mixtures.
+    """
+
+    def __init__(self, seed=42, start=None, days=90, sessions_per_day=6,
+                 poll_interval=5, distraction_rate=0.25):
+        self.seed = seed
+        self.start = start or datetime(2025, 1, 6, 0, 0, 0)
+        self.days = days
+        self.sessions_per_day = sessions_per_day
+        self.poll_interval = poll_interval
+        self.distraction_rate = distraction_rate
+
+    def _rng(self, stream):
+        # Independent streams so e.g. adding board cards does not change sessions
+        return random.Random(f"{self.seed}:{stream}")
+
+    @staticmethod
+    def _weighted(rng, choices):
+        names, weights = zip(*choices)
+        return rng.choices(names, weights=weights)[0]
+
+    def task_title(self, rng):
+        return f"{rng.choice(TASK_VERBS)} {rng.choice(TASK_NOUNS)}"
+
+    # ------------------------------------------------------------------
+    # Sessions
+    # ------------------------------------------------------------------
+    def session_plan(self):
+        """Yield ``(start_time, planned_minutes, distraction_level)`` for every session."""
+        rng = self._rng("sessions")
+        for day in range(self.days):
+            date = self.start + timedelta(days=day)
+            weekend = date.weekday() >= 5
+            mean = self.sessions_per_day * (0.3 if weekend else 1.0)
+            count = max(0, int(round(rng.gauss(mean, math.sqrt(mean) if mean else 0))))
+            clock = date.replace(hour=9) + timedelta(minutes=rng.randrange(0, 90))
+            for _ in range(count):
+                planned = rng.choice(PLANNED_DURATIONS)
+                level = rng.betavariate(2, 6) if rng.random() > self.distraction_rate else rng.betavariate(5, 3)
+                yield clock, planned, level
+                clock += timedelta(minutes=planned + rng.choice([5, 5, 10, 15]) + rng.randrange(0, 30))
+
+    def sessions(self):
+        """Yield rows in ``sessions`` column order (without id)."""
+        rng = self._rng("outcomes")
+        for started, planned, level in self.session_plan():
+            distractions = int(rng.expovariate(1 / (1 + 12 * level)))
+            p_complete = max(0.05, 0.95 - 0.006 * (planned - 15) - 0.6 * level)
+            completed = int(rng.random() < p_complete)
+            actual = planned if completed else planned * rng.uniform(0.1, 0.9)
+            break_duration = rng.choice([5, 5, 10, 15])
+            yield (
+                planned, round(actual, 2), 1, break_duration, self.task_title(rng),
+                completed, distractions, started.isoformat(),
+            )
+
+    # ------------------------------------------------------------------
+    # Distraction events
+    # ------------------------------------------------------------------
+    def events(self, include_polls=True):
+        """Yield typed distraction Events, oldest first."""
+        rng = self._rng("events")
+        window = None
+        previous_dwell = 0
+        for started, planned, level in self.session_plan():
+            now = started
+            end = started + timedelta(minutes=planned)
+            while now < end:
+                distracted = rng.random() < level
+                app = self._weighted(rng, DISTRACTION_APPS if distracted else WORK_APPS)
+                dwell = min(rng.lognormvariate(math.log(90 if distracted else 300), 0.8),
+                            (end - now).total_seconds())
+                dwell = max(dwell, self.poll_interval)
+                yield self._event(now, "App Switch", {
+                    "previous_window": window,
+                    "new_window": app,
+                    "duration_in_previous_window": round(previous_dwell, 2) if window else 0,
+                })
+                window = app
+                previous_dwell = dwell
+                if include_polls:
+                    polls = int(dwell // self.poll_interval)
+                    kind = "Distraction" if distracted else "Work App Usage"
+                    for i in range(polls):
+                        yield self._event(now + timedelta(seconds=i * self.poll_interval), kind, {"window": app})
+                if rng.random() < 0.02 + 0.1 * level:
+                    idle = rng.randrange(300, 900, self.poll_interval)
+                    idle_start = now + timedelta(seconds=dwell)
+                    for i in range(idle // self.poll_interval):
+                        yield self._event(idle_start + timedelta(seconds=i * self.poll_interval),
+                                          "Inactivity", {"message": "User inactive for too long!"})
+                    dwell += idle
+                now += timedelta(seconds=dwell)
+
+    @staticmethod
+    def _event(when, event_type, details):
+        return Event.from_details(to_ns(when), event_type, details)
+
+    # ------------------------------------------------------------------
+    # Tasks and board
+    # ------------------------------------------------------------------
+    def tasks(self, count=50):
+        """Yield rows for the ``tasks`` table: (description, priority, estimated_time, completed, created_at)."""
+        rng = self._rng("tasks")
+        for i in range(count):
+            created = self.start + timedelta(minutes=rng.randrange(self.days * 24 * 60))
+            yield (self.task_title(rng), rng.choice([1, 2, 3]), rng.choice([25, 50, 75, 100]),
+                   int(rng.random() < 0.5), created.isoformat())
+
+    def board_state(self, cards=300):
+        """Return a KantuBoard state dict with *cards* cards, most of them in Done."""
+        rng = self._rng("board")
+
+        def card():
+            return {
+                "title": self.task_title(rng),
+                "description": "",
+                "xp_value": rng.choice([1, 2, 3, 5, 8, 13]),
+                "skill_target": rng.choice(SKILLS),
+            }
+        backlog = cards // 4
+        now = min(cards - backlog, max(1, cards // 20))
+        return {
+            "backlog": [card() for _ in range(backlog)],
+            "now": [card() for _ in range(now)],
+            "done": [card() for _ in range(cards - backlog - now)],
+        }
+
+
+# ----------------------------------------------------------------------
+# Writers
+# ----------------------------------------------------------------------
+
+def write_sessions(db, rows, batch_size=10_000):
+    """Bulk-insert session rows; returns the number written."""
+    written = 0
+    batch = []
+    for row in rows:
+        batch.append(row)
+        if len(batch) >= batch_size:
+            written += _insert_sessions(db, batch)
+            batch = []
+    written += _insert_sessions(db, batch)
+    return written
+
+
+def _insert_sessions(db, batch):
+    if not batch:
+        return 0
+    db.conn.executemany('''
+        INSERT INTO sessions (
+            work_duration_planned, work_duration_actual, break_taken,
+            break_duration, task, completed, distraction_events, timestamp
+        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+    ''', batch)
+    db.conn.commit()
+    return len(batch)
+
+
+def write_tasks(db, rows):
+    rows = list(rows)
+    db.conn.executemany('''
+        INSERT INTO tasks (description, priority, estimated_time, completed, created_at)
+        VALUES (?, ?, ?, ?, ?)
+    ''', rows)
+    db.conn.commit()
+    return len(rows)
+
+
+def write_distraction_log(path, events):
+    """Stream *events* into a JSONL distraction log; returns the number written."""
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    written = 0
+    with open(path, "w") as f:
+        for event in events:
+            f.write(json.dumps(event.to_record()) + "\n")
+            written += 1
+    return written
+
+
+def generate(db_path=None, log_path=None, seed=42, days=90, sessions_per_day=6,
+             tasks=50, board_cards=300, include_polls=True):
+    """Generate a full workload into *db_path* and/or *log_path*; returns counts."""
+    workload = SyntheticWorkload(seed=seed, days=days, sessions_per_day=sessions_per_day)
+    counts = {}
+    if db_path:
+        db = Database(db_path)
+        counts["sessions"] = write_sessions(db, workload.sessions())
+        counts["tasks"] = write_tasks(db, workload.tasks(tasks))
+        if board_cards:
+            db.save_board_state(workload.board_state(board_cards))
+            counts["board_cards"] = board_cards
+        db.close()
+    if log_path:
+        counts["events"] = write_distraction_log(log_path, workload.events(include_polls))
+    return counts
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Generate synthetic FocusForge data")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--days", type=int, default=90)
+    parser.add_argument("--sessions-per-day", type=float, default=6)
+    parser.add_argument("--tasks", type=int, default=50)
+    parser.add_argument("--board-cards", type=int, default=300)
+    parser.add_argument("--db", help="SQLite database to write sessions, tasks and board into")
+    parser.add_argument("--log", help="distraction log (JSONL) to write events into")
+    parser.add_argument("--no-polls", action="store_true",
+                        help="only emit App Switch/Inactivity events, not every 5 s poll")
+    args = parser.parse_args(argv)
+    if not args.db and not args.log:
+        parser.error("nothing to do: pass --db and/or --log")
+
+    counts = generate(
+        db_path=args.db, log_path=args.log, seed=args.seed, days=args.days,
+        sessions_per_day=args.sessions_per_day, tasks=args.tasks,
+        board_cards=args.board_cards, include_polls=not args.no_polls,
+    )
+    for name, count in counts.items():
+        print(f"✅ {count:,} {name}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,41 +1,17 @@
 import sys
-import json
 from PyQt5.QtWidgets import (QApplication, QMainWindow, QWidget, QVBoxLayout, 
-                            QHBoxLayout, QLabel, QPushButton, QListWidget, 
-                            QListWidgetItem, QInputDialog, QMessageBox,
+                            QHBoxLayout, QLabel, QPushButton, QListView,
+                            QAbstractItemView, QInputDialog, QMessageBox,
                             QTextEdit, QProgressBar, QFrame, QMenu)
-from PyQt5.QtCore import Qt, QMimeData, QTimer, pyqtSignal
-from PyQt5.QtGui import QDrag, QColor, QFont
+from PyQt5.QtCore import Qt, QTimer, pyqtSignal
+from PyQt5.QtGui import QColor, QFont
+from core.utils import metrics
 from core.utils.database import Database
 from meta_skills.levels.meta_skills import MetaSkills
+from .kantu_model import (TaskCard, KantuColumnModel, TaskCardDelegate,
+                          read_card_ref, read_card_json)
 from .skill_animations import XPAnimation, DevlogWriter
 
-class TaskCard(QListWidgetItem):
-    def __init__(self, title, description="", xp_value=5, skill_target="Grit"):
-        super().__init__(title)
-        self.description = description
-        self.xp_value = xp_value
-        self.skill_target = skill_target
-        self.setFlags(self.flags() | Qt.ItemIsDragEnabled)
-        
-    def to_dict(self):
-        return {
-            "title": self.text(),
-            "description": self.description,
-            "xp_value": self.xp_value,
-            "skill_target": self.skill_target
-        }
-    
-    @classmethod
-    def from_dict(cls, data):
-        card = cls(
-            data["title"], 
-            data["description"], 
-            data["xp_value"],
-            data.get("skill_target", "Grit")
-        )
-        return card
-
 class SkillProgressBar(QProgressBar):
     def __init__(self, parent=None):
         super().__init__(parent)
@@ -163,30 +139,34 @@ class SkillOverlay(QWidget):
         for widget in self.skill_widgets.values():
             widget.update_progress()
 
-class KantuColumn(QListWidget):
-    def __init__(self, title, parent=None):
+class KantuColumn(QListView):
+    def __init__(self, title, board=None, parent=None):
         super().__init__(parent)
+        self.board = board
+        self.column_key = title.lower()
+        self.card_model = KantuColumnModel(self.column_key, self)
+        self.setModel(self.card_model)
+        self.setItemDelegate(TaskCardDelegate(self))
+
+        # Every card has the same height, so the view can lay out and scroll
+        # huge columns without measuring each row
+        self.setUniformItemSizes(True)
+        self.setLayoutMode(QListView.Batched)
+        self.setBatchSize(200)
+        self.setVerticalScrollMode(QAbstractItemView.ScrollPerPixel)
+
+        self.setSelectionMode(QAbstractItemView.SingleSelection)
         self.setAcceptDrops(True)
         self.setDragEnabled(True)
-        self.setDragDropMode(QListWidget.DragDrop)
+        self.setDragDropMode(QAbstractItemView.DragDrop)
+        self.setDefaultDropAction(Qt.MoveAction)
         self.setStyleSheet("""
-            QListWidget {
+            QListView {
                 background-color: #2D2D2D;
                 border: 1px solid #3D3D3D;
                 border-radius: 5px;
                 padding: 5px;
             }
-            QListWidget::item {
-                background-color: #3D3D3D;
-                border: 1px solid #4D4D4D;
-                border-radius: 3px;
-                padding: 5px;
-                margin: 2px;
-                color: #FFFFFF;
-            }
-            QListWidget::item:selected {
-                background-color: #4D4D4D;
-            }
         """)
         
         # Add column title
@@ -203,36 +183,61 @@ class KantuColumn(QListWidget):
         # Context menu
         self.setContextMenuPolicy(Qt.CustomContextMenu)
         self.customContextMenuRequested.connect(self.open_context_menu)
-        
-    def dragEnterEvent(self, event):
-        if event.mimeData().hasFormat("application/x-taskcard"):
-            event.accept()
-        else:
-            event.ignore()
-            
+
+    def add_card(self, card: TaskCard):
+        self.card_model.insert_card(card)
+
+    def cards(self):
+        return self.card_model.cards()
+
+    def clear(self):
+        self.card_model.clear()
+
+    def drop_row(self, pos):
+        """Row a card dropped at *pos* should be inserted at."""
+        index = self.indexAt(pos)
+        if not index.isValid():
+            return self.card_model.rowCount()
+        if self.dropIndicatorPosition() == QAbstractItemView.BelowItem:
+            return index.row() + 1
+        return index.row()
+
     def dropEvent(self, event):
-        if event.mimeData().hasFormat("application/x-taskcard"):
-            event.accept()
-            data = event.mimeData().data("application/x-taskcard")
-            task_data = json.loads(data.data().decode())
-            card = TaskCard.from_dict(task_data)
-            self.addItem(card)
-            
-            # If dropped in Done column, award XP
-            if self.title_label.text() == "Done":
-                self.parent().award_xp(card)
-            
-            # Persist board state after every drop
-            if hasattr(self.parent(), 'save_tasks'):
-                self.parent().save_tasks()
-        else:
+        if self.board is None:
             event.ignore()
+            return
+        mime = event.mimeData()
+        row = self.drop_row(event.pos())
+        source = event.source()
+        ref = read_card_ref(mime)
+
+        if isinstance(source, KantuColumn) and ref is not None:
+            # Same process: move the existing record, keeping its identity
+            card_id, source_row = ref
+            source_row = source.card_model.find_card(card_id, source_row)
+            if source_row < 0:
+                event.ignore()
+                return
+            self.board.move_card(source, source_row, self, row)
+        else:
+            # Another process: only the JSON copy is available
+            card = read_card_json(mime)
+            if card is None:
+                event.ignore()
+                return
+            self.board.card_added(card, self, row)
+            self.card_model.insert_card(card, row)
+
+        # The move is already done; report a copy so Qt leaves the source alone
+        event.setDropAction(Qt.CopyAction)
+        event.accept()
 
     # ---------------------- Context Menu ---------------------- #
     def open_context_menu(self, position):
-        item = self.itemAt(position)
-        if item is None:
+        index = self.indexAt(position)
+        if not index.isValid():
             return
+        item = self.card_model.card_at(index.row())
 
         menu = QMenu(self)
         edit_action = menu.addAction("✏️ Edit")
@@ -242,25 +247,32 @@ class KantuColumn(QListWidget):
         action = menu.exec_(self.viewport().mapToGlobal(position))
 
         if action == edit_action:
-            new_title, ok = QInputDialog.getText(self, "Edit Task", "Task Title:", text=item.text())
+            new_title, ok = QInputDialog.getText(self, "Edit Task", "Task Title:", text=item.title)
             if ok and new_title:
-                item.setText(new_title)
+                item.title = new_title
+                self.card_model.card_changed(item)
                 # Optionally, edit description/xp later
+                if self.board is not None:
+                    self.board.card_edited(item)
         elif action == delete_action:
-            row = self.row(item)
-            self.takeItem(row)
+            self.card_model.remove_card(item)
+            if self.board is not None:
+                self.board.card_deleted(item)
         elif action == duplicate_action:
-            clone = TaskCard(item.text(), getattr(item, 'description', ''), getattr(item, 'xp_value', 5), getattr(item, 'skill_target', 'Grit'))
-            self.addItem(clone)
-
-        # Persist board state after any change
-        if hasattr(self.parent(), 'save_tasks'):
-            self.parent().save_tasks()
+            clone = TaskCard(item.title, item.description, item.xp_value, item.skill_target)
+            if self.board is not None:
+                self.board.card_added(clone, self)
+            self.add_card(clone)
 
 class KantuBoard(QMainWindow):
-    def __init__(self):
+    # Done cards beyond this many are moved to cold storage when the board opens
+    DONE_ARCHIVE_KEEP = 500
+    # Done is streamed into the view this many cards at a time
+    DONE_PAGE_SIZE = 200
+
+    def __init__(self, db=None):
         super().__init__()
-        self.db = Database()
+        self.db = db or Database()
         self.setWindowTitle("Kantu Board - Focus Forge")
         self.setStyleSheet("""
             QMainWindow {
@@ -290,9 +302,9 @@ class KantuBoard(QMainWindow):
         board_layout = QVBoxLayout()
         
         # Create columns
-        self.backlog = KantuColumn("Backlog")
-        self.now = KantuColumn("Now")
-        self.done = KantuColumn("Done")
+        self.backlog = KantuColumn("Backlog", board=self)
+        self.now = KantuColumn("Now", board=self)
+        self.done = KantuColumn("Done", board=self)
         
         # Add columns to layout
         columns_layout = QHBoxLayout()
@@ -345,8 +357,8 @@ class KantuBoard(QMainWindow):
                     )
                     if ok:
                         card = TaskCard(title, description, xp, skill)
-                        self.backlog.addItem(card)
-                        self.save_tasks()
+                        self.card_added(card, self.backlog)
+                        self.backlog.add_card(card)
                 
     def award_xp(self, card: TaskCard):
         old_level = self.skill_manager.get_skill(card.skill_target).level
@@ -364,7 +376,7 @@ class KantuBoard(QMainWindow):
                     f"🎉 {card.skill_target} leveled up to {new_level}!",
                     card.skill_target,
                     card.xp_value,
-                    card.text(),
+                    card.title,
                     True
                 )
             else:
@@ -372,56 +384,114 @@ class KantuBoard(QMainWindow):
                     message,
                     card.skill_target,
                     card.xp_value,
-                    card.text(),
+                    card.title,
                     False
                 )
             
             self.skill_overlay.update_skills()
-            self.save_tasks()
                 
     # ------------------------------------------------------------------
-    # Persistence helpers (Database-backed instead of tasks.json)
+    # Persistence helpers (one board_cards row per card, O(1) writes per edit)
     # ------------------------------------------------------------------
 
+    def position_for(self, column: KantuColumn, row=None):
+        """Board position for a card about to be inserted at *row* of *column*.
+
+        Takes the midpoint between the neighbouring cards so no other row is
+        rewritten; appending falls back to the end of the column in SQLite,
+        which also covers Done cards that have not been paged in yet. Once
+        repeated drops at one spot leave no room between two neighbours, the
+        column is renumbered and the midpoint taken again.
+        """
+        model = column.card_model
+        count = model.rowCount()
+        if row is None or row >= count:
+            return self.db.next_board_position(column.column_key)
+        after = model.card_at(row).card_id
+        before = model.card_at(row - 1).card_id if row > 0 else None
+        position = self.db.board_position_between(column.column_key, before, after)
+        if position is None:
+            model.reposition(self.db.renumber_board_column(column.column_key))
+            position = self.db.board_position_between(column.column_key, before, after)
+        return position
+
+    def card_added(self, card: TaskCard, column: KantuColumn, row=None):
+        card.position = self.position_for(column, row)
+        card.card_id = self.db.add_board_card(column.column_key, card.to_dict(), card.position)
+
+    def move_card(self, source: KantuColumn, source_row, target: KantuColumn, row):
+        """Move the card at *source_row* of *source* to *row* of *target*."""
+        if source is target and row > source_row:
+            row -= 1
+        card = source.card_model.take_card(source_row)
+        card.position = self.position_for(target, row)
+        target.card_model.insert_card(card, row)
+        self.db.move_board_card(card.card_id, target.column_key, card.position)
+
+        # Only award XP when a card newly reaches Done, not when reordering it
+        if target is self.done and source is not self.done:
+            self.award_xp(card)
+
+    def card_edited(self, card: TaskCard):
+        if card.card_id is not None:
+            self.db.update_board_card(card.card_id, card.to_dict())
+
+    def card_deleted(self, card: TaskCard):
+        if card.card_id is not None:
+            self.db.delete_board_card(card.card_id)
+
     def _current_state(self):
         """Return board state as serialisable dict."""
         return {
-            "backlog": [item.to_dict() for item in self.get_items(self.backlog)],
-            "now": [item.to_dict() for item in self.get_items(self.now)],
-            "done": [item.to_dict() for item in self.get_items(self.done)]
+            "backlog": [card.to_dict() for card in self.backlog.cards()],
+            "now": [card.to_dict() for card in self.now.cards()],
+            "done": [card.to_dict() for card in self.done.cards()]
         }
 
     def save_tasks(self):
-        """Persist board to SQLite via core.utils.database.Database."""
+        """Write a full snapshot of the board and reload card ids.
+
+        Only needed for bulk changes; single-card edits go through the
+        ``card_*`` helpers above.
+        """
+        self.done.card_model.fetch_all()
         self.db.save_board_state(self._current_state())
+        for column in (self.backlog, self.now, self.done):
+            column.clear()
+        self.load_tasks()
 
+    @metrics.timed("kantu_board.load_tasks")
     def load_tasks(self):
-        state = self.db.load_board_state()
-        if state is None:
+        """Load Backlog and Now eagerly and stream Done in pages as it is scrolled."""
+        if not self.db.has_board_state():
             # First run: seed with sample tasks
             sample_tasks = [
                 TaskCard("Initialize Focus Forge", "Set up core architecture", 10, "Grit"),
                 TaskCard("Design UI Framework", "Create base UI components", 5, "Precision"),
                 TaskCard("Implement Database", "Set up SQLite schema", 8, "Discipline")
             ]
-            for task in sample_tasks:
-                self.backlog.addItem(task)
+            self.backlog.card_model.set_cards(sample_tasks)
             self.save_tasks()
             return
 
-        # Populate columns from loaded state
-        for task in state.get("backlog", []):
-            self.backlog.addItem(TaskCard.from_dict(task))
-        for task in state.get("now", []):
-            self.now.addItem(TaskCard.from_dict(task))
-        for task in state.get("done", []):
-            self.done.addItem(TaskCard.from_dict(task))
+        metrics.inc("kantu_board.archived_done_cards",
+                    self.db.archive_done_cards(keep_recent=self.DONE_ARCHIVE_KEEP))
+
+        for column in (self.backlog, self.now):
+            column.card_model.set_cards(
+                TaskCard.from_dict(task) for task in self.db.load_board_column(column.column_key)
+            )
+        self.done.card_model.set_fetcher(self._fetch_done_page, self.DONE_PAGE_SIZE)
+        self.done.card_model.fetchMore()
+
+    def _fetch_done_page(self, after_position, limit):
+        return [
+            TaskCard.from_dict(task)
+            for task in self.db.load_board_column("done", limit=limit, after_position=after_position)
+        ]
 
-    def get_items(self, list_widget):
-        return [list_widget.item(i) for i in range(list_widget.count())]
-        
     def closeEvent(self, event):
-        self.save_tasks()
+        # Every edit is already persisted as it happens
         event.accept()
 
 def main():
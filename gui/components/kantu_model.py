@@ -0,0 +1,295 @@
+# gui/components/kantu_model.py
+
+"""Model/view building blocks for KantuBoard columns.
+
+Cards are plain ``__slots__`` records held in a list by a
+``QAbstractListModel``; the view only asks for the rows it paints, so a
+column with thousands of cards costs one small Python object per card
+instead of a ``QListWidgetItem`` per card.
+"""
+
+import json
+import sys
+
+from PyQt5.QtCore import (Qt, QAbstractListModel, QModelIndex, QMimeData,
+                          QRectF, QSize)
+from PyQt5.QtGui import QColor, QFont, QPainter, QPainterPath, QPen
+from PyQt5.QtWidgets import QStyle, QStyledItemDelegate
+
+# Full card as JSON, for drops coming from another process
+TASKCARD_MIME = "application/x-taskcard"
+# Card id and source row, for drags within this process
+TASKCARD_REF_MIME = "application/x-taskcard-ref"
+CARD_HEIGHT = 44
+
+
+class TaskCard:
+    """Compact record for a single board card."""
+
+    __slots__ = ("card_id", "position", "title", "description", "xp_value", "skill_target")
+
+    def __init__(self, title, description="", xp_value=5, skill_target="Grit", card_id=None,
+                 position=None):
+        self.card_id = card_id
+        self.position = position
+        self.title = title
+        self.description = description
+        self.xp_value = xp_value
+        # Only a handful of skills exist, so share one string object per skill
+        self.skill_target = sys.intern(skill_target)
+
+    def text(self):
+        return self.title
+
+    def to_dict(self):
+        return {
+            "title": self.title,
+            "description": self.description,
+            "xp_value": self.xp_value,
+            "skill_target": self.skill_target
+        }
+
+    @classmethod
+    def from_dict(cls, data):
+        return cls(
+            data["title"],
+            data.get("description", ""),
+            data.get("xp_value", 5),
+            data.get("skill_target", "Grit"),
+            data.get("id"),
+            data.get("position")
+        )
+
+
+class KantuColumnModel(QAbstractListModel):
+    """List model holding the cards of one board column."""
+
+    CardRole = Qt.UserRole + 1
+
+    def __init__(self, column_key, parent=None):
+        super().__init__(parent)
+        self.column_key = column_key
+        self._cards = []
+
+        # Incremental loading state (see set_fetcher)
+        self._fetcher = None
+        self._page_size = 0
+        self._fetch_after = None
+        self._fetch_after_id = None
+        self._exhausted = True
+        self._local_ids = set()
+
+    # ---------------------- Qt model API ---------------------- #
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._cards)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid() or index.row() >= len(self._cards):
+            return None
+        card = self._cards[index.row()]
+        if role == Qt.DisplayRole:
+            return card.title
+        if role == Qt.ToolTipRole:
+            return card.description or None
+        if role == self.CardRole:
+            return card
+        return None
+
+    def flags(self, index):
+        if not index.isValid():
+            return Qt.ItemIsDropEnabled
+        return Qt.ItemIsEnabled | Qt.ItemIsSelectable | Qt.ItemIsDragEnabled
+
+    def supportedDropActions(self):
+        # Drops are finished as CopyAction so Qt never deletes the source row
+        # itself; KantuColumn.dropEvent moves the card record instead.
+        return Qt.MoveAction | Qt.CopyAction
+
+    def supportedDragActions(self):
+        return Qt.MoveAction | Qt.CopyAction
+
+    def mimeTypes(self):
+        return [TASKCARD_REF_MIME, TASKCARD_MIME]
+
+    def mimeData(self, indexes):
+        mime = QMimeData()
+        if indexes:
+            row = indexes[0].row()
+            card = self._cards[row]
+            ref = {"card_id": card.card_id, "row": row}
+            mime.setData(TASKCARD_REF_MIME, json.dumps(ref).encode())
+            mime.setData(TASKCARD_MIME, json.dumps(card.to_dict()).encode())
+        return mime
+
+    def canFetchMore(self, parent=QModelIndex()):
+        return not parent.isValid() and not self._exhausted
+
+    def fetchMore(self, parent=QModelIndex()):
+        if parent.isValid() or self._exhausted:
+            return
+        page = self._fetcher(self._fetch_after, self._page_size)
+        if len(page) < self._page_size:
+            self._exhausted = True
+        if page:
+            self._fetch_after = page[-1].position
+            self._fetch_after_id = page[-1].card_id
+        # A card dropped here before its page was reached moves from where it was
+        # shown to its place in position order
+        arrived = self._local_ids.intersection(card.card_id for card in page)
+        local = {}
+        for row in range(len(self._cards) - 1, -1, -1) if arrived else ():
+            if self._cards[row].card_id in arrived:
+                card = self.take_card(row)
+                local[card.card_id] = card
+        self._local_ids -= arrived
+        self.append_cards(local.get(card.card_id, card) for card in page)
+
+    def removeRows(self, row, count, parent=QModelIndex()):
+        if parent.isValid() or row < 0 or row + count > len(self._cards):
+            return False
+        self.beginRemoveRows(parent, row, row + count - 1)
+        del self._cards[row:row + count]
+        self.endRemoveRows()
+        return True
+
+    # ---------------------- Card helpers ---------------------- #
+    def cards(self):
+        return list(self._cards)
+
+    def card_at(self, row):
+        return self._cards[row]
+
+    def find_card(self, card_id, row_hint=None):
+        """Return the row of the card with *card_id*, checking *row_hint* first."""
+        if row_hint is not None and 0 <= row_hint < len(self._cards):
+            if self._cards[row_hint].card_id == card_id:
+                return row_hint
+        for row, card in enumerate(self._cards):
+            if card.card_id == card_id:
+                return row
+        return -1
+
+    def set_cards(self, cards):
+        self.beginResetModel()
+        self._cards = list(cards)
+        self._fetcher = None
+        self._exhausted = True
+        self._local_ids.clear()
+        self.endResetModel()
+
+    def set_fetcher(self, fetcher, page_size=200):
+        """Load the column lazily, *page_size* cards at a time.
+
+        *fetcher* is called as ``fetcher(after_position, limit)`` and returns
+        the next TaskCards in position order. The view pulls further pages
+        through canFetchMore/fetchMore as the user scrolls.
+        """
+        self.beginResetModel()
+        self._cards = []
+        self._fetcher = fetcher
+        self._page_size = page_size
+        self._fetch_after = None
+        self._fetch_after_id = None
+        self._exhausted = False
+        self._local_ids.clear()
+        self.endResetModel()
+
+    def fetch_all(self):
+        while self.canFetchMore():
+            self.fetchMore()
+
+    def append_cards(self, cards):
+        cards = list(cards)
+        if not cards:
+            return
+        first = len(self._cards)
+        self.beginInsertRows(QModelIndex(), first, first + len(cards) - 1)
+        self._cards.extend(cards)
+        self.endInsertRows()
+
+    def insert_card(self, card, row=None):
+        if row is None or row > len(self._cards):
+            row = len(self._cards)
+        if not self._exhausted and card.card_id is not None:
+            self._local_ids.add(card.card_id)
+        self.beginInsertRows(QModelIndex(), row, row)
+        self._cards.insert(row, card)
+        self.endInsertRows()
+
+    def reposition(self, positions):
+        """Apply ``{card id: position}`` after the column was renumbered in the database."""
+        for card in self._cards:
+            if card.card_id in positions:
+                card.position = positions[card.card_id]
+        if self._fetch_after_id in positions:
+            self._fetch_after = positions[self._fetch_after_id]
+
+    def remove_card(self, card):
+        self.removeRows(self._cards.index(card), 1)
+
+    def take_card(self, row):
+        card = self._cards[row]
+        self.removeRows(row, 1)
+        return card
+
+    def card_changed(self, card):
+        index = self.index(self._cards.index(card))
+        self.dataChanged.emit(index, index)
+
+    def clear(self):
+        self.set_cards([])
+
+
+def read_card_ref(mime):
+    """Return ``(card_id, row)`` from an in-process drag, or None."""
+    if not mime.hasFormat(TASKCARD_REF_MIME):
+        return None
+    ref = json.loads(bytes(mime.data(TASKCARD_REF_MIME)).decode())
+    return ref["card_id"], ref["row"]
+
+
+def read_card_json(mime):
+    """Return a new, unsaved TaskCard from a cross-process drag, or None."""
+    if not mime.hasFormat(TASKCARD_MIME):
+        return None
+    data = json.loads(bytes(mime.data(TASKCARD_MIME)).decode())
+    data.pop("id", None)
+    data.pop("position", None)
+    return TaskCard.from_dict(data)
+
+
+class TaskCardDelegate(QStyledItemDelegate):
+    """Paints a card as a rounded box with its title and XP reward."""
+
+    def sizeHint(self, option, index):
+        return QSize(option.rect.width(), CARD_HEIGHT)
+
+    def paint(self, painter, option, index):
+        card = index.data(KantuColumnModel.CardRole)
+        if card is None:
+            return
+        painter.save()
+        painter.setRenderHint(QPainter.Antialiasing)
+
+        rect = QRectF(option.rect).adjusted(2, 2, -2, -2)
+        path = QPainterPath()
+        path.addRoundedRect(rect, 3, 3)
+        selected = option.state & QStyle.State_Selected
+        painter.fillPath(path, QColor("#4D4D4D" if selected else "#3D3D3D"))
+        painter.setPen(QPen(QColor("#4D4D4D"), 1))
+        painter.drawPath(path)
+
+        text_rect = rect.adjusted(8, 0, -8, 0)
+        painter.setPen(QColor("#AAAAAA"))
+        badge = f"+{card.xp_value} {card.skill_target}"
+        painter.drawText(text_rect, Qt.AlignRight | Qt.AlignVCenter, badge)
+
+        badge_width = painter.fontMetrics().horizontalAdvance(badge) + 12
+        title_rect = text_rect.adjusted(0, 0, -badge_width, 0)
+        font = QFont(option.font)
+        font.setBold(True)
+        painter.setFont(font)
+        painter.setPen(QColor("#FFFFFF"))
+        title = painter.fontMetrics().elidedText(card.title, Qt.ElideRight, int(title_rect.width()))
+        painter.drawText(title_rect, Qt.AlignLeft | Qt.AlignVCenter, title)
+        painter.restore()
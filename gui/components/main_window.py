@@ -2,26 +2,34 @@
 
 import sys
 import time
-import numpy as np
 from PyQt5.QtWidgets import (
     QMainWindow, QPushButton, QVBoxLayout,
     QWidget, QLabel, QLineEdit, QMessageBox, QListWidget, QComboBox,
-    QTableWidget, QTableWidgetItem, QProgressBar, QTabWidget, QHBoxLayout, QFrame,
+    QTableView, QProgressBar, QTabWidget, QHBoxLayout, QFrame,
     QInputDialog
 )
-from PyQt5.QtCore import QTimer, Qt
-import matplotlib.pyplot as plt
+from PyQt5.QtCore import QTimer, Qt, QThreadPool
+from matplotlib.figure import Figure
 from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
 from PyQt5.QtGui import QFont
 from ..dialogs.settings_dialog import SettingsDialog
 from core.utils.database import Database
-from core.trackers.advanced_distraction import AdvancedDistractionDetector
 from core.analytics.focus_report import FocusReport
 from .kantu_board import KantuBoard
 from .skill_animations import XPAnimation, DevlogWriter
+from .session_stats import SessionStatsModel, format_metrics_html
+from .session_chart import SessionHistoryChart
+from .session_transition import SessionTransitionTask, notify
+from .session_table import SessionTableModel
 from core.engine.decision_engine import DecisionEngine
+from core.utils.countdown import CountdownTimer
 
 class MainWindow(QMainWindow):
+    # Number of most recent sessions shown in the Analytics chart
+    CHART_WINDOW = 200
+    # Label refresh interval; remaining time comes from CountdownTimer's deadline
+    TICK_MS = 250
+
     def __init__(self, distraction_detector, *args, **kwargs):
         super().__init__(*args, **kwargs)
         print("MainWindow __init__ called with distraction_detector:", distraction_detector)
@@ -32,15 +40,31 @@ class MainWindow(QMainWindow):
         self.decision_engine = DecisionEngine(self.db, self.distraction_detector)
         self.distraction_detector.start_monitoring()
 
-        # Initialize time_left before calling init_ui
+        # Initialize the countdown before calling init_ui
         self.is_work = True
-        self.time_left = self.decision_engine.work_duration * 60  # in seconds
+        self.countdown = CountdownTimer(self.decision_engine.work_duration * 60)
         self.distractions = 0
 
+        # Session statistics are computed once per change and pushed to the widgets
+        self.stats_model = SessionStatsModel(self.db, chart_window=self.CHART_WINDOW, parent=self)
+
         self.init_ui()
+        self.stats_model.statsChanged.connect(self.update_dashboard_focus_progress)
+        self.stats_model.statsChanged.connect(self.update_dashboard_metrics)
+        self.stats_model.statsChanged.connect(self.update_analytics_focus_progress)
+        self.stats_model.statsChanged.connect(self.update_analytics_metrics)
+        self.stats_model.statsChanged.connect(self.plot_session_history)
+        self.stats_model.statsChanged.connect(self.load_sessions)
+        self.stats_model.refresh()
+
         self.timer = QTimer()
         self.timer.timeout.connect(self.update_timer)
 
+        # Session transitions run one at a time off the GUI thread
+        self.transition_pool = QThreadPool(self)
+        self.transition_pool.setMaxThreadCount(1)
+        self._transition_task = None
+
     def init_ui(self):
         # Central Widget
         central_widget = QWidget()
@@ -83,14 +107,11 @@ class MainWindow(QMainWindow):
         self.focus_progress = QProgressBar()
         self.focus_progress.setRange(0, 100)
         dashboard_layout.addWidget(self.focus_progress)
-        print("Calling update_dashboard_focus_progress()")
-        self.update_dashboard_focus_progress()
 
         # Performance Metrics
         self.metrics_label = QLabel()
         self.metrics_label.setStyleSheet("font-size: 14px;")
         dashboard_layout.addWidget(self.metrics_label)
-        self.update_dashboard_metrics()
 
         # Add Dashboard Layout to Tab
         dashboard_tab.setLayout(dashboard_layout)
@@ -130,14 +151,22 @@ class MainWindow(QMainWindow):
         history_tab = QWidget()
         history_layout = QVBoxLayout()
 
-        # Session History Table
-        self.session_table = QTableWidget()
-        self.session_table.setColumnCount(6)
-        self.session_table.setHorizontalHeaderLabels(["Task", "Work Planned", "Work Actual", "Break Taken", "Distractions", "Completed"])
+        # Session History Filter
+        self.session_filter = QLineEdit()
+        self.session_filter.setPlaceholderText("Filter sessions by task")
+        self.session_filter.textChanged.connect(self.filter_sessions)
+        history_layout.addWidget(self.session_filter)
+
+        # Session History Table (pages through the full history on demand)
+        self.session_model = SessionTableModel(self.db, parent=self)
+        self.session_table = QTableView()
+        self.session_table.setModel(self.session_model)
         self.session_table.horizontalHeader().setStretchLastSection(True)
-        self.session_table.setEditTriggers(QTableWidget.NoEditTriggers)
+        self.session_table.horizontalHeader().setSortIndicator(-1, Qt.DescendingOrder)
+        self.session_table.setSortingEnabled(True)
+        self.session_table.setEditTriggers(QTableView.NoEditTriggers)
+        self.session_table.verticalHeader().setDefaultSectionSize(24)
         history_layout.addWidget(self.session_table)
-        self.load_sessions()
 
         history_tab.setLayout(history_layout)
         tabs.addTab(history_tab, "Session History")
@@ -150,20 +179,17 @@ class MainWindow(QMainWindow):
         self.focus_progress_analytics = QProgressBar()
         self.focus_progress_analytics.setRange(0, 100)
         analytics_layout.addWidget(self.focus_progress_analytics)
-        print("Calling update_analytics_focus_progress()")
-        self.update_analytics_focus_progress()
 
         # Performance Metrics for Analytics
         self.metrics_label_analytics = QLabel()
         self.metrics_label_analytics.setStyleSheet("font-size: 14px;")
         analytics_layout.addWidget(self.metrics_label_analytics)
-        self.update_analytics_metrics()
 
         # Analytics Plots
-        self.figure = plt.figure(figsize=(5, 4))
+        self.figure = Figure(figsize=(5, 4))
         self.canvas = FigureCanvas(self.figure)
+        self.session_chart = SessionHistoryChart(self.figure, self.canvas, window=self.CHART_WINDOW)
         analytics_layout.addWidget(self.canvas)
-        self.plot_session_history()
 
         analytics_tab.setLayout(analytics_layout)
         tabs.addTab(analytics_tab, "Analytics")
@@ -242,7 +268,7 @@ class MainWindow(QMainWindow):
             QPushButton:hover {
                 background-color: #45a049;
             }
-            QLineEdit, QComboBox, QListWidget, QTableWidget, QProgressBar {
+            QLineEdit, QComboBox, QListWidget, QTableView, QProgressBar {
                 font-size: 14px;
             }
             QLabel {
@@ -255,54 +281,34 @@ class MainWindow(QMainWindow):
         settings_action.triggered.connect(self.show_settings)
 
     # Dashboard Specific Update Methods
-    def update_dashboard_focus_progress(self):
+    def update_dashboard_focus_progress(self, stats):
         """
         Updates the Dashboard's focus progress bar based on success rate.
         """
-        success_rate = self.db.get_success_rate()
+        success_rate = stats["success_rate"]
         self.focus_progress.setValue(int(success_rate))
         self.focus_progress.setFormat(f"Success Rate: {success_rate:.2f}%")
 
-    def update_dashboard_metrics(self):
+    def update_dashboard_metrics(self, stats):
         """
         Updates performance metrics in the Dashboard tab.
         """
-        success_rate = self.db.get_success_rate()
-        avg_work = self.db.get_average_work_duration()
-        avg_distractions = self.db.get_average_distractions()
-
-        metrics_text = f"""
-        <h3>Performance Metrics</h3>
-        <p><b>Success Rate:</b> {success_rate:.2f}%</p>
-        <p><b>Average Work Duration:</b> {avg_work:.2f} minutes</p>
-        <p><b>Average Distractions per Session:</b> {avg_distractions:.2f}</p>
-        """
-        self.metrics_label.setText(metrics_text)
+        self.metrics_label.setText(format_metrics_html(stats))
 
     # Analytics Specific Update Methods
-    def update_analytics_focus_progress(self):
+    def update_analytics_focus_progress(self, stats):
         """
         Updates the Analytics' focus progress bar based on success rate.
         """
-        success_rate = self.db.get_success_rate()
+        success_rate = stats["success_rate"]
         self.focus_progress_analytics.setValue(int(success_rate))
         self.focus_progress_analytics.setFormat(f"Success Rate: {success_rate:.2f}%")
 
-    def update_analytics_metrics(self):
+    def update_analytics_metrics(self, stats):
         """
         Updates performance metrics in the Analytics tab.
         """
-        success_rate = self.db.get_success_rate()
-        avg_work = self.db.get_average_work_duration()
-        avg_distractions = self.db.get_average_distractions()
-
-        metrics_text = f"""
-        <h3>Performance Metrics</h3>
-        <p><b>Success Rate:</b> {success_rate:.2f}%</p>
-        <p><b>Average Work Duration:</b> {avg_work:.2f} minutes</p>
-        <p><b>Average Distractions per Session:</b> {avg_distractions:.2f}</p>
-        """
-        self.metrics_label_analytics.setText(metrics_text)
+        self.metrics_label_analytics.setText(format_metrics_html(stats))
 
     def add_task(self):
         description = self.task_input.text().strip()
@@ -341,192 +347,129 @@ class MainWindow(QMainWindow):
 
     def start_timer(self):
         if not self.timer.isActive():
-            self.timer.start(1000)  # Update every second
+            self.countdown.start()
+            self.timer.start(self.TICK_MS)  # Ticks only refresh the label
             print("Timer started.")
 
     def pause_timer(self):
         if self.timer.isActive():
             self.timer.stop()
+            self.countdown.pause()
             print("Timer paused.")
 
     def reset_timer(self):
         self.timer.stop()
+        self.countdown.pause()
+        # Log the session as incomplete, with the time actually worked so far
+        if self.is_work:
+            self.log_session(completed=False)
         self.is_work = True
-        self.time_left = self.decision_engine.work_duration * 60
+        self.countdown.reset(self.decision_engine.work_duration * 60)
         self.timer_label.setText(self.format_time())
-        # Log the session as incomplete
-        self.log_session(completed=False)
-        QMessageBox.information(self, "Session Reset", "The current session has been reset and logged.")
+        notify(self, "Session Reset", "The current session has been reset and logged.")
 
     def format_time(self):
         """
-        Ensures time is formatted correctly as MM:SS.
-        Converts NumPy arrays to integers if necessary.
+        Formats the remaining time as MM:SS.
         """
-        if isinstance(self.time_left, np.ndarray):
-            self.time_left = int(self.time_left.item())
-
-        mins, secs = divmod(self.time_left, 60)
-        return f"{mins:02d}:{secs:02d}"
+        return self.countdown.format()
 
     def update_timer(self):
         """
-        Updates the countdown timer and handles session transitions.
+        Refreshes the countdown label and handles session transitions.
         """
-        if isinstance(self.time_left, np.ndarray):
-            self.time_left = int(self.time_left.item())
+        self.timer_label.setText(self.format_time())
+        if not self.countdown.is_finished():
+            return
 
-        if self.time_left > 0:
-            self.time_left = max(0, self.time_left - 1)  # Ensure it never goes below zero
-            self.timer_label.setText(self.format_time())  # No argument needed
+        self.timer.stop()  # Stop the countdown when the timer reaches zero
+        self.countdown.pause()
+
+        if self.is_work:
+            # Switch to break mode, then capture the finished session (with its
+            # break) before the countdown is reset
+            self.is_work = False
+            session = self.session_record(completed=True)
+            self.countdown.reset(self.decision_engine.break_duration * 60)
+            self.timer_label.setText(self.format_time())
+
+            # Log the session and apply AI-based adjustments on a worker
+            task = SessionTransitionTask(self.db.db_name, self.decision_engine, session)
+            task.signals.finished.connect(self.on_transition_finished)
+            task.signals.failed.connect(self.on_transition_failed)
+            self._transition_task = task
+            self.transition_pool.start(task)
+
+            # Notify the user
+            notify(self, "Break Time", "Time for a break!")
         else:
-            self.timer.stop()  # Stop the countdown when the timer reaches zero
-
-            if self.is_work:
-                # Switch to break mode
-                self.is_work = False
-                self.time_left = self.decision_engine.break_duration * 60
-                self.timer_label.setText(self.format_time())
-
-                # Notify the user
-                QMessageBox.information(self, "Break Time", "Time for a break!")
-
-                # Log completed work session
-                self.log_session(completed=True)
-
-                # Apply AI-based session adjustments
-                new_work, new_break = self.decision_engine.apply_rules()
-                self.decision_engine.work_duration = new_work
-                self.decision_engine.break_duration = new_break
-                self.time_left = new_work * 60  # Set next work duration
-                self.load_tasks()
-            else:
-                # Switch to work mode
-                self.is_work = True
-                self.time_left = self.decision_engine.work_duration * 60
-                self.timer_label.setText(self.format_time())
-
-                # Notify the user
-                QMessageBox.information(self, "Work Time", "Time to focus on your task!")
-
-            # Update UI elements
-            self.update_dashboard_focus_progress()
-            self.update_dashboard_metrics()
-            self.update_analytics_focus_progress()
-            self.update_analytics_metrics()
-            self.plot_session_history()
+            # Switch to work mode
+            self.is_work = True
+            self.countdown.reset(self.decision_engine.work_duration * 60)
+            self.timer_label.setText(self.format_time())
+
+            # Notify the user
+            notify(self, "Work Time", "Time to focus on your task!")
+
+    def on_transition_finished(self, durations):
+        """Apply the durations computed by SessionTransitionTask."""
+        self._transition_task = None
+        self.decision_engine.work_duration = durations["work_duration"]
+        self.decision_engine.break_duration = durations["break_duration"]
+        if not self.is_work:
+            # The break may already be running; keep the time spent so far
+            self.countdown.set_duration(self.decision_engine.break_duration * 60)
+            self.timer_label.setText(self.format_time())
+        self.load_tasks()
+        self.stats_model.invalidate()
 
-    def log_session(self, completed):
+    def on_transition_failed(self, message):
+        self._transition_task = None
+        print(f"Session transition failed: {message}")
+        self.stats_model.invalidate()
+
+    def session_record(self, completed):
         """
-        Logs the session details into the database.
+        Snapshots the current session for Database.log_session and clears the distraction logs.
         """
-        task = self.get_current_task()
-        distractions = self.distraction_detector.logger.get_summary()["total_distractions"]
-        self.db.log_session(
+        record = dict(
             work_planned=self.decision_engine.work_duration,
-            work_actual=(self.decision_engine.work_duration * 60 - self.time_left) / 60 if completed else (self.decision_engine.work_duration * 60 - self.time_left) / 60,
+            work_actual=self.countdown.elapsed() / 60,
             break_taken=1 if not self.is_work else 0,
             break_duration=self.decision_engine.break_duration if not self.is_work else 0,
-            task=task,
+            task=self.get_current_task(),
             completed=1 if completed else 0,
-            distractions=distractions
+            distractions=self.distraction_detector.logger.get_summary()["total_distractions"]
         )
-        self.distraction_detector.logger.logs.clear()  # Clear logs after logging the session
-        self.load_sessions()
-        self.plot_session_history()
-
-        # Update UI elements
-        self.update_dashboard_focus_progress()
-        self.update_dashboard_metrics()
-        self.update_analytics_focus_progress()
-        self.update_analytics_metrics()
+        self.distraction_detector.logger.clear()  # Start a new window after logging the session
+        return record
 
-    def load_sessions(self):
-        """
-        Loads recent sessions into the session history table.
-        """
-        sessions = self.db.get_recent_sessions(limit=20)
-        self.session_table.setRowCount(len(sessions))
-        for row, session in enumerate(sessions):
-            # session indices:
-            # 0: id, 1: work_planned, 2: work_actual, 3: break_taken, 4: break_duration,
-            # 5: task, 6: completed, 7: distraction_events, 8: timestamp
-            self.session_table.setItem(row, 0, QTableWidgetItem(session[5]))
-            self.session_table.setItem(row, 1, QTableWidgetItem(str(session[1])))
-            self.session_table.setItem(row, 2, QTableWidgetItem(str(session[2])))
-            self.session_table.setItem(row, 3, QTableWidgetItem("Yes" if session[3] else "No"))
-            self.session_table.setItem(row, 4, QTableWidgetItem(str(session[7])))
-            self.session_table.setItem(row, 5, QTableWidgetItem("Yes" if session[6] else "No"))
-
-    def update_dashboard_focus_progress(self):
+    def log_session(self, completed):
         """
-        Updates the Dashboard's focus progress bar based on success rate.
+        Logs the session details into the database.
         """
-        success_rate = self.db.get_success_rate()
-        self.focus_progress.setValue(int(success_rate))
-        self.focus_progress.setFormat(f"Success Rate: {success_rate:.2f}%")
+        self.db.log_session(**self.session_record(completed))
 
-    def update_dashboard_metrics(self):
-        """
-        Updates performance metrics in the Dashboard tab.
-        """
-        success_rate = self.db.get_success_rate()
-        avg_work = self.db.get_average_work_duration()
-        avg_distractions = self.db.get_average_distractions()
-
-        metrics_text = f"""
-        <h3>Performance Metrics</h3>
-        <p><b>Success Rate:</b> {success_rate:.2f}%</p>
-        <p><b>Average Work Duration:</b> {avg_work:.2f} minutes</p>
-        <p><b>Average Distractions per Session:</b> {avg_distractions:.2f}</p>
-        """
-        self.metrics_label.setText(metrics_text)
+        # Update UI elements (coalesced with any other pending refresh)
+        self.stats_model.invalidate()
 
-    def update_analytics_focus_progress(self):
+    def load_sessions(self, stats=None):
         """
-        Updates the Analytics' focus progress bar based on success rate.
+        Reloads the session history table from its first page.
         """
-        success_rate = self.db.get_success_rate()
-        self.focus_progress_analytics.setValue(int(success_rate))
-        self.focus_progress_analytics.setFormat(f"Success Rate: {success_rate:.2f}%")
+        self.session_model.refresh()
 
-    def update_analytics_metrics(self):
+    def filter_sessions(self, text):
         """
-        Updates performance metrics in the Analytics tab.
-        """
-        success_rate = self.db.get_success_rate()
-        avg_work = self.db.get_average_work_duration()
-        avg_distractions = self.db.get_average_distractions()
-
-        metrics_text = f"""
-        <h3>Performance Metrics</h3>
-        <p><b>Success Rate:</b> {success_rate:.2f}%</p>
-        <p><b>Average Work Duration:</b> {avg_work:.2f} minutes</p>
-        <p><b>Average Distractions per Session:</b> {avg_distractions:.2f}</p>
+        Filters the session history table by task (in SQL).
         """
-        self.metrics_label_analytics.setText(metrics_text)
+        self.session_model.set_task_filter(text)
 
-    def plot_session_history(self):
+    def plot_session_history(self, stats):
         """
         Plots the work duration over sessions.
         """
-        sessions = self.db.get_recent_sessions(limit=20)
-        if not sessions:
-            return
-        sessions = sessions[::-1]  # Oldest first
-        work_planned = [s[1] for s in sessions]
-        work_actual = [s[2] for s in sessions]
-        distractions = [s[7] for s in sessions]
-
-        self.figure.clear()
-        ax = self.figure.add_subplot(111)
-        ax.plot(work_planned, label='Planned Work Duration', marker='o')
-        ax.plot(work_actual, label='Actual Work Duration', marker='x')
-        ax.set_title('Work Duration Over Sessions')
-        ax.set_xlabel('Session')
-        ax.set_ylabel('Minutes')
-        ax.legend()
-        self.canvas.draw()
+        self.session_chart.update(stats["work_history"])
 
     def generate_report(self):
         """
@@ -540,7 +483,7 @@ class MainWindow(QMainWindow):
 
         report_text = f"""
         <h3>Focus Report Summary</h3>
-        <p><b>Total Sessions:</b> {len(report.logs)}</p>
+        <p><b>Total Sessions:</b> {report.event_count()}</p>
         <p><b>Total Distractions:</b> {summary['total_distractions']}</p>
         <p><b>Distractions by Type:</b> {summary['by_type']}</p>
         <h4>Recommendations:</h4>
@@ -559,19 +502,16 @@ class MainWindow(QMainWindow):
 
     def closeEvent(self, event):
         """
-        Handles the application close event to stop monitoring and generate reports.
+        Asks for confirmation before closing. Stopping the tracker and writing the
+        final report happen once, in the application's shutdown (see main.py).
         """
-        self.distraction_detector.stop_monitoring()
-        # Generate final report
-        focus_report = FocusReport()
-        focus_report.generate_report()
-        focus_report.export_csv()
-
         reply = QMessageBox.question(self, 'Quit',
                                      "Are you sure you want to quit?",
                                      QMessageBox.Yes | QMessageBox.No, QMessageBox.No)
 
         if reply == QMessageBox.Yes:
+            # Let a session that is being logged finish, but not hold up quitting for long
+            self.transition_pool.waitForDone(2000)
             event.accept()
         else:
             event.ignore()
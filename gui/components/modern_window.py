@@ -21,11 +21,17 @@ from PyQt5.QtCore import Qt, QTimer
 from ..dialogs.settings_dialog import SettingsDialog
 from core.utils.database import Database
 from core.engine.decision_engine import DecisionEngine
+from core.utils.countdown import CountdownTimer
+from .session_stats import SessionStatsModel, format_metrics_html
+from .tracker_bridge import TrackerBridge
 
 
 class MainWindow(QMainWindow):
     """Redesigned main window with sidebar navigation."""
 
+    # Label refresh interval; remaining time comes from CountdownTimer's deadline
+    TICK_MS = 250
+
     def __init__(self, distraction_detector, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.setWindowTitle("FocusForge")
@@ -37,11 +43,17 @@ class MainWindow(QMainWindow):
         self.distraction_detector.start_monitoring()
 
         self.is_work = True
-        self.time_left = self.decision_engine.work_duration * 60
+        self.countdown = CountdownTimer(self.decision_engine.work_duration * 60)
         self.timer = QTimer(self)
         self.timer.timeout.connect(self.update_timer)
 
+        self.stats_model = SessionStatsModel(self.db, parent=self)
+        self.tracker_bridge = TrackerBridge(distraction_detector, parent=self)
+
         self.init_ui()
+        self.tracker_bridge.inactivityChanged.connect(self.on_inactivity_changed)
+        self.stats_model.statsChanged.connect(self.update_stats)
+        self.stats_model.refresh()
 
     # ------------------------------------------------------------------
     # UI Setup
@@ -156,44 +168,64 @@ class MainWindow(QMainWindow):
         layout.addWidget(QLabel("Use the sidebar to open settings."))
         self.pages.addWidget(page)
 
+    def update_stats(self, stats: dict) -> None:
+        """Push the latest session statistics into dashboard and analytics."""
+        success_rate = int(stats["success_rate"])
+        metrics = format_metrics_html(stats)
+        for bar in (self.progress, self.analytics_progress):
+            bar.setValue(success_rate)
+            bar.setFormat(f"Success Rate: {stats['success_rate']:.2f}%")
+        self.metrics_label.setText(metrics)
+        self.analytics_label.setText(metrics)
+
+    def on_inactivity_changed(self, inactive: bool) -> None:
+        if inactive:
+            self.statusBar().showMessage("Inactive - time is not counted toward focus")
+        else:
+            self.statusBar().clearMessage()
+            self.stats_model.invalidate()
+
     def show_settings(self) -> None:
         dialog = SettingsDialog(self.decision_engine, self)
         if dialog.exec_():
-            self.time_left = self.decision_engine.work_duration * 60
+            if not self.countdown.is_running and self.is_work:
+                self.countdown.reset(self.decision_engine.work_duration * 60)
             self.update_timer_label()
 
     # ------------------------------------------------------------------
     # Timer helpers
     # ------------------------------------------------------------------
     def format_time(self) -> str:
-        minutes, seconds = divmod(self.time_left, 60)
-        return f"{int(minutes):02d}:{int(seconds):02d}"
+        return self.countdown.format()
 
     def update_timer_label(self) -> None:
         self.timer_label.setText(self.format_time())
 
     def start_timer(self) -> None:
         if not self.timer.isActive():
-            self.timer.start(1000)
+            self.countdown.start()
+            self.timer.start(self.TICK_MS)
 
     def pause_timer(self) -> None:
         if self.timer.isActive():
             self.timer.stop()
+            self.countdown.pause()
 
     def reset_timer(self) -> None:
         self.timer.stop()
         self.is_work = True
-        self.time_left = self.decision_engine.work_duration * 60
+        self.countdown.reset(self.decision_engine.work_duration * 60)
         self.update_timer_label()
 
     def update_timer(self) -> None:
-        self.time_left -= 1
-        if self.time_left <= 0:
+        if self.countdown.is_finished():
             if self.is_work:
-                self.time_left = self.decision_engine.break_duration * 60
+                self.countdown.reset(self.decision_engine.break_duration * 60)
             else:
-                self.time_left = self.decision_engine.work_duration * 60
+                self.countdown.reset(self.decision_engine.work_duration * 60)
+            self.countdown.start()
             self.is_work = not self.is_work
+            self.stats_model.invalidate()
         self.update_timer_label()
 
     def add_task(self) -> None:
@@ -0,0 +1,130 @@
+# gui/components/session_chart.py
+
+"""Incrementally updated work-duration chart for the Analytics tab."""
+
+import numpy as np
+from matplotlib.figure import Figure
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+
+
+def downsample(values, max_points):
+    """Average *values* into at most *max_points* evenly sized buckets.
+
+    Returns ``(x, y)`` where ``x`` is the centre session index of each bucket,
+    so long histories keep their shape without drawing thousands of markers.
+    """
+    y = np.asarray(values, dtype=float)
+    n = len(y)
+    if n <= max_points:
+        return np.arange(n, dtype=float), y
+    edges = np.linspace(0, n, max_points + 1).astype(int)
+    starts = edges[:-1]
+    counts = np.diff(edges)
+    means = np.add.reduceat(y, starts) / counts
+    centres = starts + (counts - 1) / 2
+    return centres, means
+
+
+class SessionHistoryChart:
+    """Planned vs. actual work duration chart that is built once and updated in place.
+
+    Axes, labels and legend are created a single time; ``update`` only swaps
+    the line data. On canvases that support blitting, the lines are drawn
+    over a cached background so a refresh only repaints the axes area, and a
+    full redraw happens only when the axis limits have to grow or shrink.
+    """
+
+    def __init__(self, figure=None, canvas=None, window=20, max_points=500, blit=None):
+        if figure is None:
+            # Off-screen: plain Agg figure that never touches Qt
+            figure = Figure(figsize=(5, 4))
+            canvas = FigureCanvasAgg(figure)
+        self.figure = figure
+        self.canvas = canvas or figure.canvas
+        self.window = window
+        self.max_points = max_points
+        if blit is None:
+            # Blitting only pays off on an on-screen canvas
+            blit = type(self.canvas) is not FigureCanvasAgg and getattr(self.canvas, "supports_blit", False)
+        self.blit = blit
+
+        self.ax = self.figure.add_subplot(111)
+        self.planned_line, = self.ax.plot([], [], label='Planned Work Duration', marker='o', animated=blit)
+        self.actual_line, = self.ax.plot([], [], label='Actual Work Duration', marker='x', animated=blit)
+        self.ax.set_title('Work Duration Over Sessions')
+        self.ax.set_xlabel('Session')
+        self.ax.set_ylabel('Minutes')
+        self.ax.legend(loc='upper left')
+
+        self._background = None
+        if blit:
+            self.canvas.mpl_connect('draw_event', self._on_draw)
+
+    # ------------------------------------------------------------------
+    # Drawing
+    # ------------------------------------------------------------------
+    def _on_draw(self, event):
+        """Cache everything but the lines after each full redraw."""
+        self._background = self.canvas.copy_from_bbox(self.figure.bbox)
+        self._draw_lines()
+
+    def _draw_lines(self):
+        self.ax.draw_artist(self.planned_line)
+        self.ax.draw_artist(self.actual_line)
+
+    def _limits_for(self, x, planned, actual):
+        x_max = max(float(x[-1]), 1.0) if len(x) else 1.0
+        y_max = max(float(np.nanmax(planned)) if len(planned) else 0.0,
+                    float(np.nanmax(actual)) if len(actual) else 0.0, 1.0)
+        # Round y up so small changes in the data do not force a full redraw
+        return (-0.5, x_max + 0.5), (0.0, np.ceil(y_max * 1.1 / 5) * 5)
+
+    def update(self, history):
+        """Show *history*, a sequence of ``(planned, actual)`` rows, oldest first."""
+        history = list(history)[-self.window:]
+        planned = [row[0] or 0 for row in history]
+        actual = [row[1] or 0 for row in history]
+        x, planned = downsample(planned, self.max_points)
+        _, actual = downsample(actual, self.max_points)
+
+        self.planned_line.set_data(x, planned)
+        self.actual_line.set_data(x, actual)
+
+        xlim, ylim = self._limits_for(x, planned, actual)
+        if xlim != tuple(self.ax.get_xlim()) or ylim != tuple(self.ax.get_ylim()):
+            self.ax.set_xlim(*xlim)
+            self.ax.set_ylim(*ylim)
+            self._background = None
+
+        if not self.blit:
+            self.canvas.draw_idle()
+        elif self._background is None:
+            # Limits changed or first paint: the draw_event re-caches the background
+            self.canvas.draw_idle()
+        else:
+            self.canvas.restore_region(self._background)
+            self._draw_lines()
+            self.canvas.blit(self.figure.bbox)
+
+    def set_window(self, window):
+        self.window = window
+
+    def save(self, path):
+        """Render the chart to an image file."""
+        lines = (self.planned_line, self.actual_line)
+        # Animated artists are skipped by a normal draw, so include them here
+        for line in lines:
+            line.set_animated(False)
+        try:
+            self.figure.savefig(path)
+        finally:
+            for line in lines:
+                line.set_animated(self.blit)
+
+
+def render_session_history(history, path, window=20, max_points=500):
+    """Render *history* straight to *path* without a Qt window or event loop."""
+    chart = SessionHistoryChart(window=window, max_points=max_points)
+    chart.update(history)
+    chart.save(path)
+    return path
@@ -0,0 +1,52 @@
+# gui/components/session_stats.py
+
+"""Shared, debounced session statistics for the dashboard and analytics views."""
+
+from PyQt5.QtCore import QObject, QTimer, pyqtSignal
+
+
+class SessionStatsModel(QObject):
+    """Recomputes session statistics once per data change and broadcasts them.
+
+    Widgets connect to ``statsChanged`` instead of querying the database
+    themselves. Callers that change session data call ``invalidate()``;
+    invalidations arriving within ``debounce_ms`` of each other collapse into
+    a single refresh.
+    """
+
+    statsChanged = pyqtSignal(dict)
+
+    def __init__(self, db, debounce_ms=200, chart_window=20, parent=None):
+        super().__init__(parent)
+        self.db = db
+        self.chart_window = chart_window
+        self.stats = {}
+
+        self._debounce = QTimer(self)
+        self._debounce.setSingleShot(True)
+        self._debounce.setInterval(debounce_ms)
+        self._debounce.timeout.connect(self.refresh)
+
+    def invalidate(self):
+        """Schedule a refresh, restarting the debounce window."""
+        self._debounce.start()
+
+    def refresh(self):
+        """Recompute statistics now and notify subscribers."""
+        self._debounce.stop()
+        stats = self.db.get_session_stats()
+        stats["work_history"] = self.db.get_work_history(limit=self.chart_window)
+        stats["focus_minutes_today"] = self.db.focus_seconds_today() / 60
+        self.stats = stats
+        self.statsChanged.emit(stats)
+
+
+def format_metrics_html(stats):
+    """Render the performance-metrics block shown on dashboard and analytics tabs."""
+    return f"""
+        <h3>Performance Metrics</h3>
+        <p><b>Success Rate:</b> {stats['success_rate']:.2f}%</p>
+        <p><b>Average Work Duration:</b> {stats['average_work_duration']:.2f} minutes</p>
+        <p><b>Average Distractions per Session:</b> {stats['average_distractions']:.2f}</p>
+        <p><b>Focus Today:</b> {stats.get('focus_minutes_today', 0):.0f} minutes</p>
+        """
@@ -0,0 +1,108 @@
+# gui/components/session_table.py
+
+"""Paged, SQL-sorted model for the Session History table."""
+
+from PyQt5.QtCore import Qt, QAbstractTableModel, QModelIndex
+
+# sessions row indices:
+# 0: id, 1: work_planned, 2: work_actual, 3: break_taken, 4: break_duration,
+# 5: task, 6: completed, 7: distraction_events, 8: timestamp
+SESSION_COLUMNS = [
+    # (header, row index, sessions column)
+    ("Task", 5, "task"),
+    ("Work Planned", 1, "work_duration_planned"),
+    ("Work Actual", 2, "work_duration_actual"),
+    ("Break Taken", 3, "break_taken"),
+    ("Distractions", 7, "distraction_events"),
+    ("Completed", 6, "completed"),
+]
+YES_NO_COLUMNS = {"break_taken", "completed"}
+
+
+class SessionTableModel(QAbstractTableModel):
+    """Session history loaded page by page as the view scrolls.
+
+    Sorting and filtering are pushed into SQL (Database.get_sessions_page);
+    only the pages the user has scrolled through are held in memory, and the
+    view only paints the visible ones.
+    """
+
+    def __init__(self, db, page_size=100, parent=None):
+        super().__init__(parent)
+        self.db = db
+        self.page_size = page_size
+        self.sort_column = "id"
+        self.descending = True
+        self.task_filter = ""
+        self._rows = []
+        self._exhausted = False
+
+    # ---------------------- Qt model API ---------------------- #
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._rows)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(SESSION_COLUMNS)
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role == Qt.DisplayRole and orientation == Qt.Horizontal:
+            return SESSION_COLUMNS[section][0]
+        return None
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid() or role != Qt.DisplayRole:
+            return None
+        _, row_index, column = SESSION_COLUMNS[index.column()]
+        value = self._rows[index.row()][row_index]
+        if column in YES_NO_COLUMNS:
+            return "Yes" if value else "No"
+        return "" if value is None else str(value)
+
+    def canFetchMore(self, parent=QModelIndex()):
+        return not parent.isValid() and not self._exhausted
+
+    def fetchMore(self, parent=QModelIndex()):
+        if parent.isValid() or self._exhausted:
+            return
+        after = None
+        if self._rows:
+            last = self._rows[-1]
+            after = (last[self._sort_index()], last[0])
+        page = self.db.get_sessions_page(
+            limit=self.page_size,
+            after=after,
+            sort_column=self.sort_column,
+            descending=self.descending,
+            task_filter=self.task_filter or None,
+        )
+        if len(page) < self.page_size:
+            self._exhausted = True
+        if page:
+            first = len(self._rows)
+            self.beginInsertRows(QModelIndex(), first, first + len(page) - 1)
+            self._rows.extend(page)
+            self.endInsertRows()
+
+    def sort(self, column, order=Qt.AscendingOrder):
+        # A negative column (no sort indicator) means newest sessions first
+        self.sort_column = SESSION_COLUMNS[column][2] if column >= 0 else "id"
+        self.descending = order == Qt.DescendingOrder
+        self.refresh()
+
+    # ---------------------- Helpers ---------------------- #
+    def _sort_index(self):
+        if self.sort_column == "id":
+            return 0
+        return next(i for _, i, column in SESSION_COLUMNS if column == self.sort_column)
+
+    def set_task_filter(self, text):
+        self.task_filter = text.strip()
+        self.refresh()
+
+    def refresh(self):
+        """Drop loaded pages and fetch the first page again."""
+        self.beginResetModel()
+        self._rows = []
+        self._exhausted = False
+        self.endResetModel()
+        self.fetchMore()
@@ -0,0 +1,56 @@
+# gui/components/session_transition.py
+
+"""Background work done when a Pomodoro work session ends."""
+
+from PyQt5.QtCore import Qt, QObject, QRunnable, pyqtSignal
+from PyQt5.QtWidgets import QMessageBox
+
+from core.utils.database import Database
+
+
+class TransitionSignals(QObject):
+    """Signals emitted by SessionTransitionTask (delivered on the GUI thread)."""
+
+    # {"work_duration": minutes, "break_duration": minutes}
+    finished = pyqtSignal(dict)
+    failed = pyqtSignal(str)
+
+
+class SessionTransitionTask(QRunnable):
+    """Log a finished session and compute the next durations off the GUI thread.
+
+    *session* holds the keyword arguments for ``Database.log_session`` and must
+    be captured on the GUI thread before the task is queued. The task opens its
+    own SQLite connection so it never shares a cursor with the UI.
+    """
+
+    def __init__(self, db_name, decision_engine, session):
+        super().__init__()
+        self.db_name = db_name
+        self.decision_engine = decision_engine
+        self.session = session
+        self.signals = TransitionSignals()
+
+    def run(self):
+        db = Database(self.db_name)
+        try:
+            db.log_session(**self.session)
+            new_work, new_break = self.decision_engine.apply_rules(db=db)
+        except Exception as e:
+            self.signals.failed.emit(str(e))
+            return
+        finally:
+            db.close()
+        self.signals.finished.emit({
+            "work_duration": float(new_work),
+            "break_duration": float(new_break),
+        })
+
+
+def notify(parent, title, text):
+    """Show a non-modal message that does not block the event loop."""
+    box = QMessageBox(QMessageBox.Information, title, text, QMessageBox.Ok, parent)
+    box.setModal(False)
+    box.setAttribute(Qt.WA_DeleteOnClose)
+    box.show()
+    return box
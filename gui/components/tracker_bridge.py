@@ -0,0 +1,30 @@
+# gui/components/tracker_bridge.py
+
+"""Deliver tracker updates from the tracker runtime to the GUI thread as Qt signals."""
+
+from PyQt5.QtCore import QObject, pyqtSignal
+
+
+class TrackerBridge(QObject):
+    """Re-emits the detector's ``(name, value)`` updates as typed signals.
+
+    The detector calls listeners from its own threads; emitting a signal
+    there queues delivery to slots living on the GUI thread, so widgets can
+    connect directly.
+    """
+
+    eventLogged = pyqtSignal(object)       # core.trackers.events.Event
+    inactivityChanged = pyqtSignal(bool)
+    textClassified = pyqtSignal(str, str)  # text, category
+
+    def __init__(self, detector, parent=None):
+        super().__init__(parent)
+        detector.add_listener(self._dispatch)
+
+    def _dispatch(self, name, value):
+        if name == "event":
+            self.eventLogged.emit(value)
+        elif name == "inactive":
+            self.inactivityChanged.emit(value)
+        elif name == "classified":
+            self.textClassified.emit(*value)
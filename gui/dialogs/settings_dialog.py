@@ -1,6 +1,8 @@
-from PyQt5.QtWidgets import QDialog, QPushButton, QFormLayout, QSpinBox, QCheckBox, QMessageBox
+from PyQt5.QtWidgets import QDialog, QPushButton, QFormLayout, QSpinBox, QCheckBox, QComboBox
 from PyQt5.QtCore import Qt
 
+from core.engine.policies import ENGINES
+
 class SettingsDialog(QDialog):
     """Modal dialog that allows users to tweak Pomodoro and UI settings."""
 
@@ -25,10 +27,11 @@ class SettingsDialog(QDialog):
         self.break_duration_spin.setValue(self.decision_engine.break_duration)
         layout.addRow("Default Break Duration (min):", self.break_duration_spin)
 
-        # Reinforcement Learning Toggle
-        self.rl_toggle = QCheckBox("Enable Reinforcement Learning Optimization")
-        self.rl_toggle.setChecked(self.decision_engine.model is not None)
-        layout.addRow(self.rl_toggle)
+        # Duration engine: fixed rules, online bandit or trained PPO model
+        self.engine_box = QComboBox()
+        self.engine_box.addItems(ENGINES)
+        self.engine_box.setCurrentText(self.decision_engine.policy.name)
+        layout.addRow("Duration Engine:", self.engine_box)
 
         # Dark Mode Toggle
         self.dark_mode_toggle = QCheckBox("Enable Dark Mode")
@@ -64,12 +67,9 @@ class SettingsDialog(QDialog):
         self.decision_engine.work_duration = self.work_duration_spin.value()
         self.decision_engine.break_duration = self.break_duration_spin.value()
 
-        # Reinforcement Learning Toggle Logic
-        if self.rl_toggle.isChecked() and not self.decision_engine.model:
-            # In a real application we might prompt to train or load a model here
-            QMessageBox.information(self, "RL Enabled", "Reinforcement Learning optimization is enabled.")
-        elif not self.rl_toggle.isChecked() and self.decision_engine.model:
-            QMessageBox.information(self, "RL Disabled", "Reinforcement Learning optimization is disabled.")
-            self.decision_engine.model = None
+        # Swap engines live; "ppo" falls back to the bandit when no trained model exists
+        engine = self.engine_box.currentText()
+        if engine != self.decision_engine.policy.name:
+            self.decision_engine.set_policy(engine)
 
         self.accept() 
\ No newline at end of file
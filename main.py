@@ -1,40 +1,68 @@
 # main.py
 
 import sys
+import threading
 from PyQt5.QtWidgets import QApplication
 # Import the new GUI from the package root
 from gui import MainWindow, SplashScreen
-from core.trackers.advanced_distraction import AdvancedDistractionDetector
-from core.analytics.focus_report import FocusReport
+from core.analytics.focus_report import generate_pending_report, write_final_report
+from core.analytics.rollups import RollupPipeline
+from core.engine.continual import LearnerProcess, PolicyStore
+from core.trackers import daemon
+from core.utils import metrics
+from core.utils.shutdown import ShutdownCoordinator
 
 print("Launching Focus Forge...")
 
 def main():
     app = QApplication(sys.argv)
-    distraction_detector = AdvancedDistractionDetector()
+
+    # --attach: tracking runs in a separate daemon process that outlives the GUI
+    attached = "--attach" in sys.argv
+    if attached:
+        distraction_detector = daemon.attach()
+    else:
+        # Loads pynput and the classifier, so only imported when tracking in-process
+        from core.trackers.advanced_distraction import AdvancedDistractionDetector
+        distraction_detector = AdvancedDistractionDetector()
+        # Compact new events and age out old raw ones while nothing appends to the
+        # log: MainWindow starts tracking (an attached daemon does this itself)
+        RollupPipeline(distraction_detector.db).run()
     window = MainWindow(distraction_detector)
 
     # Show splash screen briefly before launching the main UI
     splash = SplashScreen()
 
     def launch():
-        distraction_detector.start_monitoring()
         window.show()
         print("Focus Forge UI Loaded!")
+        # Report left for this run by a previous --defer-report shutdown
+        threading.Thread(target=generate_pending_report, name="pending-report", daemon=True).start()
 
     splash.launch(launch)
 
-    # Ensure the distraction detector stops when the app closes
-    app.aboutToQuit.connect(distraction_detector.stop_monitoring)
+    # One bounded shutdown for every quit path: stop (or detach) the tracker,
+    # then write the focus report once (--defer-report: at next startup)
+    shutdown = ShutdownCoordinator()
+    shutdown.add_worker("tracker", distraction_detector.request_stop, distraction_detector.wait_stopped)
+    shutdown.add_final_step("focus report", lambda: write_final_report(defer="--defer-report" in sys.argv))
+
+    # FOCUSFORGE_METRICS=1 turns on instrumentation and writes logs/metrics.json
+    if metrics.registry.enabled:
+        exporter = metrics.MetricsExporter().start()
+        # Last, so the snapshot includes the shutdown timing
+        shutdown.add_final_step("metrics", exporter.stop)
 
-    # Generate report after the app closes
-    def generate_focus_report():
-        print("Generating Focus Report...")
-        focus_report = FocusReport()
-        focus_report.generate_report()
-        focus_report.export_csv()
+    # --continual: a low-priority process keeps learning from the replay buffer
+    # and the engine picks up each published policy version at the next session
+    if "--continual" in sys.argv:
+        engine = window.decision_engine
+        engine.policy_store = PolicyStore()
+        engine.refresh_policy()
+        learner = LearnerProcess(engine.db.db_name, engine="ppo" if engine.policy.name == "ppo" else "bandit").start()
+        shutdown.add_worker("learner", learner.request_stop, learner.wait)
 
-    app.aboutToQuit.connect(generate_focus_report)
+    app.aboutToQuit.connect(shutdown.shutdown)
 
     sys.exit(app.exec_())
 
@@ -1,8 +1,10 @@
 import json
+import time
 from pathlib import Path
 from dataclasses import dataclass, asdict
 from typing import Dict, List, Optional
 from core.utils.database import Database
+from core.utils.atomic_io import atomic_write_json, load_json
 
 @dataclass
 class MetaSkill:
@@ -60,19 +62,23 @@ class MetaSkill:
         )
 
 class MetaSkillManager:
+    # XP is saved on every gain, but the gzip backup is refreshed at most this often (seconds)
+    BACKUP_INTERVAL = 300
+
     def __init__(self, skills_file: str = "meta_skills.json"):
         self.skills_file = skills_file
         self.skills: Dict[str, MetaSkill] = {}
+        self._last_backup = None
         self.load_skills()
         
     def load_skills(self):
-        try:
-            with open(self.skills_file, "r") as f:
-                data = json.load(f)
-                for skill_data in data["skills"]:
-                    skill = MetaSkill(**skill_data)
-                    self.skills[skill.name] = skill
-        except FileNotFoundError:
+        # Falls back to the last good backup if the file was corrupted
+        data = load_json(self.skills_file)
+        if data is not None:
+            for skill_data in data["skills"]:
+                skill = MetaSkill(**skill_data)
+                self.skills[skill.name] = skill
+        else:
             # Initialize default skills
             self.skills = {
                 "Grit": MetaSkill("Grit", 0, 1, "Perseverance through challenges", "🧠"),
@@ -82,12 +88,17 @@ class MetaSkillManager:
             }
             self.save_skills()
             
-    def save_skills(self):
+    def save_skills(self, backup: Optional[bool] = None):
+        """Write the skills file; *backup* defaults to once per BACKUP_INTERVAL."""
         data = {
             "skills": [asdict(skill) for skill in self.skills.values()]
         }
-        with open(self.skills_file, "w") as f:
-            json.dump(data, f, indent=2)
+        now = time.monotonic()
+        if backup is None:
+            backup = self._last_backup is None or now - self._last_backup >= self.BACKUP_INTERVAL
+        if backup and Path(self.skills_file).exists():
+            self._last_backup = now  # nothing to back up before the first write
+        atomic_write_json(self.skills_file, data, backup=backup, indent=2)
             
     def add_xp(self, skill_name: str, amount: int) -> Optional[str]:
         """Add XP to a skill and return level up message if applicable"""
@@ -0,0 +1,73 @@
+#!/usr/bin/env python3
+"""
+KantuBoard Open-Time Measurement
+================================
+Seeds throwaway databases with growing numbers of cards and reports how long
+KantuBoard takes to open at each size. Runs offscreen, so no display is needed.
+
+    python scripts/measure_board_open.py --sizes 100 1000 10000 50000
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+# Add project root to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from PyQt5.QtWidgets import QApplication
+
+from core.utils import metrics
+from core.utils.database import Database
+from core.utils.synthetic_data import SyntheticWorkload
+from gui.components.kantu_board import KantuBoard
+
+
+def seed_board(db, total_cards):
+    """Fill the board with *total_cards* synthetic cards, most of them in Done."""
+    db.save_board_state(SyntheticWorkload(seed=7).board_state(total_cards))
+
+
+def measure(total_cards, archive_keep):
+    with tempfile.TemporaryDirectory() as tmp:
+        cwd = os.getcwd()
+        os.chdir(tmp)  # MetaSkills writes its JSON file into the working directory
+        try:
+            db = Database(os.path.join(tmp, "board.db"))
+            seed_board(db, total_cards)
+            KantuBoard.DONE_ARCHIVE_KEEP = archive_keep
+            metrics.registry.reset()
+            started = time.perf_counter()
+            board = KantuBoard(db=db)
+            elapsed_ms = (time.perf_counter() - started) * 1000
+            load_ms = metrics.registry.histograms["kantu_board.load_tasks"].total * 1000
+            loaded = sum(c.card_model.rowCount() for c in (board.backlog, board.now, board.done))
+            board.close()
+            db.close()
+        finally:
+            os.chdir(cwd)
+    return elapsed_ms, load_ms, loaded
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Measure KantuBoard open time as the board grows")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[100, 1000, 10000, 50000])
+    parser.add_argument("--archive-keep", type=int, default=KantuBoard.DONE_ARCHIVE_KEEP,
+                        help="Done cards kept on the board before archiving")
+    args = parser.parse_args()
+
+    metrics.registry.enable()  # load_tasks reports its own latency as kantu_board.load_tasks
+    app = QApplication.instance() or QApplication(sys.argv)
+    print(f"{'cards':>8} {'open ms':>10} {'load ms':>10} {'rows loaded':>12}")
+    for size in args.sizes:
+        open_ms, load_ms, loaded = measure(size, args.archive_keep)
+        print(f"{size:>8} {open_ms:>10.1f} {load_ms:>10.1f} {loaded:>12}")
+    app.quit()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,63 @@
+#!/usr/bin/env python3
+"""
+Test suite for the shared window-title app catalog
+"""
+
+import os
+import sys
+import unittest
+
+# Add project root to path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))
+
+from core.trackers.app_catalog import AppCatalog, DISTRACTION, OTHER, WORK, default_catalog
+from core.utils.synthetic_data import DISTRACTION_APPS, WORK_APPS
+
+
+class TestAppCatalog(unittest.TestCase):
+    def setUp(self):
+        self.catalog = AppCatalog(["VS Code", "Visual Studio Code", "Cursor"], ["YouTube", "Reddit"])
+
+    def test_categories(self):
+        """Titles are matched case-sensitively against each category"""
+        self.assertEqual(self.catalog.category("main.py - Visual Studio Code"), WORK)
+        self.assertEqual(self.catalog.category("Lofi beats - YouTube - Google Chrome"), DISTRACTION)
+        self.assertEqual(self.catalog.category("Moving the cursor - youtube"), OTHER)
+        self.assertEqual(self.catalog.category("Calculator"), OTHER)
+        self.assertEqual(self.catalog.category(None), OTHER)
+
+    def test_work_takes_precedence(self):
+        """A title naming both a work app and a distraction counts as work"""
+        self.assertTrue(self.catalog.is_work("YouTube API docs - Cursor"))
+
+    def test_results_are_memoized(self):
+        """Repeated titles hit the cache"""
+        for _ in range(3):
+            self.catalog.category("Reddit - Firefox")
+        self.assertEqual(self.catalog.category.cache_info().hits, 2)
+
+    def test_app_name(self):
+        """The longest matching catalog name is reported, once per title"""
+        self.assertEqual(self.catalog.app_name("main.py - Visual Studio Code"), "Visual Studio Code")
+        self.assertEqual(self.catalog.app_name("Calculator"), "Calculator")
+        self.catalog.app_name("main.py - Visual Studio Code")
+        self.assertEqual(self.catalog.app_name.cache_info().hits, 1)
+
+    def test_default_catalog_work_apps(self):
+        """The shipped catalog keeps the detector's original work apps and adds editors and team tools"""
+        catalog = default_catalog()
+        for app in ("ChatGPT", "Cursor", "VS Code", "PyCharm",  # the detector's original list
+                    "Visual Studio Code", "Terminal", "Notion", "Slack"):
+            self.assertTrue(catalog.is_work(app), app)
+
+    def test_default_catalog_covers_synthetic_apps(self):
+        """The shipped catalog classifies the synthetic workload's apps as intended"""
+        catalog = default_catalog()
+        for app, _ in WORK_APPS:
+            self.assertEqual(catalog.category(app), WORK, app)
+        for app, _ in DISTRACTION_APPS:
+            self.assertEqual(catalog.category(app), DISTRACTION, app)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+"""
+Test suite for crash-safe JSON state files
+"""
+
+import json
+import os
+import stat
+import sys
+import tempfile
+import unittest
+
+# Add project root to path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))
+
+from core.trackers.distraction_logger import DistractionLogger, iter_history
+from core.utils.atomic_io import atomic_write_json, atomic_writer, backup_path, load_json
+from meta_skills.levels.meta_skills import MetaSkillManager
+
+
+class TestAtomicIO(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmp.name, "state.json")
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_failed_write_keeps_old_file(self):
+        """An exception mid-write leaves the previous content and no temp files"""
+        atomic_write_json(self.path, {"v": 1})
+        with self.assertRaises(RuntimeError):
+            with atomic_writer(self.path) as f:
+                f.write('{"v": ')
+                raise RuntimeError("killed")
+        self.assertEqual(load_json(self.path), {"v": 1})
+        self.assertEqual(os.listdir(self.tmp.name), ["state.json"])
+
+    def test_recovers_from_backup(self):
+        """A corrupt file falls back to the last good compressed copy"""
+        atomic_write_json(self.path, {"v": 1}, backup=True)
+        atomic_write_json(self.path, {"v": 2}, backup=True)
+        self.assertTrue(os.path.exists(backup_path(self.path)))
+        with open(self.path, "w") as f:
+            f.write('{"v": 2')  # truncated by a crash
+        self.assertEqual(load_json(self.path), {"v": 1})
+
+    def test_missing_file_returns_default(self):
+        """Nothing to load gives the default"""
+        self.assertEqual(load_json(self.path, default={}), {})
+
+    def test_skills_survive_corruption(self):
+        """MetaSkillManager loads its backup instead of failing at startup"""
+        skills_file = os.path.join(self.tmp.name, "meta_skills.json")
+        manager = MetaSkillManager(skills_file)
+        manager.BACKUP_INTERVAL = 0  # back up on every save
+        manager.add_xp("Grit", 50)
+        manager.add_xp("Grit", 10)
+        with open(skills_file, "w") as f:
+            f.write("{")
+        reloaded = MetaSkillManager(skills_file)
+        self.assertEqual(reloaded.skills["Grit"].xp, 50)
+
+    def test_skill_backups_are_rate_limited(self):
+        """Frequent XP gains rewrite the skills file but not its compressed backup"""
+        skills_file = os.path.join(self.tmp.name, "meta_skills.json")
+        manager = MetaSkillManager(skills_file)
+        manager.add_xp("Grit", 5)
+        backup_mtime = os.stat(backup_path(skills_file)).st_mtime_ns
+        for _ in range(20):
+            manager.add_xp("Grit", 1)
+        self.assertEqual(os.stat(backup_path(skills_file)).st_mtime_ns, backup_mtime)
+        self.assertEqual(MetaSkillManager(skills_file).skills["Grit"].xp, 25)
+
+    @unittest.skipIf(os.name == "nt", "POSIX permission bits")
+    def test_rewrite_keeps_permissions(self):
+        """Replacing a file keeps its mode instead of mkstemp's 0600"""
+        atomic_write_json(self.path, {"v": 1})
+        os.chmod(self.path, 0o644)
+        atomic_write_json(self.path, {"v": 2}, backup=True)
+        self.assertEqual(stat.S_IMODE(os.stat(self.path).st_mode), 0o644)
+        self.assertEqual(stat.S_IMODE(os.stat(backup_path(self.path)).st_mode), 0o644)
+
+    def test_torn_log_line_is_repaired(self):
+        """A crash mid-append does not swallow the next event"""
+        log_file = os.path.join(self.tmp.name, "distraction_log.jsonl")
+        DistractionLogger(log_file=log_file).log_event("Distraction", {"window": "YouTube"})
+        with open(log_file, "a") as f:
+            f.write('{"ts_ns": 17')
+        DistractionLogger(log_file=log_file).log_event("Distraction", {"window": "Reddit"})
+        self.assertEqual([e.window for e in iter_history(log_file)], ["YouTube", "Reddit"])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,130 @@
+#!/usr/bin/env python3
+"""
+Test suite for the contextual bandit engine and DecisionEngine's pluggable policies
+"""
+
+import os
+import sys
+import tempfile
+import time
+import unittest
+
+import numpy as np
+
+# Add project root to path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))
+
+from core.engine.bandit import ContextualBandit
+from core.engine.decision_engine import DecisionEngine
+from core.engine.policies import EngineState, PPOPolicy, RulePolicy, load_policy
+from core.engine.rules import HOLD
+from core.utils.database import Database
+
+
+class NoDistractions:
+    def reset_distractions(self):
+        return 0
+
+
+def state(hour):
+    return EngineState(success_rate=60, consecutive_failures=False, work=25, brk=5, hour=hour)
+
+
+class TestContextualBandit(unittest.TestCase):
+    def train(self, bandit, rounds=600, seed=0):
+        # Short sessions (action 1) pay off in the evening, long ones (action 7) in the morning
+        rng = np.random.default_rng(seed)
+        for _ in range(rounds):
+            hour = int(rng.choice([9, 20]))
+            s = state(hour)
+            action = bandit.select(s)
+            best = 7 if hour == 9 else 1
+            bandit.update(s, action, (1.0 if action == best else -1.0) + rng.normal(0, 0.3))
+
+    def test_learns_context_dependent_action(self):
+        """Thompson sampling and LinUCB both find the best action per time of day"""
+        for method in ("thompson", "linucb"):
+            bandit = ContextualBandit(method=method, seed=1, path=None)
+            self.train(bandit)
+            self.assertEqual(int(np.argmax(bandit.expected_rewards(state(9)))), 7, method)
+            self.assertEqual(int(np.argmax(bandit.expected_rewards(state(20)))), 1, method)
+
+    def test_untrained_holds(self):
+        """With no data the deterministic choice leaves durations unchanged"""
+        self.assertEqual(ContextualBandit(method="linucb").select(state(9)), HOLD)
+
+    def test_update_is_fast(self):
+        """Online updates take microseconds"""
+        bandit = ContextualBandit(seed=0)
+        s = state(9)
+        started = time.perf_counter()
+        for _ in range(1000):
+            bandit.update(s, 3, 1.0)
+        self.assertLess((time.perf_counter() - started) / 1000, 1e-3)
+
+    def test_save_load(self):
+        """The learned posterior survives a restart"""
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "bandit.npz")
+            bandit = ContextualBandit(path=path, seed=0)
+            self.train(bandit, rounds=50)
+            bandit.save()
+            loaded = ContextualBandit.load(path)
+            np.testing.assert_allclose(loaded.expected_rewards(state(9)), bandit.expected_rewards(state(9)))
+            self.assertEqual(loaded.counts.sum(), 50)
+
+
+class TestDecisionEnginePolicies(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.cwd = os.getcwd()
+        os.chdir(self.tmp.name)
+        self.db = Database("test.db")
+
+    def tearDown(self):
+        self.db.close()
+        os.chdir(self.cwd)
+        self.tmp.cleanup()
+
+    def test_defaults_to_bandit_without_ppo(self):
+        """No trained PPO model: the bandit is used instead of crashing"""
+        self.assertIsInstance(load_policy(), ContextualBandit)
+        self.assertIsInstance(load_policy("rules"), RulePolicy)
+        with self.assertRaises(ValueError):
+            load_policy("dqn")
+
+    def test_apply_rules_without_model(self):
+        """apply_rules works with the rule policy, where it used to need a PPO model"""
+        engine = DecisionEngine(self.db, NoDistractions(), policy="rules")
+        self.assertIsNone(engine.model)
+        self.db.log_session(25, 25, 1, 5, "Write tests", 1, 0)
+        self.assertEqual(engine.apply_rules(), (25, 5))
+
+    def test_online_update_after_session(self):
+        """The outcome of the next logged session updates the bandit, once"""
+        engine = DecisionEngine(self.db, NoDistractions(), policy=ContextualBandit(path="bandit.npz", seed=0))
+        engine.apply_rules()
+        engine.apply_rules()  # no session in between: nothing to learn yet
+        self.assertEqual(engine.policy.counts.sum(), 0)
+        self.db.log_session(25, 25, 1, 5, "Write tests", 1, 0)
+        engine.apply_rules()
+        self.assertEqual(engine.policy.counts.sum(), 1)
+        self.assertTrue(os.path.exists("bandit.npz"))
+
+    def test_model_setter(self):
+        """Setting or clearing a PPO-style model swaps the policy"""
+        engine = DecisionEngine(self.db, NoDistractions(), policy="rules")
+
+        class Model:
+            def predict(self, obs, deterministic=True):
+                return np.array([8]), None
+
+        engine.model = Model()
+        self.assertIsInstance(engine.policy, PPOPolicy)
+        self.assertEqual(engine.apply_rules(), (30, 10))
+        engine.model = None
+        self.assertIsInstance(engine.policy, RulePolicy)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,123 @@
+#!/usr/bin/env python3
+"""
+Test suite for the replay buffer, the continual learner and policy hot-swapping
+"""
+
+import multiprocessing
+import os
+import sys
+import tempfile
+import unittest
+
+# Add project root to path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))
+
+from core.engine.bandit import ContextualBandit
+from core.engine.continual import ContinualLearner, PolicyStore, run_learner
+from core.engine.decision_engine import DecisionEngine
+from core.utils.database import Database
+
+
+class NoDistractions:
+    def reset_distractions(self):
+        return 0
+
+
+class TestContinualLearning(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.cwd = os.getcwd()
+        os.chdir(self.tmp.name)
+        self.db = Database("test.db")
+        self.store = PolicyStore("policies", keep=2)
+
+    def tearDown(self):
+        self.db.close()
+        os.chdir(self.cwd)
+        self.tmp.cleanup()
+
+    def run_sessions(self, engine, n):
+        for _ in range(n):
+            engine.apply_rules()
+            self.db.log_session(25, 25, 1, 5, "Write tests", 1, 0)
+        engine.apply_rules()
+
+    def test_session_boundaries_fill_replay_buffer(self):
+        """Each finished session records one (state, action, reward) transition"""
+        engine = DecisionEngine(self.db, NoDistractions(), policy="rules")
+        self.run_sessions(engine, 3)
+        transitions = self.db.get_transitions()
+        self.assertEqual(len(transitions), 3)
+        _, session_id, policy, state, action, reward, learned = transitions[-1]
+        self.assertEqual((session_id, policy, learned), (3, "rules", True))
+        self.assertEqual(state["work"], 25)
+        self.assertGreater(reward, 0)
+
+    def test_learner_publishes_versions(self):
+        """Only unseen transitions are learned, each batch as a new numbered version"""
+        engine = DecisionEngine(self.db, NoDistractions(), policy="rules")
+        learner = ContinualLearner(self.db, "bandit", self.store)
+        self.assertIsNone(learner.step())
+
+        self.run_sessions(engine, 2)
+        manifest = learner.step()
+        self.assertEqual((manifest["version"], manifest["file"]), (1, "bandit-v0001.npz"))
+        self.assertIsNone(learner.step())  # nothing new
+
+        self.run_sessions(engine, 1)
+        self.run_sessions(engine, 1)
+        learner.step()
+        learner.step()
+        self.assertEqual(self.store.current("bandit")["version"], 2)
+        self.assertEqual(self.store.load(self.store.current("bandit")).counts.sum(), 4)
+
+        self.run_sessions(engine, 1)
+        learner.step()
+        self.assertEqual(self.store.versions("bandit"), [2, 3])  # keep=2
+
+    def test_engine_hot_swaps_published_policy(self):
+        """A new version is used at the next session without restarting the engine"""
+        engine = DecisionEngine(self.db, NoDistractions(), policy=ContextualBandit(path="bandit.npz", seed=0),
+                                policy_store=self.store)
+        self.run_sessions(engine, 2)
+        # The learner owns updates in continual mode
+        self.assertEqual(engine.policy.counts.sum(), 0)
+        self.assertFalse(os.path.exists("bandit.npz"))
+
+        ContinualLearner(self.db, "bandit", self.store).step()
+        engine.apply_rules()
+        self.assertEqual(engine.policy_version, 1)
+        self.assertEqual(engine.policy.counts.sum(), 2)
+
+    def test_first_version_continues_online_bandit(self):
+        """v1 starts from the engine's online bandit without relearning its sessions"""
+        online = DecisionEngine(self.db, NoDistractions(), policy=ContextualBandit(path="online.npz", seed=0))
+        self.run_sessions(online, 3)
+        self.assertEqual(online.policy.counts.sum(), 3)
+
+        continual = DecisionEngine(self.db, NoDistractions(), policy=ContextualBandit.load("online.npz"),
+                                   policy_store=self.store)
+        self.run_sessions(continual, 2)
+        ContinualLearner(self.db, "bandit", self.store, bandit_path="online.npz").step()
+        # 3 sessions learned online + 2 learned in the background, none twice
+        self.assertEqual(self.store.load(self.store.current("bandit")).counts.sum(), 5)
+
+    def test_prune_transitions(self):
+        """The replay buffer keeps only the newest transitions"""
+        for i in range(5):
+            self.db.add_transition(i, "bandit", {"work": 25}, 4, 1.0)
+        self.assertEqual(self.db.prune_transitions(keep=2), 3)
+        self.assertEqual([t[1] for t in self.db.get_transitions()], [3, 4])
+
+    def test_worker_stops_on_event(self):
+        """The learner loop runs a step and exits once signalled"""
+        self.db.add_transition(1, "rules", {"success_rate": 100, "consecutive_failures": False,
+                                            "work": 25, "brk": 5, "distractions": 0, "hour": 9}, 4, 1.0)
+        stop = multiprocessing.Event()
+        stop.set()
+        run_learner("test.db", "bandit", 60, stop, directory="policies", niceness=0)
+        self.assertEqual(self.store.current("bandit")["trained_through"], 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
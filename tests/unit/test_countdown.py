@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+"""
+Test suite for the deadline-based Pomodoro countdown
+"""
+
+import os
+import sys
+import unittest
+
+# Add project root to path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))
+
+from core.utils.countdown import CountdownTimer
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+class TestCountdownTimer(unittest.TestCase):
+    def setUp(self):
+        self.clock = FakeClock()
+        self.timer = CountdownTimer(25 * 60, clock=self.clock)
+
+    def test_remaining_follows_clock_not_ticks(self):
+        """A stalled event loop does not stretch the session"""
+        self.timer.start()
+        self.clock.now += 90.4  # one long stall instead of 90 ticks
+        self.assertAlmostEqual(self.timer.remaining(), 25 * 60 - 90.4)
+        self.assertEqual(self.timer.format(), "23:30")
+
+    def test_pause_excludes_paused_time(self):
+        """Paused time counts neither against remaining nor elapsed time"""
+        self.timer.start()
+        self.clock.now += 60
+        self.timer.pause()
+        self.clock.now += 600
+        self.timer.start()
+        self.clock.now += 30
+        self.assertAlmostEqual(self.timer.elapsed(), 90)
+        self.assertAlmostEqual(self.timer.remaining(), 25 * 60 - 90)
+
+    def test_finishes_after_deadline(self):
+        """Elapsed time is capped at the planned duration"""
+        self.timer.start()
+        self.clock.now += 25 * 60 + 300  # e.g. the machine slept past the deadline
+        self.assertTrue(self.timer.is_finished())
+        self.assertEqual(self.timer.remaining(), 0.0)
+        self.assertAlmostEqual(self.timer.elapsed(), 25 * 60)
+        self.assertEqual(self.timer.format(), "00:00")
+
+    def test_set_duration_keeps_elapsed(self):
+        """Shortening a running countdown keeps the time already spent"""
+        self.timer.start()
+        self.clock.now += 120
+        self.timer.set_duration(5 * 60)
+        self.assertTrue(self.timer.is_running)
+        self.assertAlmostEqual(self.timer.remaining(), 180)
+        self.assertAlmostEqual(self.timer.elapsed(), 120)
+
+    def test_reset(self):
+        """Reset stops the timer and rewinds to the new duration"""
+        self.timer.start()
+        self.clock.now += 100
+        self.timer.reset(5 * 60)
+        self.assertFalse(self.timer.is_running)
+        self.assertEqual(self.timer.remaining(), 300)
+        self.assertEqual(self.timer.elapsed(), 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
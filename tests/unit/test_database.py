@@ -0,0 +1,213 @@
+#!/usr/bin/env python3
+"""
+Test suite for the SQLite persistence layer
+"""
+
+import json
+import os
+import sqlite3
+import sys
+import tempfile
+import time
+import unittest
+
+# Add project root to path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))
+
+from core.utils.database import Database
+
+
+class TestBoardCards(unittest.TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.db_path = os.path.join(self.tmpdir.name, "test.db")
+        self.db = Database(self.db_path)
+
+    def tearDown(self):
+        self.db.close()
+        self.tmpdir.cleanup()
+
+    def test_fresh_board_is_unsaved(self):
+        """A board that was never written reports None so the UI can seed it"""
+        self.assertIsNone(self.db.load_board_state())
+
+    def test_add_move_update_delete(self):
+        """Single-card operations touch only their own row"""
+        a = self.db.add_board_card("backlog", {"title": "A"})
+        b = self.db.add_board_card("backlog", {"title": "B"})
+        self.db.move_board_card(a, "done")
+        self.db.update_board_card(b, {"title": "B2"})
+
+        state = self.db.load_board_state()
+        self.assertEqual([c["title"] for c in state["backlog"]], ["B2"])
+        self.assertEqual([c["id"] for c in state["done"]], [a])
+
+        self.db.delete_board_card(a)
+        state = self.db.load_board_state()
+        self.assertEqual(state["done"], [])
+        self.assertEqual(state["now"], [])
+
+    def test_cards_keep_column_order(self):
+        """Appended cards load back in insertion order"""
+        for title in ["one", "two", "three"]:
+            self.db.add_board_card("now", {"title": title})
+        titles = [c["title"] for c in self.db.load_board_state()["now"]]
+        self.assertEqual(titles, ["one", "two", "three"])
+
+    def test_column_paging(self):
+        """Pages are keyed on position and together cover the whole column"""
+        for i in range(7):
+            self.db.add_board_card("done", {"title": f"card {i}"})
+        first = self.db.load_board_column("done", limit=3)
+        second = self.db.load_board_column("done", limit=3, after_position=first[-1]["position"])
+        rest = self.db.load_board_column("done", limit=3, after_position=second[-1]["position"])
+        titles = [c["title"] for c in first + second + rest]
+        self.assertEqual(titles, [f"card {i}" for i in range(7)])
+        self.assertEqual(self.db.count_board_cards("done"), 7)
+
+    def test_archive_done_cards(self):
+        """Only the newest Done cards stay on the board"""
+        for i in range(5):
+            self.db.add_board_card("done", {"title": f"card {i}"})
+        self.db.add_board_card("now", {"title": "active"})
+
+        self.assertEqual(self.db.archive_done_cards(keep_recent=2), 3)
+        self.assertEqual([c["title"] for c in self.db.load_board_column("done")], ["card 3", "card 4"])
+        self.assertEqual(self.db.count_board_cards("now"), 1)
+        archived = self.db.load_archived_cards()
+        self.assertEqual([c["title"] for c in archived], ["card 2", "card 1", "card 0"])
+        self.assertEqual(self.db.archive_done_cards(keep_recent=2), 0)
+
+    def test_archived_cards_page_by_recency(self):
+        """Archived pages follow when cards were finished, not where they sat"""
+        late = self.db.add_board_card("backlog", {"title": "late"})
+        for i in range(4):
+            self.db.add_board_card("done", {"title": f"card {i}"})
+        time.sleep(0.01)
+        self.db.move_board_card(late, "done", position=-1)  # dropped at the top
+        self.db.archive_done_cards(keep_recent=0)
+
+        first = self.db.load_archived_cards(limit=2)
+        rest = self.db.load_archived_cards(limit=10, before=(first[-1]["updated_at"], first[-1]["id"]))
+        titles = [c["title"] for c in first + rest]
+        self.assertEqual(titles, ["late", "card 3", "card 2", "card 1", "card 0"])
+
+    def test_archive_keeps_recently_moved_cards(self):
+        """A card just moved into Done counts as newest wherever it was dropped"""
+        late = self.db.add_board_card("backlog", {"title": "late"})
+        for i in range(3):
+            self.db.add_board_card("done", {"title": f"card {i}"})
+        time.sleep(0.01)
+        self.db.move_board_card(late, "done", position=-1)  # dropped at the top
+
+        self.assertEqual(self.db.archive_done_cards(keep_recent=2), 2)
+        self.assertEqual([c["title"] for c in self.db.load_board_column("done")], ["late", "card 2"])
+
+    def test_position_between(self):
+        """New cards go at the ends or at the midpoint of their neighbours"""
+        a = self.db.add_board_card("now", {"title": "a"})
+        b = self.db.add_board_card("now", {"title": "b"})
+        self.assertEqual(self.db.board_position_between("now", None, a), -1)
+        self.assertEqual(self.db.board_position_between("now", a, b), 0.5)
+        self.assertEqual(self.db.board_position_between("now", b, None), 2)
+
+    def test_repeated_midpoint_inserts(self):
+        """Dropping card after card at one spot renumbers instead of running out of precision"""
+        first = self.db.add_board_card("backlog", {"title": "first"})
+        last = self.db.add_board_card("backlog", {"title": "last"})
+        renumbered = 0
+        before = first
+        for i in range(200):
+            position = self.db.board_position_between("backlog", before, last)
+            if position is None:
+                self.db.renumber_board_column("backlog")
+                renumbered += 1
+                position = self.db.board_position_between("backlog", before, last)
+            before = self.db.add_board_card("backlog", {"title": f"card {i}"}, position)
+
+        self.assertGreater(renumbered, 0)
+        titles = [c["title"] for c in self.db.load_board_column("backlog")]
+        self.assertEqual(titles, ["first"] + [f"card {i}" for i in range(200)] + ["last"])
+        positions = [c["position"] for c in self.db.load_board_column("backlog")]
+        self.assertEqual(len(set(positions)), len(positions))
+        # Keyset paging still walks every card exactly once
+        paged, after = [], None
+        while True:
+            page = self.db.load_board_column("backlog", limit=7, after_position=after)
+            if not page:
+                break
+            paged.extend(c["title"] for c in page)
+            after = page[-1]["position"]
+        self.assertEqual(paged, titles)
+
+    def test_renumber_keeps_order(self):
+        """Renumbering keeps the column order and returns the new positions"""
+        ids = [self.db.add_board_card("done", {"title": t}, p) for t, p in (("b", 0.75), ("a", 0.5), ("c", 3))]
+        self.assertEqual(self.db.renumber_board_column("done"), {ids[1]: 0.0, ids[0]: 1.0, ids[2]: 2.0})
+        self.assertEqual([c["title"] for c in self.db.load_board_column("done")], ["a", "b", "c"])
+
+    def test_legacy_blob_migration(self):
+        """A board_state JSON blob is exploded into board_cards on open"""
+        self.db.close()
+        conn = sqlite3.connect(self.db_path)
+        conn.execute("DROP TABLE board_cards")
+        conn.execute(
+            "INSERT INTO board_state (id, state_json, updated_at) VALUES (1, ?, '')",
+            (json.dumps({"backlog": [{"title": "Old"}], "now": [], "done": [{"title": "Shipped"}]}),),
+        )
+        conn.commit()
+        conn.close()
+
+        self.db = Database(self.db_path)
+        state = self.db.load_board_state()
+        self.assertEqual([c["title"] for c in state["backlog"]], ["Old"])
+        self.assertEqual([c["title"] for c in state["done"]], ["Shipped"])
+        row = self.db.conn.execute("SELECT COUNT(*) FROM board_state").fetchone()[0]
+        self.assertEqual(row, 0)
+
+
+class TestSessionQueries(unittest.TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.db = Database(os.path.join(self.tmpdir.name, "test.db"))
+        for i in range(10):
+            self.db.log_session(25, 20 + i, 0, 0, f"task {i % 3}", i % 2, i)
+
+    def tearDown(self):
+        self.db.close()
+        self.tmpdir.cleanup()
+
+    def test_session_stats_match_individual_queries(self):
+        """The single aggregate query agrees with the per-metric helpers"""
+        stats = self.db.get_session_stats()
+        self.assertEqual(stats["total_sessions"], 10)
+        self.assertEqual(stats["success_rate"], self.db.get_success_rate())
+        self.assertEqual(stats["average_work_duration"], self.db.get_average_work_duration())
+        self.assertEqual(stats["average_distractions"], self.db.get_average_distractions())
+
+    def test_keyset_pages_cover_history(self):
+        """Walking pages by (sort value, id) visits every session once"""
+        seen = []
+        after = None
+        while True:
+            page = self.db.get_sessions_page(limit=3, after=after, sort_column="distraction_events")
+            if not page:
+                break
+            seen.extend(row[0] for row in page)
+            after = (page[-1][7], page[-1][0])
+        self.assertEqual(seen, list(range(10, 0, -1)))
+
+    def test_task_filter_and_ascending_sort(self):
+        """Filtering and ordering happen in SQL"""
+        page = self.db.get_sessions_page(limit=10, sort_column="work_duration_actual",
+                                         descending=False, task_filter="task 1")
+        self.assertEqual([row[5] for row in page], ["task 1"] * 3)
+        self.assertEqual([row[2] for row in page], sorted(row[2] for row in page))
+
+    def test_rejects_unknown_sort_column(self):
+        with self.assertRaises(ValueError):
+            self.db.get_sessions_page(sort_column="timestamp; DROP TABLE sessions")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+"""
+Test suite for the bounded DistractionLogger and its on-disk history
+"""
+
+import json
+import os
+import sys
+import tempfile
+import unittest
+
+# Add project root to path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))
+
+from core.analytics.focus_report import FocusReport
+from core.trackers.distraction_logger import DistractionLogger, iter_history
+from core.trackers.events import Event, EventType
+
+
+class TestDistractionLogger(unittest.TestCase):
+    def setUp(self):
+        self.cwd = os.getcwd()
+        self.tmp = tempfile.TemporaryDirectory()
+        os.chdir(self.tmp.name)
+
+    def tearDown(self):
+        os.chdir(self.cwd)
+        self.tmp.cleanup()
+
+    def test_window_is_bounded(self):
+        """Only the most recent events stay in memory; all of them reach disk"""
+        logger = DistractionLogger(capacity=10)
+        for i in range(25):
+            logger.log_event("Distraction", {"window": f"Window {i}"})
+        self.assertEqual(len(logger.logs), 10)
+        self.assertEqual(logger.get_logs()[0].window, "Window 15")
+        self.assertEqual(len(list(logger.iter_history())), 25)
+
+    def test_summary_survives_window_eviction(self):
+        """Session summaries count every event since clear(), not just the window"""
+        logger = DistractionLogger(capacity=5)
+        for _ in range(8):
+            logger.log_event("Distraction", {"window": "YouTube"})
+        logger.log_event("Inactivity", {})
+        self.assertEqual(logger.get_summary(), {
+            "total_distractions": 9, "by_type": {"Distraction": 8, "Inactivity": 1}
+        })
+        logger.clear()
+        self.assertEqual(logger.get_summary()["total_distractions"], 0)
+        self.assertEqual(len(list(logger.iter_history())), 9)
+
+    def test_legacy_log_is_migrated(self):
+        """The old JSON array log is folded into the JSONL history once"""
+        os.makedirs("logs", exist_ok=True)
+        legacy = [{"timestamp": "2025-01-01 09:00:00", "event_type": "Inactivity", "details": {}}]
+        with open("logs/distraction_log.json", "w") as f:
+            json.dump(legacy, f)
+        logger = DistractionLogger()
+        logger.log_event("Distraction", {"window": "Reddit"})
+        history = list(iter_history())
+        self.assertEqual([e.type for e in history], [EventType.INACTIVITY, EventType.DISTRACTION])
+        self.assertEqual(history[0].timestamp, "2025-01-01 09:00:00")
+        self.assertFalse(os.path.exists("logs/distraction_log.json"))
+
+    def test_history_range(self):
+        """iter_history filters by timestamp range"""
+        os.makedirs("logs", exist_ok=True)
+        with open("logs/distraction_log.jsonl", "w") as f:
+            for hour in range(9, 13):
+                f.write(json.dumps({"timestamp": f"2025-01-01 {hour:02d}:00:00",
+                                    "event_type": "Distraction", "details": {}}) + "\n")
+        events = list(iter_history(since="2025-01-01 10:00:00", until="2025-01-01 12:00:00"))
+        self.assertEqual([e.timestamp[11:13] for e in events], ["10", "11"])
+
+    def test_history_range_tolerates_late_writes(self):
+        """An event written just after a later one is still inside the range"""
+        logger = DistractionLogger()
+        base = 1_700_000_000 * 10 ** 9
+        for offset_ms in (0, 20, 10, 5000):  # 10 ms stamped on a thread that wrote late
+            logger.log(Event(base + offset_ms * 10 ** 6, EventType.DISTRACTION))
+        events = list(iter_history(since=base, until=base + 15 * 10 ** 6))
+        self.assertEqual([e.ts_ns - base for e in events], [0, 10 * 10 ** 6])
+
+    def test_focus_report_streams_history(self):
+        """FocusReport aggregates the on-disk history, not the live window"""
+        logger = DistractionLogger(capacity=2)
+        logger.log_event("App Switch", {"previous_window": None, "new_window": "VS Code",
+                                        "duration_in_previous_window": 0})
+        logger.log_event("App Switch", {"previous_window": "VS Code", "new_window": "YouTube",
+                                        "duration_in_previous_window": 30})
+        logger.log_event("Work App Usage", {"window": "VS Code"})
+        report = FocusReport().generate_report()
+        self.assertEqual(report["total_sessions"], 3)
+        self.assertEqual(report["distraction_summary"]["by_type"], {"App Switch": 2})
+        # 30 s were spent in VS Code before switching to YouTube
+        self.assertEqual(report["time_distribution"], {"work_apps": {"VS Code": 30}, "distractions": {}})
+
+
+class TestEvents(unittest.TestCase):
+    def test_record_round_trip(self):
+        """Events survive to_record/from_record unchanged"""
+        event = Event.now(EventType.APP_SWITCH, window="VS Code", previous_window="Slack", duration=12.5)
+        self.assertEqual(Event.from_record(event.to_record()), event)
+        self.assertEqual(event.details["new_window"], "VS Code")
+
+    def test_titles_are_interned(self):
+        """Equal window titles share one string object"""
+        title = "".join(["You", "Tube"])
+        a = Event.from_details(0, "Distraction", {"window": title})
+        b = Event.from_details(0, "Distraction", {"window": "".join(["YouT", "ube"])})
+        self.assertIs(a.window, b.window)
+        self.assertIs(a.type, EventType.DISTRACTION)
+
+    def test_unknown_type_is_kept(self):
+        """Event types outside the enum are preserved as strings"""
+        event = Event.from_details(0, "Custom", {"note": "x"})
+        self.assertEqual(event.type_name, "Custom")
+        self.assertEqual(event.details, {"note": "x"})
+
+
+if __name__ == '__main__':
+    unittest.main()
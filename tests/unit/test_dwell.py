@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+"""
+Test suite for live dwell-time accumulation and the dwell_rollups table
+"""
+
+import os
+import sys
+import tempfile
+import unittest
+from datetime import datetime
+
+# Add project root to path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))
+
+from core.trackers.app_catalog import AppCatalog
+from core.trackers.dwell import DwellAccumulator, bucket_start
+from core.utils.database import Database
+
+
+class TestDwellAccumulator(unittest.TestCase):
+    def setUp(self):
+        self.start = datetime(2025, 3, 3, 9, 0, 30).timestamp()
+        self.dwell = DwellAccumulator(AppCatalog(["VS Code"], ["YouTube"]))
+
+    def test_time_goes_to_previous_window(self):
+        """A switch charges the elapsed time to the window being left"""
+        self.dwell.switch("main.py - VS Code", now=self.start)
+        self.dwell.switch("YouTube", now=self.start + 100)
+        self.dwell.switch(None, now=self.start + 130)
+        rows = {(g, app): s for g, _, app, _, s in self.dwell.drain()}
+        self.assertEqual(rows[("hour", "VS Code")], 100)
+        self.assertEqual(rows[("day", "YouTube")], 30)
+
+    def test_minutes_are_split_at_boundaries(self):
+        """Dwell spanning minutes lands in each minute bucket"""
+        self.dwell.switch("VS Code", now=self.start)
+        self.dwell.tick(now=self.start + 90)
+        minutes = sorted((b, s) for g, b, _, _, s in self.dwell.drain() if g == "minute")
+        self.assertEqual([s for _, s in minutes], [30, 60])
+        self.assertEqual(minutes[1][0] - minutes[0][0], 60)
+
+    def test_idle_time_is_not_charged(self):
+        """No window means no dwell"""
+        self.dwell.switch("VS Code", now=self.start)
+        self.dwell.switch(None, now=self.start + 10)
+        self.assertEqual(self.dwell.seconds_today(now=self.start + 500), 10)
+
+    def test_seconds_today_includes_open_window(self):
+        """Live totals count the window still being timed, per category"""
+        self.dwell.switch("VS Code", now=self.start)
+        self.assertEqual(self.dwell.seconds_today(now=self.start + 45), 45)
+        self.assertEqual(self.dwell.pending_seconds(now=self.start + 60), 60)
+        self.dwell.drain()
+        self.assertEqual(self.dwell.pending_seconds(now=self.start + 60), 0)
+
+
+class TestDwellRollups(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.db = Database(os.path.join(self.tmp.name, "test.db"))
+
+    def tearDown(self):
+        self.db.close()
+        self.tmp.cleanup()
+
+    def test_flushes_accumulate(self):
+        """Repeated flushes add to the same buckets; focus today reads the day bucket"""
+        now = datetime.now()
+        start = now.replace(hour=0, minute=0, second=0, microsecond=0).timestamp() + 60
+        dwell = DwellAccumulator(AppCatalog(["VS Code"], ["YouTube"]))
+        dwell.switch("VS Code", now=start)
+        dwell.switch("YouTube", now=start + 30)
+        self.db.add_dwell(dwell.drain())
+        dwell.switch("VS Code", now=start + 40)
+        dwell.switch(None, now=start + 70)
+        self.db.add_dwell(dwell.drain())
+        self.assertEqual(self.db.focus_seconds_today(now=now), 60)
+        self.assertEqual(self.db.focus_seconds_today(category="distraction", now=now), 10)
+        minutes = self.db.get_dwell("minute", bucket_start(start, "day"), category="work")
+        self.assertEqual(sum(row[3] for row in minutes), 60)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,161 @@
+#!/usr/bin/env python3
+"""
+Test suite for the memory-mapped distraction event archive
+"""
+
+import json
+import os
+import sys
+import tempfile
+import unittest
+from datetime import datetime
+
+# Add project root to path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))
+
+from core.analytics.event_archive import EventArchive, RECORD
+from core.analytics.focus_report import FocusReport
+from core.analytics.rollups import RollupPipeline
+from core.trackers.events import Event, EventType, NS_PER_SECOND, to_ns
+from core.utils.database import Database
+
+HOUR = 3600 * NS_PER_SECOND
+
+
+class TestEventArchive(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.archive = EventArchive(os.path.join(self.tmp.name, "archive"))
+        self.start = to_ns(datetime(2025, 1, 31, 20, 0))
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def events(self, count):
+        return [
+            Event(self.start + i * HOUR, EventType.APP_SWITCH if i % 2 else EventType.INACTIVITY,
+                  window=f"Window {i % 3}", previous_window="VS Code" if i % 2 else None,
+                  duration=float(i), extra={"message": "idle"} if not i % 2 else None)
+            for i in range(count)
+        ]
+
+    def test_round_trip_across_segments(self):
+        """Events come back identical, split into monthly segments"""
+        events = self.events(10)
+        with self.archive.writer() as add:
+            for event in events:
+                add(event)
+        self.assertEqual(list(self.archive.iter_range()), events)
+        self.assertEqual(sorted(self.archive.index()), ["events-2025-01", "events-2025-02"])
+
+    def test_range_read(self):
+        """Range reads return only [since, until)"""
+        events = self.events(10)
+        with self.archive.writer() as add:
+            for event in events:
+                add(event)
+        got = list(self.archive.iter_range(events[3].ts_ns, events[7].ts_ns))
+        self.assertEqual(got, events[3:7])
+
+    def test_compact_and_keeps_equal_timestamps(self):
+        """Records are fixed-width; events sharing a timestamp are all kept"""
+        events = self.events(4)
+        same = [events[0], events[1]._replace(ts_ns=events[0].ts_ns), events[2]]
+        with self.archive.writer() as add:
+            for event in same:
+                add(event)
+        with self.archive.writer() as add:
+            add(events[3])
+        self.assertEqual(list(self.archive.iter_range()), same + events[3:])
+        segment = self.archive.segment("events-2025-01")
+        self.assertEqual(segment.count(), 4)
+        self.assertEqual(os.path.getsize(segment.path), 16 + segment.count() * RECORD.size)
+
+    def test_pipeline_archives_and_report_reads_both(self):
+        """Events aging out of the log move to the archive and stay visible to FocusReport"""
+        cwd = os.getcwd()
+        os.chdir(self.tmp.name)
+        try:
+            os.makedirs("logs")
+            log_file = "logs/distraction_log.jsonl"
+            now = datetime(2025, 6, 30, 12, 0).timestamp()
+            with open(log_file, "w") as f:
+                for ts in (now - 40 * 86400, now - 35 * 86400, now):
+                    event = Event(int(ts * NS_PER_SECOND), EventType.DISTRACTION, window="YouTube")
+                    f.write(json.dumps(event.to_record()) + "\n")
+            db = Database("test.db")
+            result = RollupPipeline(db, log_file=log_file, clock=lambda: now).run()
+            db.close()
+            self.assertEqual(result["raw_events"], 2)
+            with open(log_file) as f:
+                self.assertEqual(len(f.readlines()), 1)
+
+            self.assertEqual(FocusReport(log_file).event_count(), 3)
+            recent = FocusReport(log_file, since=datetime(2025, 6, 1))
+            self.assertEqual(recent.event_count(), 1)
+        finally:
+            os.chdir(cwd)
+
+
+class TestArchivePipeline(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.cwd = os.getcwd()
+        os.chdir(self.tmp.name)
+        os.makedirs("logs")
+        self.log_file = "logs/distraction_log.jsonl"
+        self.now = datetime(2025, 6, 30, 12, 0).timestamp()
+        self.db = Database("test.db")
+
+    def tearDown(self):
+        self.db.close()
+        os.chdir(self.cwd)
+        self.tmp.cleanup()
+
+    def write_log(self, seconds):
+        with open(self.log_file, "w") as f:
+            for ts in seconds:
+                event = Event(int(ts * NS_PER_SECOND), EventType.APP_SWITCH, window="YouTube")
+                f.write(json.dumps(event.to_record()) + "\n")
+
+    def test_equal_timestamps_are_archived(self):
+        """Events logged by the same poll share a second and are all moved"""
+        old = int(self.now) - 40 * 86400
+        self.write_log([old, old, old + 1, self.now])
+        result = RollupPipeline(self.db, log_file=self.log_file, clock=lambda: self.now).run()
+        self.assertEqual(result["raw_events"], 3)
+        self.assertEqual(len(list(EventArchive("logs/archive").iter_range())), 3)
+        self.assertEqual(FocusReport(self.log_file).event_count(), 4)
+
+    def test_interrupted_move_resumes_without_duplicates(self):
+        """A crash after the archive write but before the log replace is resumed exactly"""
+        old = int(self.now) - 40 * 86400
+        self.write_log([old, old, old + 1, self.now])
+        pipeline = RollupPipeline(self.db, log_file=self.log_file, clock=lambda: self.now)
+        pipeline.ingest()
+
+        real_replace = os.replace
+
+        def crash(src, dst):
+            if os.path.abspath(dst) == os.path.abspath(self.log_file):
+                raise OSError("power cut")
+            real_replace(src, dst)
+
+        os.replace = crash
+        try:
+            with self.assertRaises(OSError):
+                pipeline.apply_retention()
+        finally:
+            os.replace = real_replace
+        # Archive holds the events, the log still has them too
+        self.assertEqual(FocusReport(self.log_file).event_count(), 4)
+
+        self.assertEqual(pipeline.apply_retention()["raw_events"], 3)
+        self.assertEqual(len(list(EventArchive("logs/archive").iter_range())), 3)
+        self.assertEqual(FocusReport(self.log_file).event_count(), 4)
+        with open(self.log_file) as f:
+            self.assertEqual(len(f.readlines()), 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
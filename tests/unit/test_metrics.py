@@ -0,0 +1,79 @@
+#!/usr/bin/env python3
+"""
+Test suite for the in-process metrics registry
+"""
+
+import json
+import os
+import sys
+import tempfile
+import unittest
+
+# Add project root to path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))
+
+from core.utils import metrics
+from core.utils.database import Database
+
+
+class TestMetrics(unittest.TestCase):
+    def setUp(self):
+        self.was_enabled = metrics.registry.enabled
+        metrics.registry.reset()
+        metrics.registry.enable()
+
+    def tearDown(self):
+        metrics.registry.enabled = self.was_enabled
+        metrics.registry.reset()
+
+    def test_disabled_records_nothing(self):
+        """Helpers are no-ops while the registry is disabled"""
+        metrics.registry.disable()
+        metrics.inc("calls")
+        metrics.set_gauge("size", 3)
+        with metrics.timer("block"):
+            pass
+        snapshot = metrics.registry.snapshot()
+        self.assertEqual((snapshot["counters"], snapshot["gauges"], snapshot["histograms"]), ({}, {}, {}))
+
+    def test_timed_records_latency(self):
+        """Decorated calls land in a histogram"""
+        @metrics.timed("work")
+        def work(x):
+            return x * 2
+
+        self.assertEqual(work(2), 4)
+        work(3)
+        summary = metrics.registry.snapshot()["histograms"]["work"]
+        self.assertEqual(summary["count"], 2)
+        self.assertLessEqual(summary["p50"], summary["max"])
+
+    def test_histogram_percentiles(self):
+        """Percentiles come from bucket bounds and never exceed the max"""
+        for _ in range(99):
+            metrics.registry.observe("latency", 0.001)
+        metrics.registry.observe("latency", 1.0)
+        summary = metrics.registry.snapshot()["histograms"]["latency"]
+        self.assertLess(summary["p50"], 0.0025)
+        self.assertEqual(summary["max"], 1.0)
+
+    def test_database_queries_are_timed(self):
+        """Database hot paths report into the registry"""
+        with tempfile.TemporaryDirectory() as tmp:
+            db = Database(os.path.join(tmp, "test.db"))
+            db.get_session_stats()
+            db.close()
+        self.assertEqual(metrics.registry.snapshot()["histograms"]["db.get_session_stats"]["count"], 1)
+
+    def test_exporter_writes_snapshot(self):
+        """The exporter writes a JSON snapshot on stop"""
+        metrics.inc("calls", 2)
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "logs", "metrics.json")
+            metrics.MetricsExporter(path=path, interval=60).start().stop()
+            with open(path) as f:
+                self.assertEqual(json.load(f)["counters"]["calls"], 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+"""
+Test suite for the distraction event rollup pipeline
+"""
+
+import json
+import os
+import sys
+import tempfile
+import unittest
+from datetime import datetime
+
+# Add project root to path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))
+
+from core.analytics.rollups import RollupPipeline
+from core.trackers.distraction_logger import iter_history
+from core.trackers.dwell import bucket_start
+from core.trackers.events import Event, EventType, NS_PER_SECOND
+from core.utils.database import Database
+
+DAY = 24 * 60 * 60
+
+
+class TestRollupPipeline(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.log = os.path.join(self.tmp.name, "distraction_log.jsonl")
+        self.db = Database(os.path.join(self.tmp.name, "test.db"))
+        self.now = datetime(2025, 6, 30, 12, 0).timestamp()
+
+    def tearDown(self):
+        self.db.close()
+        self.tmp.cleanup()
+
+    def append(self, ts, event_type, **fields):
+        event = Event(int(ts * NS_PER_SECOND), event_type, **fields)
+        with open(self.log, "a") as f:
+            f.write(json.dumps(event.to_record()) + "\n")
+
+    def pipeline(self, **kwargs):
+        return RollupPipeline(self.db, log_file=self.log, clock=lambda: self.now, **kwargs)
+
+    def test_counts_per_granularity(self):
+        """Events land in minute, hour and day buckets"""
+        for i in range(3):
+            self.append(self.now + i * 30, EventType.DISTRACTION, window="YouTube")
+        self.append(self.now, EventType.INACTIVITY)
+        self.assertEqual(self.pipeline().ingest(), 4)
+        day = bucket_start(self.now, "day")
+        self.assertEqual(self.db.get_event_counts("day", day),
+                         [(day, "Distraction", 3), (day, "Inactivity", 1)])
+        self.assertEqual(len(self.db.get_event_counts("minute", day)), 3)
+        self.assertEqual(self.db.get_dwell("day", day), [(day, "Inactive", "idle", 5.0)])
+
+    def test_ingest_is_incremental(self):
+        """A second run only reads events appended since the first"""
+        self.append(self.now, EventType.DISTRACTION, window="YouTube")
+        self.pipeline().ingest()
+        self.append(self.now + 1, EventType.DISTRACTION, window="YouTube")
+        self.assertEqual(self.pipeline().ingest(), 1)
+        day = bucket_start(self.now, "day")
+        self.assertEqual(self.db.get_event_counts("day", day), [(day, "Distraction", 2)])
+
+    def test_partial_line_waits(self):
+        """A half-written final line is not consumed"""
+        self.append(self.now, EventType.DISTRACTION, window="YouTube")
+        with open(self.log, "a") as f:
+            f.write('{"ts_ns": 1')
+        self.assertEqual(self.pipeline().ingest(), 1)
+        self.assertEqual(self.pipeline().ingest(), 0)
+
+    def test_retention(self):
+        """Old raw events and fine buckets age out; day buckets stay"""
+        old = self.now - 40 * DAY
+        self.append(old, EventType.DISTRACTION, window="YouTube")
+        self.append(self.now, EventType.DISTRACTION, window="Reddit")
+        result = self.pipeline().run()
+        self.assertEqual(result["raw_events"], 1)
+        self.assertEqual([e.window for e in iter_history(self.log)], ["Reddit"])
+        self.assertEqual(self.db.get_event_counts("minute", 0), [(bucket_start(self.now, "minute"), "Distraction", 1)])
+        self.assertEqual(len(self.db.get_event_counts("day", 0)), 2)
+
+        # Offsets survive the rewrite: nothing is ingested twice
+        self.append(self.now + 60, EventType.DISTRACTION, window="Reddit")
+        self.assertEqual(self.pipeline().ingest(), 1)
+
+    def test_backfill_dwell(self):
+        """App Switch durations can be backfilled into dwell by previous window"""
+        self.append(self.now, EventType.APP_SWITCH, window="YouTube", previous_window="VS Code", duration=120.0)
+        self.pipeline(backfill_dwell=True).ingest()
+        history = self.pipeline().daily_history(days=1)
+        self.assertEqual(history[0]["dwell"], {"work": 120.0})
+        self.assertEqual(history[0]["counts"], {"App Switch": 1})
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+"""
+Test suite for the shutdown coordinator and the deferred final report
+"""
+
+import os
+import sys
+import tempfile
+import threading
+import time
+import unittest
+
+# Add project root to path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))
+
+from core.analytics import focus_report
+from core.utils.shutdown import ShutdownCoordinator
+
+
+class Worker:
+    """Finishes *delay* seconds after being signalled."""
+
+    def __init__(self, delay):
+        self.delay = delay
+        self.done = threading.Event()
+        self.signalled_at = None
+
+    def signal(self):
+        self.signalled_at = time.monotonic()
+        timer = threading.Timer(self.delay, self.done.set)
+        timer.daemon = True
+        timer.start()
+
+    def wait(self, timeout):
+        return self.done.wait(timeout)
+
+
+class TestShutdownCoordinator(unittest.TestCase):
+    def test_workers_stop_in_parallel(self):
+        """All workers are signalled before any is waited for"""
+        coordinator = ShutdownCoordinator(timeout=2)
+        workers = [Worker(0.2) for _ in range(3)]
+        for i, worker in enumerate(workers):
+            coordinator.add_worker(f"w{i}", worker.signal, worker.wait)
+        result = coordinator.shutdown()
+        self.assertLess(result["seconds"], 0.5)
+        self.assertEqual(result["stalled"], [])
+        self.assertLess(max(w.signalled_at for w in workers) - min(w.signalled_at for w in workers), 0.1)
+
+    def test_timeout_is_shared_and_bounded(self):
+        """A stuck worker costs at most the timeout, and final steps still run"""
+        coordinator = ShutdownCoordinator(timeout=0.2)
+        stuck, fine = Worker(10), Worker(0)
+        coordinator.add_worker("stuck", stuck.signal, stuck.wait)
+        coordinator.add_worker("fine", fine.signal, fine.wait)
+        ran = []
+        coordinator.add_final_step("report", lambda: ran.append("report"))
+        result = coordinator.shutdown()
+        self.assertLess(result["seconds"], 0.5)
+        self.assertEqual(result["stalled"], ["stuck"])
+        self.assertEqual(ran, ["report"])
+        self.assertIn("report", result["steps"])
+
+    def test_runs_once(self):
+        """A second shutdown() returns the first result without repeating steps"""
+        coordinator = ShutdownCoordinator()
+        calls = []
+        coordinator.add_worker("tracker", lambda: calls.append("signal"))
+        coordinator.add_final_step("report", lambda: calls.append("report"))
+        first = coordinator.shutdown()
+        self.assertIs(coordinator.shutdown(), first)
+        self.assertEqual(calls, ["signal", "report"])
+
+    def test_failing_step_does_not_stop_the_rest(self):
+        """Exceptions are reported and later steps still run"""
+        coordinator = ShutdownCoordinator()
+        ran = []
+        coordinator.add_worker("broken", lambda: 1 / 0)
+        coordinator.add_final_step("broken report", lambda: 1 / 0)
+        coordinator.add_final_step("metrics", lambda: ran.append("metrics"))
+        coordinator.shutdown()
+        self.assertEqual(ran, ["metrics"])
+
+
+class TestDeferredReport(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.cwd = os.getcwd()
+        os.chdir(self.tmp.name)
+        os.makedirs("logs")
+
+    def tearDown(self):
+        os.chdir(self.cwd)
+        self.tmp.cleanup()
+
+    def test_deferred_report_is_written_next_startup(self):
+        """Deferring only leaves a marker; the next startup writes the report and clears it"""
+        self.assertIsNone(focus_report.write_final_report(defer=True))
+        self.assertFalse(os.path.exists(focus_report.REPORT_FILE))
+        self.assertTrue(os.path.exists(focus_report.PENDING_FILE))
+
+        report = focus_report.generate_pending_report()
+        self.assertEqual(report["total_sessions"], 0)
+        self.assertTrue(os.path.exists(focus_report.REPORT_FILE))
+        self.assertFalse(os.path.exists(focus_report.PENDING_FILE))
+        self.assertIsNone(focus_report.generate_pending_report())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+"""
+Test suite for the duration rules and the offline policy simulator
+"""
+
+import os
+import sys
+import tempfile
+import unittest
+
+import numpy as np
+
+# Add project root to path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))
+
+from core.engine import simulator
+from core.engine.rules import HOLD, Rules, adjust_durations, decode_action
+from core.utils.database import Database
+from core.utils.synthetic_data import SyntheticWorkload, write_sessions
+
+
+class TestRules(unittest.TestCase):
+    def test_decode_action(self):
+        """Actions 0-8 map to every (-5/0/+5, -5/0/+5) pair"""
+        work, brk = decode_action(np.arange(9))
+        self.assertEqual(list(work), [-5, -5, -5, 0, 0, 0, 5, 5, 5])
+        self.assertEqual(list(brk), [-5, 0, 5] * 3)
+
+    def test_adjust_durations(self):
+        """Distractions shorten work (capped) and lengthen breaks, both clipped"""
+        self.assertEqual(adjust_durations(25, 5, HOLD, 2), (21, 7))
+        self.assertEqual(adjust_durations(25, 5, HOLD, 20), (15, 25))
+        work, brk = adjust_durations(np.array([60, 15]), np.array([30, 5]), np.array([8, 0]))
+        self.assertEqual(list(work), [60, 15])
+        self.assertEqual(list(brk), [30, 5])
+        self.assertEqual(adjust_durations(25, 5, HOLD, 2, Rules(penalty_per_distraction=0)), (25, 7))
+
+
+class TestSimulator(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.tmp = tempfile.TemporaryDirectory()
+        db = Database(os.path.join(cls.tmp.name, "test.db"))
+        write_sessions(db, SyntheticWorkload(seed=7, days=60).sessions())
+        cls.history = simulator.load_history(db)
+        db.close()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.tmp.cleanup()
+
+    def test_outcome_model_fit(self):
+        """Longer and more distracted sessions are predicted to complete less often"""
+        model = simulator.OutcomeModel.fit(self.history)
+        p = model.completion_probability([15, 60, 25, 25], [0, 0, 0, 20])
+        self.assertGreater(p[0], p[1])
+        self.assertGreater(p[2], p[3])
+        # Close to the observed completion rate on the history it was fitted to
+        fitted = model.completion_probability(self.history.planned, self.history.distractions).mean()
+        self.assertAlmostEqual(fitted, self.history.completed.mean(), delta=0.02)
+
+    def test_needs_history(self):
+        """Fitting on too few sessions raises a clear error"""
+        empty = simulator.History(*(np.zeros(3) for _ in range(4)))
+        with self.assertRaises(ValueError):
+            simulator.OutcomeModel.fit(empty)
+
+    def test_simulate_is_seeded(self):
+        """The same seed reproduces the same result"""
+        first = simulator.simulate(simulator.hold_policy, self.history, days=500, seed=3)
+        self.assertEqual(first, simulator.simulate(simulator.hold_policy, self.history, days=500, seed=3))
+        self.assertEqual(first["sessions"], 3000)
+
+    def test_compare_policies(self):
+        """Shorter planned sessions complete more often but yield less focus time"""
+        results = simulator.compare({
+            "short": simulator.constant_policy(0),
+            "long": simulator.constant_policy(8),
+        }, self.history, days=2000)
+        short, long = results
+        self.assertEqual((short["policy"], long["policy"]), ("short", "long"))
+        self.assertLess(short["avg_work_minutes"], long["avg_work_minutes"])
+        self.assertGreater(short["completion_rate"], long["completion_rate"])
+
+    def test_model_policy(self):
+        """Anything with predict(obs, deterministic) can be evaluated"""
+        class Model:
+            def predict(self, obs, deterministic=True):
+                return np.full((len(obs), 1), HOLD), None
+
+        result = simulator.simulate(simulator.model_policy(Model()), self.history, days=100)
+        self.assertEqual(result, simulator.simulate(simulator.hold_policy, self.history, days=100))
+
+
+if __name__ == '__main__':
+    unittest.main()
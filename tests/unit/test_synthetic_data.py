@@ -0,0 +1,63 @@
+#!/usr/bin/env python3
+"""
+Test suite for the synthetic workload generator
+"""
+
+import os
+import sys
+import tempfile
+import unittest
+from itertools import islice
+
+# Add project root to path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))
+
+from core.trackers.distraction_logger import iter_history
+from core.trackers.events import EventType
+from core.utils.database import Database
+from core.utils.synthetic_data import SyntheticWorkload, generate, write_distraction_log
+
+
+class TestSyntheticWorkload(unittest.TestCase):
+    def test_same_seed_same_data(self):
+        """Workloads are reproducible from their seed"""
+        a = SyntheticWorkload(seed=3, days=14)
+        b = SyntheticWorkload(seed=3, days=14)
+        self.assertEqual(list(a.sessions()), list(b.sessions()))
+        self.assertEqual(list(islice(a.events(), 500)), list(islice(b.events(), 500)))
+        self.assertNotEqual(list(a.sessions()), list(SyntheticWorkload(seed=4, days=14).sessions()))
+
+    def test_weekends_are_quieter(self):
+        """Weekdays carry most of the sessions"""
+        workload = SyntheticWorkload(seed=1, days=28)
+        weekday = sum(1 for started, _, _ in workload.session_plan() if started.weekday() < 5)
+        weekend = sum(1 for started, _, _ in workload.session_plan() if started.weekday() >= 5)
+        self.assertGreater(weekday / 20, 2 * weekend / 8)
+
+    def test_events_match_logger_format(self):
+        """Events round-trip through the distraction log"""
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "logs", "distraction_log.jsonl")
+            written = write_distraction_log(path, islice(SyntheticWorkload(days=3).events(), 1000))
+            logs = list(iter_history(path))
+        self.assertEqual(written, len(logs))
+        self.assertEqual(logs[0].type, EventType.APP_SWITCH)
+        self.assertEqual(logs[:10], list(islice(SyntheticWorkload(days=3).events(), 10)))
+
+    def test_generate_fills_database(self):
+        """generate() writes sessions, tasks and a board into the schema"""
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "synthetic.db")
+            counts = generate(db_path=path, days=30, tasks=10, board_cards=40)
+            db = Database(path)
+            stats = db.get_session_stats()
+            self.assertEqual(stats["total_sessions"], counts["sessions"])
+            self.assertGreater(stats["total_sessions"], 60)
+            self.assertLess(stats["success_rate"], 100)
+            self.assertEqual(db.conn.execute("SELECT COUNT(*) FROM tasks").fetchone()[0], 10)
+            self.assertEqual(sum(len(cards) for cards in db.load_board_state().values()), 40)
+            db.close()
+
+
+if __name__ == '__main__':
+    unittest.main()
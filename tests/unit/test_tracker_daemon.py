@@ -0,0 +1,179 @@
+#!/usr/bin/env python3
+"""
+Test suite for the tracker daemon and its GUI-side proxy
+"""
+
+import importlib.util
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+import unittest
+
+# Add project root to path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core.trackers import daemon
+from core.trackers.distraction_logger import DistractionLogger
+from core.trackers.events import Event, EventType
+
+
+class FakeDetector:
+    """Tracks nothing; just enough of AdvancedDistractionDetector for the daemon."""
+
+    def __init__(self, log_file):
+        self.logger = DistractionLogger(log_file=log_file)
+        self.distraction_events = 0
+        self.monitoring = False
+        self.delay = 0.0
+
+    def start_monitoring(self):
+        self.monitoring = True
+
+    def stop_monitoring(self):
+        self.monitoring = False
+
+    def reset_distractions(self):
+        count, self.distraction_events = self.distraction_events, 0
+        return count
+
+    def get_distraction_count(self):
+        return self.distraction_events
+
+    def focus_seconds_today(self):
+        time.sleep(self.delay)
+        return 42.0
+
+    def detect_distraction_in_text(self, text):
+        raise ValueError("no classifier")
+
+
+@unittest.skipIf(sys.platform == "win32", "uses a Unix socket")
+class TestTrackerDaemon(unittest.TestCase):
+    def setUp(self):
+        # Short path: Unix socket addresses are limited to ~100 bytes
+        self.tmp = tempfile.mkdtemp(prefix="ff")
+        self.address = os.path.join(self.tmp, "t.sock")
+        self.key = os.path.join(self.tmp, "t.key")
+        self.detector = FakeDetector(os.path.join(self.tmp, "log.jsonl"))
+        self.daemon = daemon.TrackerDaemon(self.detector, self.address, self.key, run_rollups=False)
+        self.thread = threading.Thread(target=self.daemon.serve, daemon=True)
+        self.thread.start()
+        for _ in range(100):
+            if daemon.is_running(self.address, self.key):
+                break
+            time.sleep(0.02)
+
+    def tearDown(self):
+        self.daemon.stop()
+        self.thread.join(timeout=5)
+        shutil.rmtree(self.tmp)
+
+    def attach(self):
+        return daemon.RemoteDetector(daemon.TrackerClient(self.address, self.key, timeout=5), db=object())
+
+    def test_rpc(self):
+        """The proxy forwards calls to the daemon's detector and logger"""
+        self.detector.logger.log(Event.now(EventType.DISTRACTION, window="YouTube"))
+        self.detector.distraction_events = 3
+        remote = self.attach()
+        self.assertEqual(remote.logger.get_summary()["total_distractions"], 1)
+        self.assertEqual(remote.focus_seconds_today(), 42.0)
+        self.assertEqual(remote.reset_distractions(), 3)
+        remote.logger.clear()
+        self.assertEqual(self.detector.logger.get_summary()["total_distractions"], 0)
+        with self.assertRaises(RuntimeError):
+            remote.detect_distraction_in_text("cat videos")
+        remote.stop_monitoring()
+
+    def test_events_are_published(self):
+        """Subscribers receive each logged event"""
+        client = daemon.TrackerClient(self.address, self.key)
+        received = []
+        done = threading.Event()
+        client.subscribe(lambda event: (received.append(event), done.set()))
+        for _ in range(100):
+            if self.daemon.status()["subscribers"]:
+                break
+            time.sleep(0.02)
+        self.detector.logger.log(Event.now(EventType.APP_SWITCH, window="Reddit", previous_window="VS Code"))
+        self.assertTrue(done.wait(5))
+        self.assertEqual(received[0].window, "Reddit")
+        client.close()
+
+    def test_detach_keeps_tracking(self):
+        """A GUI detaching leaves the daemon tracking and open to new clients"""
+        self.attach().stop_monitoring()
+        self.assertTrue(self.detector.monitoring)
+        remote = self.attach()
+        self.assertTrue(remote.client.call("status")["monitoring"])
+        remote.stop_monitoring()
+
+    def test_late_reply_is_not_taken_by_next_call(self):
+        """After a timeout, the stale answer is discarded instead of answering the next call"""
+        remote = daemon.RemoteDetector(daemon.TrackerClient(self.address, self.key, timeout=0.2), db=object())
+        self.detector.distraction_events = 3
+        self.detector.delay = 0.5
+        with self.assertRaises(TimeoutError):
+            remote.focus_seconds_today()
+        self.detector.delay = 0.0
+        remote.client.timeout = 5
+        self.assertEqual(remote.get_distraction_count(), 3)
+        self.assertEqual(remote.focus_seconds_today(), 42.0)
+        remote.stop_monitoring()
+
+    def test_stuck_subscriber_does_not_block_logging(self):
+        """A GUI that stops reading is dropped once its queue fills; logging never waits on it"""
+        release = threading.Event()
+
+        class StuckConn:
+            def send(self, message):
+                release.wait(5)
+
+            def close(self):
+                release.set()
+
+        subscriber = daemon._Subscriber(StuckConn(), backlog=5)
+        self.daemon._subscribers.append(subscriber)
+        started = time.perf_counter()
+        for _ in range(20):
+            self.detector.logger.log(Event.now(EventType.APP_SWITCH, window="Reddit"))
+        self.assertLess(time.perf_counter() - started, 1.0)
+        self.assertNotIn(subscriber, self.daemon._subscribers)
+
+    def test_rejects_wrong_key(self):
+        """Clients without the auth key cannot connect"""
+        other = os.path.join(self.tmp, "other.key")
+        daemon.load_authkey(other, create=True)
+        self.assertFalse(daemon.is_running(self.address, other))
+
+
+class TestAttachedGuiImports(unittest.TestCase):
+    """An attached GUI must not load the local detector (pynput, transformers)."""
+
+    def imports_detector(self, module):
+        # A fresh interpreter, since this test process may have imported it already
+        code = f"import sys, {module}; print('core.trackers.advanced_distraction' in sys.modules)"
+        env = dict(os.environ, QT_QPA_PLATFORM="offscreen")
+        result = subprocess.run([sys.executable, "-c", code], cwd=PROJECT_ROOT, env=env,
+                                capture_output=True, text=True, timeout=60)
+        self.assertEqual(result.returncode, 0, result.stderr)
+        return result.stdout.strip() == "True"
+
+    def test_core_package(self):
+        """Importing core leaves the detector unloaded"""
+        self.assertFalse(self.imports_detector("core"))
+
+    @unittest.skipUnless(importlib.util.find_spec("PyQt5"), "PyQt5 not installed")
+    def test_main_window(self):
+        """Importing the main windows leaves the detector unloaded"""
+        self.assertFalse(self.imports_detector("gui.components.main_window"))
+        self.assertFalse(self.imports_detector("gui"))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,138 @@
+#!/usr/bin/env python3
+"""
+Test suite for the asyncio tracker runtime
+"""
+
+import os
+import sys
+import tempfile
+import threading
+import time
+import unittest
+
+# Add project root to path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))
+
+from core.trackers.app_catalog import AppCatalog
+from core.trackers.dwell import DwellAccumulator
+from core.trackers.runtime import TrackerRuntime
+from core.utils.database import Database
+
+
+class FakeDetector:
+    """The parts of AdvancedDistractionDetector the runtime drives, without input hooks."""
+
+    check_interval = 0.01
+    dwell_flush_interval = 0.05
+
+    def __init__(self, db_name):
+        self.db = Database(db_name)
+        self.dwell = DwellAccumulator(AppCatalog(["VS Code"], ["YouTube"]))
+        self.inactive = False
+        self.polls = 0
+        self.poll_threads = set()
+        self.poll_delay = 0.0
+        self.updates = []
+        self.flushed = []
+        self.classified = []
+
+    def is_inactive(self):
+        return self.inactive
+
+    def poll(self):
+        self.polls += 1
+        self.poll_threads.add(threading.current_thread().name)
+        time.sleep(self.poll_delay)
+        if self.polls == 3:
+            raise OSError("window manager went away")
+        self.dwell.switch("VS Code")
+
+    def flush_dwell(self, db):
+        self.flushed.append(threading.current_thread().name)
+
+    def notify(self, name, value):
+        self.updates.append((name, value))
+
+    def categorize_text(self, text):
+        if not text:
+            raise ValueError("empty")
+        time.sleep(0.05)
+        return "Productive Work"
+
+    def log_classification(self, text, category):
+        self.classified.append((text, category, threading.current_thread().name))
+
+
+class TestTrackerRuntime(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.detector = FakeDetector(os.path.join(self.tmp.name, "test.db"))
+        self.runtime = TrackerRuntime(self.detector, idle_interval=0.01).start()
+
+    def tearDown(self):
+        self.runtime.stop()
+        self.detector.db.close()
+        self.tmp.cleanup()
+
+    def wait_for(self, condition, timeout=2.0):
+        deadline = time.monotonic() + timeout
+        while not condition():
+            if time.monotonic() > deadline:
+                self.fail("condition not reached")
+            time.sleep(0.005)
+
+    def test_polls_survive_errors(self):
+        """Polling runs on the io worker and keeps going after a failed poll"""
+        self.wait_for(lambda: self.detector.polls > 5)
+        self.assertEqual(len(self.detector.poll_threads), 1)
+        self.assertTrue(next(iter(self.detector.poll_threads)).startswith("tracker-io"))
+
+    def test_inactivity_transitions(self):
+        """Inactivity changes are notified once per transition"""
+        self.detector.inactive = True
+        self.wait_for(lambda: ("inactive", True) in self.detector.updates)
+        time.sleep(0.05)
+        self.detector.inactive = False
+        self.wait_for(lambda: ("inactive", False) in self.detector.updates)
+        self.assertEqual([u for u in self.detector.updates if u[0] == "inactive"],
+                         [("inactive", True), ("inactive", False)])
+
+    def test_classify(self):
+        """Classification runs off the caller's thread and reports errors through the future"""
+        self.assertEqual(self.runtime.classify("writing tests").result(timeout=2), "Productive Work")
+        self.assertIn(("classified", ("writing tests", "Productive Work")), self.detector.updates)
+        # Computed on the model worker, but logged on the io worker with the polls
+        text, category, thread = self.detector.classified[0]
+        self.assertEqual((text, category), ("writing tests", "Productive Work"))
+        self.assertTrue(thread.startswith("tracker-io"))
+        with self.assertRaises(ValueError):
+            self.runtime.classify("").result(timeout=2)
+
+    def test_stop_is_prompt_and_flushes(self):
+        """stop() cancels the tasks, flushes dwell on the io worker and closes pending work"""
+        self.wait_for(lambda: self.detector.polls > 1)
+        pending = [self.runtime.classify("a") for _ in range(5)]
+        started = time.monotonic()
+        self.assertTrue(self.runtime.stop(timeout=2))
+        self.assertLess(time.monotonic() - started, 1.0)
+        self.assertIsNone(self.detector.dwell.window)
+        self.assertTrue(self.detector.flushed[-1].startswith("tracker-io"))
+        self.assertTrue(any(f.cancelled() for f in pending))
+        self.assertTrue(all(f.done() for f in pending))
+        self.assertFalse(self.runtime.running)
+
+    def test_timed_out_wait_still_flushes(self):
+        """A wait() that gives up on a slow poll leaves the io worker for the final flush"""
+        self.wait_for(lambda: self.detector.polls > 3)
+        self.detector.poll_delay = 0.3
+        polls = self.detector.polls
+        self.wait_for(lambda: self.detector.polls > polls)
+        self.assertFalse(self.runtime.stop(timeout=0.01))
+        self.runtime._thread.join(2)
+        self.assertFalse(self.runtime.running)
+        self.assertIsNone(self.detector.dwell.window)
+        self.assertTrue(self.detector.flushed[-1].startswith("tracker-io"))
+
+
+if __name__ == '__main__':
+    unittest.main()